@@ -0,0 +1,133 @@
+""" mdk_pointcache ベンチマーク
+
+* 同じメッシュで mdk_pointcache と Alembic の書き出し・読み込み速度を比較する
+* Alembicは alembic / imath / imathnumpy モジュール (PyAlembic) がある場合のみ
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * New
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+from mdkapps import mdk_pointcache
+
+try:
+    import imath
+    import imathnumpy
+    from alembic import Abc, AbcGeom
+except ImportError:
+    Abc = None
+
+
+def create_grid(size: int) -> tuple[np.ndarray, np.ndarray]:
+    """ size x size のグリッド (ポイント, フェイスの頂点番号) """
+    _x, _z = np.meshgrid(np.arange(size, dtype=np.float32), np.arange(size, dtype=np.float32))
+    _points = np.stack([_x.ravel(), np.zeros(size * size, dtype=np.float32), _z.ravel()], axis=1)
+
+    _index = np.arange(size * size).reshape(size, size)[:-1, :-1].ravel()
+    _faces = np.stack([_index, _index + 1, _index + size + 1, _index + size], axis=1)
+
+    return _points, _faces.astype(np.int32)
+
+
+def deform(points: np.ndarray, frame: int) -> np.ndarray:
+    _points = points.copy()
+    _points[:, 1] = np.sin(points[:, 0] * 0.1 + frame * 0.2) * np.cos(points[:, 2] * 0.1)
+
+    return _points
+
+
+def benchmark_mdkpc(filepath: str, points: np.ndarray, frames: int) -> tuple[float, float]:
+    _start = time.perf_counter()
+
+    with mdk_pointcache.PointCacheWriter(filepath, [('grid', len(points))], 1, frames) as _writer:
+        for _frame in range(1, frames + 1):
+            _writer.write_frame(deform(points, _frame))
+
+    _write = time.perf_counter() - _start
+
+    _start = time.perf_counter()
+
+    with mdk_pointcache.PointCache(filepath) as _cache:
+        _sum = sum(float(_cache.get_frame(_frame)[:, 1].sum()) for _frame in range(1, frames + 1))
+
+    _read = time.perf_counter() - _start
+
+    return _write, _read
+
+
+def benchmark_abc(filepath: str, points: np.ndarray, faces: np.ndarray, frames: int) -> tuple[float, float]:
+    _start = time.perf_counter()
+
+    _archive = Abc.OArchive(filepath)
+    _schema = AbcGeom.OPolyMesh(_archive.getTop(), 'grid').getSchema()
+
+    _indices = imath.IntArray(faces.size)
+    imathnumpy.arrayToNumpy(_indices)[:] = faces.ravel()
+    _counts = imath.IntArray(len(faces))
+    imathnumpy.arrayToNumpy(_counts)[:] = 4
+
+    for _frame in range(1, frames + 1):
+        _positions = imath.V3fArray(len(points))
+        imathnumpy.arrayToNumpy(_positions)[:] = deform(points, _frame)
+        _schema.set(AbcGeom.OPolyMeshSchemaSample(_positions, _indices, _counts))
+
+    del _schema, _archive
+    _write = time.perf_counter() - _start
+
+    _start = time.perf_counter()
+
+    _archive = Abc.IArchive(filepath)
+    _schema = AbcGeom.IPolyMesh(_archive.getTop(), 'grid').getSchema()
+
+    _sum = 0.0
+    for _index in range(frames):
+        _positions = _schema.getValue(Abc.ISampleSelector(_index)).getPositions()
+        _sum += float(imathnumpy.arrayToNumpy(_positions)[:, 1].sum())
+
+    _read = time.perf_counter() - _start
+
+    return _write, _read
+
+
+def main():
+    _parser = argparse.ArgumentParser()
+    _parser.add_argument('--size', type=int, default=300, help='グリッドの一辺のポイント数')
+    _parser.add_argument('--frames', type=int, default=100)
+    _args = _parser.parse_args()
+
+    _points, _faces = create_grid(_args.size)
+    _mb = _points.nbytes * _args.frames / 1024**2
+
+    print(f'MDK | points={len(_points)} frames={_args.frames} data={_mb:.1f} MB')
+
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _results = {'mdkpc': benchmark_mdkpc(os.path.join(_dirpath, 'grid.mdkpc'), _points, _args.frames)}
+
+        if Abc is not None:
+            _results['abc'] = benchmark_abc(os.path.join(_dirpath, 'grid.abc'), _points, _faces, _args.frames)
+        else:
+            print('MDK | alembic module is not found. skip Alembic')
+
+        for _name, (_write, _read) in _results.items():
+            print(
+                f'MDK | {_name:6} write {_write:.2f} sec ({_mb / _write:.0f} MB/s)'
+                f' | read {_read:.2f} sec ({_mb / _read:.0f} MB/s)'
+            )
+
+
+if __name__ == '__main__':
+    main()
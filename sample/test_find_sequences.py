@@ -0,0 +1,59 @@
+""" mdk_scene.find_sequences テスト
+
+* バージョン番号付きのファイルが連番にまとめられないことを確認する
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+import mdk_scene
+
+
+def test_versioned_files():
+    _files = [
+        '/shot/asset_v001.abc',
+        '/shot/asset_v002.abc',
+        '/shot/clip_v001.mov',
+        '/shot/clip_v002.mov',
+        '/shot/plate_v001.exr',
+        '/shot/plate_v002.exr',
+    ]
+
+    assert mdk_scene.find_sequences(_files) == sorted((_file, None, None) for _file in _files)
+
+
+def test_image_sequences():
+    _files = [
+        '/shot/plate_v001.1001.exr',
+        '/shot/plate_v001.1002.exr',
+        '/shot/plate_v001.1003.exr',
+        '/shot/matte_0001.png',
+        '/shot/matte_0002.png',
+        '/shot/cache.1001.abc',
+        '/shot/cache.1002.abc',
+        '/shot/single.1001.exr',
+    ]
+
+    assert mdk_scene.find_sequences(_files) == [
+        ('/shot/cache.1001.abc', None, None),
+        ('/shot/cache.1002.abc', None, None),
+        ('/shot/matte_####.png', 1, 2),
+        ('/shot/plate_v001.####.exr', 1001, 1003),
+        ('/shot/single.1001.exr', None, None),
+    ]
+
+
+if __name__ == '__main__':
+    test_versioned_files()
+    test_image_sequences()
+    print('MDK | OK')
@@ -0,0 +1,75 @@
+""" mdk_scene.read_header テスト
+
+* Windowsで保存した改行コード CRLF のファイルも読めることを確認する
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * New
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(__file__)+'/../src')
+
+import mdk_scene
+
+
+MA_TEXT = (
+    '//Maya ASCII 2024 scene\n'
+    'currentUnit -l centimeter -a degree -t film;\n'
+    'createNode script -n "sceneConfigurationScriptNode";\n'
+    '\tsetAttr ".b" -type "string" "playbackOptions -min 1001 -max 1100 -ast 1001 -aet 1100 ";\n'
+    'select -ne :defaultResolution;\n'
+    '\tsetAttr ".w" 1920;\n'
+    '\tsetAttr ".h" 1080;\n'
+    'select -ne :hardwareRenderGlobals;\n'
+)
+
+NK_TEXT = (
+    'Root {\n'
+    ' inputs 0\n'
+    ' first_frame 1001\n'
+    ' last_frame 1100\n'
+    ' fps 25\n'
+    ' format "1920 1080 0 0 1920 1080 1 HD_1080"\n'
+    '}\n'
+)
+
+
+def _read_header(text: str, ext: str, newline: str) -> dict:
+    with tempfile.TemporaryDirectory() as _dirpath:
+        _filepath = f'{_dirpath}/scene{ext}'
+
+        with open(_filepath, 'w', newline=newline) as f:
+            f.write(text)
+
+        return mdk_scene.read_header(_filepath)
+
+
+def test_ma_crlf():
+    for _newline in ('\n', '\r\n'):
+        _result = _read_header(MA_TEXT, '.ma', _newline)
+
+        assert _result['fps'] == 24
+        assert _result['frame_range'] == (1001, 1100)
+        assert _result['render_size'] == (1920, 1080)
+
+
+def test_nk_crlf():
+    for _newline in ('\n', '\r\n'):
+        _result = _read_header(NK_TEXT, '.nk', _newline)
+
+        assert _result['frame_range'] == (1001, 1100)
+        assert _result['render_size'] == (1920, 1080)
+
+
+if __name__ == '__main__':
+    test_ma_crlf()
+    test_nk_crlf()
+    print('MDK | OK')
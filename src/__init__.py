@@ -8,6 +8,11 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.3.0 2026-10-19 Tatsuya Yamagishi
+        * added: deps (mdk_deps)
+        * added: package() (mdk_package)
+        * added: farm (mdk_farm)
+
     * v0.2.0 2025-12-15 Tatsuya Yamagishi
         * improved: DCC自動判別ロジックを改善
 
@@ -16,7 +21,7 @@ Release Note:
             * 関数メインの構成に変更
 """
 
-VERSION = 'v0.2.0'
+VERSION = 'v0.3.0'
 NAME = 'mdk_apps'
 
 import os
@@ -83,6 +88,12 @@ except ImportError:
                         except ImportError:
                             print("Failed to import all libraries. Please check your environment.")
 
+
+""" Import DCC independent modules """
+from . import mdk_deps as deps
+from . import mdk_farm as farm
+from .mdk_package import package
+
 # """mdkapps
 
 # VFX 用 APP 互換 Python パッケージ
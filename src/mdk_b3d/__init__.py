@@ -8,6 +8,22 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.3 [v0.3.0] 2026-10-19 Tatsuya Yamagishi
+        * added: ローカルキャッシュ対応 (mdk_cache)
+        * added: batch()
+        * added: import_usd_files()
+        * added: ImportQueue
+        * added: import_usd(proxy=True), load_payloads()
+        * added: get_points(), set_points()
+        * added: get_points(frame=...), get_normals(), get_uvs()
+        * added: export_pointcache(), import_pointcache(), attach_pointcache(), release_pointcache() (mdk_pointcache)
+        * added: sample()
+        * added: set_keys()
+        * added: export_camera(), import_camera() (mdk_camera)
+        * changed: context_window は batch() 内ではオーバーライドを入れ直さない
+        * added: シーン設定のキャッシュ (get_filepath())。
+          load_post, save_post ハンドラーと save_file() でクリアする
+
     * v0.0.2 [v0.1.0] 2025-12-15 Tatsuya Yamagishi
         * added: get_frame_range()
 
@@ -15,9 +31,11 @@ Release Note:
         * added: path
 """
 
-VERSION = 'v0.0.2'
+VERSION = 'v0.0.3'
 NAME = 'mdk_b3d'
 
+import contextlib
+import functools
 import os
 import pathlib
 import platform
@@ -27,6 +45,13 @@ import sys
 
 
 import bpy
+import numpy as np
+
+from .. import mdk_cache
+from .. import mdk_camera
+from .. import mdk_pointcache
+from .. import mdk_queue
+from .. import mdk_scene
 
 
 if os.environ.get('MDK_DEBUG'):
@@ -60,6 +85,37 @@ EXT_DICT = {
 
 SCRIPT_EXTS = ['.py']
 
+_BATCH_DEPTH = 0
+_BATCH_UNDO = True
+_SETTINGS_CACHE = mdk_cache.SettingsCache()
+
+
+# ======================================= #
+# Handlers
+# ======================================= #
+@bpy.app.handlers.persistent
+def _clear_settings_cache(*args):
+    """ シーン設定のキャッシュをクリアするハンドラー
+
+    * depsgraph_update_post はスクリプトからプロパティを変えた直後には呼ばれないので、
+      fps とフレームレンジはキャッシュしない
+    """
+    _SETTINGS_CACHE.clear()
+
+
+_SETTINGS_HANDLERS = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.save_post,
+)
+
+# reload した場合は前のハンドラーを外す (以前の depsgraph_update_post も含む)
+for _handlers in (bpy.app.handlers.depsgraph_update_post, *_SETTINGS_HANDLERS):
+    for _handler in [_h for _h in _handlers if getattr(_h, '__name__', None) == '_clear_settings_cache']:
+        _handlers.remove(_handler)
+
+for _handlers in _SETTINGS_HANDLERS:
+    _handlers.append(_clear_settings_cache)
+
 
 # ======================================= #
 # Decorators
@@ -71,13 +127,64 @@ def context_window(func):
     Support running operators from QT (ex. on button click).
     Decorator to override the context window for a function,
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        # batch() 内ではすでにオーバーライドされている
+        if _BATCH_DEPTH:
+            return func(*args, **kwargs)
+
         with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
             return func(*args, **kwargs)
 
     return wrapper
 
 
+# ======================================= #
+# Context
+# ======================================= #
+@contextlib.contextmanager
+def batch(undo: bool = True):
+    """ 一括処理用のコンテキスト
+
+    * context_window のオーバーライドを一度だけ行い、中の関数はそのまま実行する
+    * 中のオペレーターはアンドゥを積まず、undo=True なら最後に1ステップだけ積む
+    * 入れ子の場合は一番外側だけが切り替える
+
+    Args:
+        undo (bool): 最後にアンドゥを1ステップ積むか
+
+    Examples:
+        >>> with mdkapps.batch():
+        ...     mdkapps.set_frame_range(1001, 1100)
+        ...     mdkapps.set_fps(24)
+    """
+    global _BATCH_DEPTH
+    global _BATCH_UNDO
+
+    _BATCH_DEPTH += 1
+
+    if _BATCH_DEPTH > 1:
+        try:
+            yield
+        finally:
+            _BATCH_DEPTH -= 1
+
+        return
+
+    _BATCH_UNDO = False
+
+    try:
+        with bpy.context.temp_override(window=bpy.context.window_manager.windows[0]):
+            yield
+
+            if undo:
+                bpy.ops.ed.undo_push(message='mdk batch')
+
+    finally:
+        _BATCH_UNDO = True
+        _BATCH_DEPTH -= 1
+
+
 # ======================================= #
 # Get
 # ======================================= #
@@ -88,6 +195,7 @@ def get_ext_list() -> list[str]:
     """ 拡張子リストを返す"""
     return list(EXT_LIST)
 
+@_SETTINGS_CACHE.cached
 def get_filepath() -> str:
     """現在開いているファイルパスを取得"""
     return bpy.context.blend_data.filepath
@@ -110,6 +218,48 @@ def get_frame_range() -> tuple[int, int]:
     end = bpy.context.scene.frame_end
     return (start, end)
 
+def get_normals(obj, frame: int = None, evaluated: bool = True) -> np.ndarray:
+    """ メッシュの頂点法線を取得 (オブジェクト座標)
+
+    Returns:
+        np.ndarray: [ポイント, 3] の float32
+    """
+    return _get_mesh_data(obj, _get_vertex_normals, frame=frame, evaluated=evaluated)
+
+
+def get_points(obj, frame: int = None, evaluated: bool = True) -> np.ndarray:
+    """ メッシュのポイント位置を取得 (オブジェクト座標)
+
+    * 確保済みの配列に foreach_get で一括取得する
+
+    Args:
+        obj (bpy.types.Object): メッシュオブジェクト
+        frame (int, optional): フレーム。Blenderは別の時間で評価できないので、
+            一時的にフレームを移動して元に戻す
+        evaluated (bool): モディファイア・シェイプキー適用後の位置を取得するか
+
+    Returns:
+        np.ndarray: [ポイント, 3] の float32
+    """
+    return _get_mesh_data(obj, _get_vertex_co, frame=frame, evaluated=evaluated)
+
+
+def get_uvs(obj, uv_layer: str = None) -> np.ndarray:
+    """ メッシュのUVを取得 (ループごと)
+
+    Args:
+        obj (bpy.types.Object): メッシュオブジェクト
+        uv_layer (str, optional): UVレイヤー名。省略時はアクティブ
+
+    Returns:
+        np.ndarray: [ループ, 2] の float32
+    """
+    _layer = obj.data.uv_layers[uv_layer] if uv_layer else obj.data.uv_layers.active
+    _uvs = np.empty(len(_layer.data) * 2, dtype=np.float32)
+    _layer.data.foreach_get('uv', _uvs)
+
+    return _uvs.reshape(-1, 2)
+
 def get_selected_nodes() -> list:
     """ 選択しているノードを取得
    
@@ -129,6 +279,25 @@ def get_script_exts() -> list[str]:
 # ======================================= #
 # Functions
 # ======================================= #
+def attach_pointcache(filepath: str, objects: list = None):
+    """ フレームが変わるたびにポイントキャッシュを読み込む
+
+    * frame_change_post ハンドラーを登録する
+
+    Returns:
+        callable: 登録したハンドラー。削除は bpy.app.handlers.frame_change_post.remove()
+    """
+    _objects = _get_pointcache_targets(objects)
+
+    def _handler(scene, *args):
+        import_pointcache(filepath, _objects, frame=scene.frame_current)
+
+    import_pointcache(filepath, _objects)
+    bpy.app.handlers.frame_change_post.append(_handler)
+
+    return _handler
+
+
 def create_playblast(filepath: str, size: list|tuple=None, range: list|tuple=None, filetype='jpg'):
     """ プレイブラストを作成
     
@@ -143,10 +312,163 @@ def create_playblast(filepath: str, size: list|tuple=None, range: list|tuple=Non
 
 
 
+def export_camera(obj, filepath: str, frame_range: tuple = None) -> str:
+    """ カメラをカメラファイル (mdk_camera) に書き出す
+
+    * カメラデータは sample() で取る
+    * 親とコンストレイントがなく回転が XYZ の場合は、ワールド行列も sample() の値から作るので
+      カレントフレームは変わらない。それ以外はフレームを進めて matrix_world を取り、最後に戻す
+
+    Args:
+        obj (bpy.types.Object): カメラオブジェクト
+        filepath (str): 出力ファイル (.npz)
+        frame_range (tuple, optional): (start, end)。省略時は get_frame_range()
+
+    Returns:
+        str: filepath
+    """
+    if obj.type != 'CAMERA':
+        raise ValueError(f'Not camera: {obj.name}')
+
+    if frame_range is None:
+        frame_range = get_frame_range()
+
+    _frames = np.arange(frame_range[0], frame_range[-1] + 1)
+    _frame_range = (_frames[0], _frames[-1])
+    _values = sample(
+        [obj],
+        ['data.lens', 'data.sensor_width', 'data.sensor_height', 'data.clip_start', 'data.clip_end'],
+        _frame_range,
+    )
+
+    if obj.parent is None and not obj.constraints and obj.rotation_mode == 'XYZ':
+        _transform = sample([obj], ['location', 'rotation_euler'], _frame_range)
+        _matrix = mdk_camera.compose(_transform[:, :3], np.degrees(_transform[:, 3:]))
+    else:
+        _scene = bpy.context.scene
+        _current_frame = _scene.frame_current
+        _matrix = []
+
+        try:
+            for _frame in _frames:
+                _scene.frame_set(int(_frame))
+                _matrix.append(np.array(obj.matrix_world).T)
+        finally:
+            _scene.frame_set(_current_frame)
+
+    return mdk_camera.write(
+        filepath,
+        _frames,
+        mdk_camera.convert_up_axis(_matrix, 'z', 'y'),
+        _values[:, 0],
+        _values[:, 1:3],
+        _values[:, 3:5],
+        name=obj.name,
+        fps=get_fps(),
+        meters_per_unit=bpy.context.scene.unit_settings.scale_length,
+        source=NAME,
+    )
+
+
+def export_pointcache(filepath: str, objects: list, start_frame: int, end_frame: int) -> str:
+    """ メッシュのポイント位置を mdk_pointcache 形式で書き出す
+
+    * オブジェクト名はBlenderのオブジェクト名
+    * フレームごとにメモリにためずに追記する
+
+    Returns:
+        str: filepath
+    """
+    _objects = _get_pointcache_targets(objects)
+
+    if not _objects:
+        raise ValueError('Select any meshes')
+
+    _scene = bpy.context.scene
+    _current_frame = _scene.frame_current
+    _items = [(_name, len(_obj.data.vertices)) for _name, _obj in _objects.items()]
+
+    try:
+        with mdk_pointcache.PointCacheWriter(filepath, _items, start_frame, end_frame) as _writer:
+            for _frame in range(int(start_frame), int(end_frame) + 1):
+                _scene.frame_set(_frame)
+                _writer.write_frame([get_points(_obj) for _obj in _objects.values()])
+
+    finally:
+        _scene.frame_set(_current_frame)
+
+    return filepath
+
+
+def import_camera(filepath: str, name: str = None):
+    """ カメラファイル (mdk_camera) からキー付きのカメラを作る
+
+    * キーは set_keys() でプロパティごとにまとめてセットする
+    * センサーサイズは最初のフレームの値
+
+    Returns:
+        bpy.types.Object: カメラオブジェクト
+    """
+    _data = mdk_camera.load(
+        filepath, up_axis='z', meters_per_unit=bpy.context.scene.unit_settings.scale_length)
+    _frames = _data['frames']
+    _name = name or _data['header']['name']
+
+    _camera = bpy.data.cameras.new(_name)
+    _camera.lens_unit = 'MILLIMETERS'
+    _camera.sensor_fit = 'HORIZONTAL'
+    _camera.sensor_width, _camera.sensor_height = _data['film_back'][0]
+
+    _obj = bpy.data.objects.new(_name, _camera)
+    _obj.rotation_mode = 'XYZ'
+    bpy.context.collection.objects.link(_obj)
+
+    _rotate = np.radians(_data['rotate'])
+
+    for _index in range(3):
+        set_keys(_obj, 'location', _frames, _data['translate'][:, _index], index=_index)
+        set_keys(_obj, 'rotation_euler', _frames, _rotate[:, _index], index=_index)
+
+    set_keys(_camera, 'lens', _frames, _data['focal_length'])
+    set_keys(_camera, 'clip_start', _frames, _data['clip'][:, 0])
+    set_keys(_camera, 'clip_end', _frames, _data['clip'][:, 1])
+
+    return _obj
+
+
+def import_pointcache(filepath: str, objects: list|dict = None, frame: int = None) -> list[str]:
+    """ ポイントキャッシュのフレームをメッシュに読み込む
+
+    * オブジェクト名が一致するメッシュのポイント位置をセットする
+    * ファイルはmemmapで開いたまま使い回す。ファイルが更新されていれば開き直す
+
+    Returns:
+        list[str]: 読み込んだオブジェクト名
+    """
+    _cache = mdk_pointcache.open_cache(filepath)
+    _objects = objects if isinstance(objects, dict) else _get_pointcache_targets(objects)
+
+    if frame is None:
+        frame = bpy.context.scene.frame_current
+
+    _result = []
+
+    for _name, _obj in _objects.items():
+        if _name in _cache.objects:
+            set_points(_obj, _cache.get_points(frame, _name))
+            _result.append(_name)
+
+    return _result
+
+
 @context_window
-def import_usd(filepath: str, scale: float = 0.01):
+def import_usd(filepath: str, scale: float = 0.01, proxy: bool = False, prim_path_mask: str = ''):
     """ USDファイルをインポート
 
+    * Blenderはpayloadをアンロードしたまま読めないので、proxy=True の場合は
+      proxy purpose のジオメトリだけを読み込む。必要な部分は load_payloads() で読み込む
+    * prim_path_mask はカンマ区切りで複数指定できる
+
     Reference from:
 
     * https://devtalk.blender.org/t/issue-with-importing-usd-files-via-bpy-ops-wm-usd-import-and-python/26152
@@ -177,11 +499,62 @@ def import_usd(filepath: str, scale: float = 0.01):
         set_material_blend=True)
     """
     # _override = get_override_context()
+    filepath = mdk_cache.cache_path(filepath)
 
     bpy.ops.wm.usd_import(
             # _override,
+            'EXEC_DEFAULT',
+            _BATCH_UNDO,
             filepath=filepath,
-            scale=scale,)
+            scale=scale,
+            import_proxy=True,
+            import_render=not proxy,
+            prim_path_mask=prim_path_mask,)
+
+
+def import_usd_files(filepath_list: list[str], scale: float = 0.01, undo: bool = True):
+    """ 複数のUSDファイルを1回のオーバーライドでインポート
+
+    * ローカルキャッシュは先にまとめて並列で取得する
+
+    Args:
+        filepath_list (list[str]): USDファイルリスト
+        scale (float): スケール
+        undo (bool): アンドゥを1ステップ積むか
+    """
+    _cache = mdk_cache.get_local_cache()
+
+    if _cache is not None:
+        try:
+            filepath_list = _cache.prefetch(filepath_list, deps=True)
+        except OSError as ex:
+            print(f'MDK | Local cache is skipped: {ex}')
+
+    with batch(undo=undo):
+        for _filepath in filepath_list:
+            import_usd(_filepath, scale=scale)
+
+
+def load_payloads(filepath: str, pattern: str = '*', scale: float = 0.01) -> list[str]:
+    """ payloadを持つプリムをパターンで指定して読み込む
+
+    * import_usd(proxy=True) で読み込んだUSDの一部をレンダー用ジオメトリで追加する
+
+    Args:
+        filepath (str): USDファイル
+        pattern (str): プリムパスのfnmatchパターン (例: '/city/block_01/*')
+        scale (float): スケール
+
+    Returns:
+        list[str]: 読み込んだプリムパス
+    """
+    filepath = mdk_cache.cache_path(filepath)
+    _paths = mdk_scene.find_payload_paths(filepath, pattern)
+
+    if _paths:
+        import_usd(filepath, scale=scale, prim_path_mask=','.join(_paths))
+
+    return _paths
 
 
 def open_dir(filepath):
@@ -206,6 +579,71 @@ def open_dir(filepath):
             subprocess.Popen(["xdg-open", _filepath])
 
 
+def release_pointcache(filepath: str = None):
+    """ 開いたままのポイントキャッシュを閉じる
+
+    Args:
+        filepath (str, optional): ポイントキャッシュ。省略時は全て閉じる
+    """
+    mdk_pointcache.release(filepath)
+
+
+def sample(objects: list, attrs: list[str], frame_range: tuple = None, step: float = 1.0) -> np.ndarray:
+    """ フレームレンジのプロパティ値をまとめて取得
+
+    * fcurve.evaluate() で評価するので、カレントフレームは変わらない
+      ドライバー、NLA、コンストレイントは評価しない
+    * アニメーションがないプロパティは現在の値で埋める
+    * 列は objects x attrs の順。location などの配列は要素に展開する
+
+    Args:
+        objects (list): オブジェクト
+        attrs (list[str]): データパス。'location', 'location[0]', 'data.lens' など
+        frame_range (tuple, optional): (start, end)。省略時は get_frame_range()
+        step (float): フレームの間隔
+
+    Returns:
+        np.ndarray: [フレーム, プロパティ] の float64
+    """
+    if frame_range is None:
+        frame_range = get_frame_range()
+
+    _frames = np.arange(frame_range[0], frame_range[-1] + step * 0.5, step)
+    _columns = []
+
+    for _obj in objects:
+        for _attr in attrs:
+            _id = _obj
+
+            if _attr.startswith('data.'):
+                _id = _obj.data
+                _attr = _attr[len('data.'):]
+
+            _match = re.match(r'(.+)\[(\d+)\]$', _attr)
+            _path, _index = (_match.group(1), int(_match.group(2))) if _match else (_attr, None)
+            _value = _id.path_resolve(_path)
+
+            if _index is not None:
+                _items = [(_index, _value[_index])]
+            elif hasattr(_value, '__len__'):
+                _items = list(enumerate(_value))
+            else:
+                _items = [(0, _value)]
+
+            for _array_index, _static in _items:
+                _fcurve = _find_fcurve(_id, _path, _array_index)
+
+                if _fcurve is None:
+                    _columns.append(np.full(len(_frames), _static, dtype=np.float64))
+                else:
+                    _columns.append(np.array([_fcurve.evaluate(_frame) for _frame in _frames], dtype=np.float64))
+
+    if not _columns:
+        return np.empty((len(_frames), 0), dtype=np.float64)
+
+    return np.stack(_columns, axis=1)
+
+
 @context_window
 def save_file(filepath, context=False):
     """ ファイルを保存
@@ -222,6 +660,8 @@ def save_file(filepath, context=False):
     else:
         bpy.ops.wm.save_as_mainfile(filepath=filepath)
 
+    _SETTINGS_CACHE.clear()
+
 
 
 @context_window
@@ -271,6 +711,53 @@ def set_render_frame_range(first: int, last: int):
     print('Blender render frame range is fixed to scene frame range')
 
 
+def set_keys(id_data, data_path: str, frames, values, index: int = 0):
+    """ Fカーブを作り、キーをまとめてセット
+
+    * 既存のキーは消し、keyframe_points.foreach_set() で1回でセットする。補間はリニア
+
+    Args:
+        id_data (bpy.types.ID): オブジェクトやカメラなど
+        data_path (str): データパス
+        frames (np.ndarray|list): フレーム
+        values (np.ndarray|list): 値
+        index (int): 配列のインデックス
+    """
+    _anim = id_data.animation_data_create()
+
+    if _anim.action is None:
+        _anim.action = bpy.data.actions.new(f'{id_data.name}Action')
+
+    # 4.4 以降はスロットごとのチャンネルバッグに作る
+    if hasattr(_anim.action, 'fcurve_ensure_for_datablock'):
+        _fcurve = _anim.action.fcurve_ensure_for_datablock(id_data, data_path, index=index)
+    else:
+        _fcurve = _find_fcurve(id_data, data_path, index) or _anim.action.fcurves.new(data_path, index=index)
+
+    _num_keys = len(frames)
+    _co = np.empty(_num_keys * 2, dtype=np.float32)
+    _co[0::2] = frames
+    _co[1::2] = values
+
+    _fcurve.keyframe_points.clear()
+    _fcurve.keyframe_points.add(_num_keys)
+    _fcurve.keyframe_points.foreach_set('co', _co)
+    # 1 = 'LINEAR'
+    _fcurve.keyframe_points.foreach_set('interpolation', np.ones(_num_keys, dtype=np.int32))
+    _fcurve.update()
+
+    return _fcurve
+
+
+def set_points(obj, points: np.ndarray):
+    """ メッシュのポイント位置を一括でセット (オブジェクト座標)
+
+    * foreach_set で一括セットする
+    """
+    obj.data.vertices.foreach_set('co', np.ascontiguousarray(points, dtype=np.float32).ravel())
+    obj.data.update()
+
+
 @context_window
 def set_render_size(width: int, height: int) -> None:
     """ レンダーサイズをセット 
@@ -292,9 +779,116 @@ def set_unit(value: str):
     print(f'MDK | unit = {value}')
 
 
+def _find_fcurve(id_data, data_path: str, index: int = 0):
+    """ データパスのFカーブを取得。なければ None """
+    _anim = id_data.animation_data
+
+    if _anim is None or _anim.action is None:
+        return None
+
+    # 4.4 以降はスロットごとのチャンネルバッグ
+    if hasattr(_anim, 'action_slot') and hasattr(_anim.action, 'layers'):
+        from bpy_extras import anim_utils
+
+        _channelbag = anim_utils.action_get_channelbag_for_slot(_anim.action, _anim.action_slot)
+        return _channelbag.fcurves.find(data_path, index=index) if _channelbag else None
+
+    return _anim.action.fcurves.find(data_path, index=index)
+
+
+def _get_pointcache_targets(objects: list = None) -> dict:
+    """ ポイントキャッシュの対象メッシュを取得
+
+    Returns:
+        dict: {オブジェクト名: bpy.types.Object}
+    """
+    if objects is None:
+        objects = bpy.context.selected_objects
+
+    return {_obj.name: _obj for _obj in objects if _obj.type == 'MESH'}
+
+
+def _get_mesh_data(obj, func, frame: int = None, evaluated: bool = True) -> np.ndarray:
+    """ 評価後のメッシュに func を適用する """
+    _scene = bpy.context.scene
+    _current_frame = _scene.frame_current
+
+    if frame is not None:
+        _scene.frame_set(int(frame))
+
+    try:
+        if not evaluated:
+            return func(obj.data)
+
+        _obj = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        _mesh = _obj.to_mesh()
+
+        try:
+            return func(_mesh)
+        finally:
+            _obj.to_mesh_clear()
+
+    finally:
+        if frame is not None:
+            _scene.frame_set(_current_frame)
+
+
+def _get_vertex_normals(mesh) -> np.ndarray:
+    _normals = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+
+    # 4.1 以降は vertex_normals
+    if hasattr(mesh, 'vertex_normals'):
+        mesh.vertex_normals.foreach_get('vector', _normals)
+    else:
+        mesh.vertices.foreach_get('normal', _normals)
+
+    return _normals.reshape(-1, 3)
+
+
+def _get_vertex_co(mesh) -> np.ndarray:
+    _co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', _co)
+
+    return _co.reshape(-1, 3)
+
+
 # ======================================= #
 # Class
 # ======================================= #
+class ImportQueue(mdk_queue.ImportQueue):
+    """ bpy.app.timers で少しずつ読み込むインポートキュー
+
+    * 1回の tick() は batch() でまとめる
+    """
+    def import_file(self, filepath: str):
+        if FILE_FILTER_USD.match(filepath):
+            return import_usd(filepath)
+
+        raise TypeError(f'MDK | Not supported file type: {filepath}')
+
+
+    def _start(self):
+        # バウンドメソッドは参照するたびに別のオブジェクトになるので、登録したものを保持する
+        self._timer = self._on_timer
+        bpy.app.timers.register(self._timer, first_interval=0.0)
+
+
+    def _stop(self):
+        if self._timer is not None and bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.unregister(self._timer)
+
+        self._timer = None
+
+
+    def _on_timer(self):
+        """ None を返すとタイマーが解除される """
+        return mdk_queue.DEFAULT_INTERVAL if self.tick() else None
+
+
+    def _tick_context(self):
+        return batch()
+
+
 # class AppMain:
 #     def __init__(self):
 #         pass
@@ -0,0 +1,723 @@
+""" mdk_cache
+
+* ネットワーク上のアセットをローカルSSDにキャッシュするPythonパッケージ
+* 環境変数 MDK_LOCAL_CACHE にフォルダを指定するか enable_local_cache() で有効化する
+* 書き出し結果のキャッシュ (ExportCache) は MDK_EXPORT_CACHE か enable_export_cache() で有効化する
+* シーン設定のキャッシュ (SettingsCache) は各DCCモジュールがイベントでクリアする
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: LocalCache
+        * added: cache_path()
+        * added: ExportCache
+        * added: SettingsCache
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_cache'
+
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+
+from .. import mdk_deps
+from .. import mdk_scene
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_cache package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+DEFAULT_MAX_SIZE = 100 * 1024**3    # 100GB
+MAX_WORKERS = 8
+TMP_EXT = '.mdktmp'
+
+VALIDATE_LIST = ['stat', 'hash']
+
+_EXPORT_CACHE = None
+_LOCAL_CACHE = None
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def cache_path(filepath: str) -> str:
+    """ ローカルキャッシュが有効ならキャッシュ後のパスを返す
+
+    * 無効な場合やファイルがない場合は filepath をそのまま返す
+    * DCCに渡したパスはシーンに保存されるので、パブリッシュ前に注意
+
+    Args:
+        filepath (str): ネットワーク上のファイルパス
+
+    Returns:
+        str: ファイルパス
+    """
+    _cache = get_local_cache()
+
+    if _cache is None:
+        return filepath
+
+    try:
+        return _cache.fetch(filepath)
+
+    except OSError as ex:
+        print(f'MDK | Local cache is skipped: {ex}')
+        return filepath
+
+
+def disable_export_cache():
+    """ 書き出しキャッシュを無効化 """
+    global _EXPORT_CACHE
+    _EXPORT_CACHE = None
+
+
+def disable_local_cache():
+    """ ローカルキャッシュを無効化 """
+    global _LOCAL_CACHE
+    _LOCAL_CACHE = None
+
+
+def enable_export_cache(cache_dir: str, max_size: int = DEFAULT_MAX_SIZE) -> 'ExportCache':
+    """ 書き出しキャッシュを有効化
+
+    Args:
+        cache_dir (str): キャッシュフォルダ
+        max_size (int): 最大サイズ(byte)
+
+    Returns:
+        ExportCache: キャッシュ
+    """
+    global _EXPORT_CACHE
+    _EXPORT_CACHE = ExportCache(cache_dir, max_size=max_size)
+
+    return _EXPORT_CACHE
+
+
+def enable_local_cache(cache_dir: str, max_size: int = DEFAULT_MAX_SIZE, validate: str = 'stat') -> 'LocalCache':
+    """ ローカルキャッシュを有効化
+
+    Args:
+        cache_dir (str): キャッシュフォルダ
+        max_size (int): 最大サイズ(byte)
+        validate (str): 'stat' (size, mtime) / 'hash' (sha1)
+
+    Returns:
+        LocalCache: キャッシュ
+    """
+    global _LOCAL_CACHE
+    _LOCAL_CACHE = LocalCache(cache_dir, max_size=max_size, validate=validate)
+
+    return _LOCAL_CACHE
+
+
+def get_export_cache() -> 'ExportCache':
+    """ 有効な書き出しキャッシュを取得
+
+    * 未設定で環境変数 MDK_EXPORT_CACHE があれば有効化する
+      (MDK_EXPORT_CACHE_SIZE はGB単位)
+
+    Returns:
+        ExportCache: キャッシュ。無効な場合は None
+    """
+    if _EXPORT_CACHE is None and os.environ.get('MDK_EXPORT_CACHE'):
+        _max_size = os.environ.get('MDK_EXPORT_CACHE_SIZE')
+        enable_export_cache(
+            os.environ['MDK_EXPORT_CACHE'],
+            max_size=int(float(_max_size) * 1024**3) if _max_size else DEFAULT_MAX_SIZE,
+        )
+
+    return _EXPORT_CACHE
+
+
+def get_local_cache() -> 'LocalCache':
+    """ 有効なローカルキャッシュを取得
+
+    * 未設定で環境変数 MDK_LOCAL_CACHE があれば有効化する
+      (MDK_LOCAL_CACHE_SIZE はGB単位)
+
+    Returns:
+        LocalCache: キャッシュ。無効な場合は None
+    """
+    if _LOCAL_CACHE is None and os.environ.get('MDK_LOCAL_CACHE'):
+        _max_size = os.environ.get('MDK_LOCAL_CACHE_SIZE')
+        enable_local_cache(
+            os.environ['MDK_LOCAL_CACHE'],
+            max_size=int(float(_max_size) * 1024**3) if _max_size else DEFAULT_MAX_SIZE,
+        )
+
+    return _LOCAL_CACHE
+
+
+def get_key(*values) -> str:
+    """ 値をJSONにしてsha1のキーを作る
+
+    * dict のキーは並べ替えるので順番に依存しない
+    * bytes と numpy の配列は中身のsha1にする (str() は大きな配列を省略するので使わない)
+    """
+    _hash = hashlib.sha1()
+    _hash.update(json.dumps(values, sort_keys=True, default=_get_json_value, ensure_ascii=False).encode('utf-8'))
+
+    return _hash.hexdigest()
+
+
+def get_file_hash(filepath: str, chunk_size: int = 1024**2) -> str:
+    """ ファイルのsha1を取得 """
+    _hash = hashlib.sha1()
+
+    with open(filepath, 'rb') as f:
+        for _chunk in iter(lambda: f.read(chunk_size), b''):
+            _hash.update(_chunk)
+
+    return _hash.hexdigest()
+
+
+def _get_file_key(filepath: str) -> tuple:
+    """ mdk_scene.get_file_key()。ファイルがなければ None """
+    try:
+        return mdk_scene.get_file_key(filepath)
+    except OSError:
+        return None
+
+
+def _get_json_value(value) -> str:
+    """ get_key() で JSON にできない値を文字列にする """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return hashlib.sha1(value).hexdigest()
+
+    if hasattr(value, 'tobytes') and hasattr(value, 'dtype'):
+        return f'{value.dtype}{value.shape}:{hashlib.sha1(value.tobytes()).hexdigest()}'
+
+    return str(value)
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class LocalCache:
+    """ サイズ上限付きLRUのリードスルーキャッシュ
+
+    * リモートのフォルダ構成をそのままキャッシュフォルダ以下にミラーするので、
+      USDなどの相対パス参照もキャッシュ内で解決できる
+    * コピーは一時ファイルに書いてからリネームするので、途中のファイルは読まれない
+    * LRUの順番はキャッシュファイルのatimeで管理する(セッションをまたいで有効)
+    * fetch() / prefetch() 中のファイルは削除しない (同じバッチや並列のフェッチを含む)
+    * validate='hash' の場合、元ファイルの (mtime_ns, size) が前回と同じなら読まない
+      セッションで初めての場合だけ元ファイルのハッシュを一度読む
+    * 依存ファイルのリストは、パースしたファイルと見つからなかったファイルの
+      (mtime_ns, size) が変わらなければ使い回す
+    """
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE, validate: str = 'stat'):
+        if validate not in VALIDATE_LIST:
+            raise ValueError(f'Invalid validate: {validate}')
+
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self.validate = validate
+
+        self._deps = {}     # {filepath: ([(依存ファイル, キー), ...], [依存ファイル, ...])}
+        self._deps_cache = mdk_deps.DepsCache()
+        self._hashes = {}   # {cache path: sha1} コピーしたときのハッシュ
+        self._index = {}    # {cache path: [size, atime]}
+        self._lock = threading.Lock()
+        self._pinned = collections.Counter()    # {cache path: フェッチ中の数}
+        self._sources = {}  # {cache path: (mtime_ns, size)} 検証済みの元ファイル
+        self._total_size = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.scan()
+
+
+    def evict(self, keep: str = None):
+        """ 最大サイズを超えた分を古い順に削除
+
+        * フェッチ中のファイルは削除しないので、一時的に最大サイズを超えることがある
+
+        Args:
+            keep (str, optional): 削除しないキャッシュパス
+        """
+        with self._lock:
+            if self._total_size <= self.max_size:
+                return
+
+            _entries = sorted(self._index.items(), key=lambda x: x[1][1])
+
+            for _path, (_size, _) in _entries:
+                if self._total_size <= self.max_size:
+                    break
+
+                if _path == keep or _path in self._pinned:
+                    continue
+
+                try:
+                    os.remove(_path)
+                except FileNotFoundError:
+                    pass
+
+                del self._index[_path]
+                self._hashes.pop(_path, None)
+                self._sources.pop(_path, None)
+                self._total_size -= _size
+
+
+    def fetch(self, filepath: str, deps: bool = True) -> str:
+        """ ファイルをキャッシュしてキャッシュパスを返す
+
+        * シーケンス表記のパスは実在する全ファイルをキャッシュする
+        * deps=True の場合は .ma / .nk / .usd の依存ファイルも一緒にキャッシュする
+
+        Args:
+            filepath (str): ネットワーク上のファイルパス
+            deps (bool): 依存ファイルもキャッシュするか
+
+        Returns:
+            str: キャッシュパス。元ファイルがなければ filepath
+        """
+        if self.is_cached_path(filepath):
+            return filepath
+
+        _files = self._get_files(filepath, deps)
+
+        if not _files:
+            return filepath
+
+        self.prefetch(_files, deps=False)
+
+        return self.get_cache_path(filepath)
+
+
+    def get_cache_path(self, filepath: str) -> str:
+        """ キャッシュ先のパスを取得
+
+        * C:/a/b.abc -> <cache_dir>/C/a/b.abc
+        * //server/share/b.abc -> <cache_dir>/server/share/b.abc
+        """
+        _filepath = os.path.abspath(filepath).replace('\\', '/')
+        _filepath = re.sub(r'^([A-Za-z]):', r'\1', _filepath).lstrip('/')
+
+        return f'{self.cache_dir}/{_filepath}'.replace('\\', '/')
+
+
+    def get_stats(self) -> dict:
+        """ キャッシュの状態を取得 """
+        with self._lock:
+            return {
+                'files': len(self._index),
+                'size': self._total_size,
+                'max_size': self.max_size,
+            }
+
+
+    def is_cached_path(self, filepath: str) -> bool:
+        """ キャッシュフォルダ内のパスか判定 """
+        _filepath = os.path.abspath(filepath).replace('\\', '/')
+        return _filepath.startswith(self.cache_dir.replace('\\', '/') + '/')
+
+
+    def is_valid(self, filepath: str, cache_path: str) -> bool:
+        """ キャッシュが元ファイルと同じか判定
+
+        * validate='hash' の場合、検証済みの元ファイルの (mtime_ns, size) があればそれと比べる
+          ない場合だけ元ファイルのハッシュを取る
+        """
+        try:
+            _src_stat = os.stat(filepath)
+            _dst_stat = os.stat(cache_path)
+        except FileNotFoundError:
+            return False
+
+        if _src_stat.st_size != _dst_stat.st_size:
+            return False
+
+        if self.validate == 'hash':
+            _source = (_src_stat.st_mtime_ns, _src_stat.st_size)
+
+            with self._lock:
+                _known = self._sources.get(cache_path)
+
+            if _known is not None:
+                return _known == _source
+
+            if get_file_hash(filepath) != self._get_hash(cache_path):
+                return False
+
+            with self._lock:
+                self._sources[cache_path] = _source
+
+            return True
+
+        # ネットワークドライブはmtimeの精度が低いことがあるので秒単位で比較
+        return int(_src_stat.st_mtime) == int(_dst_stat.st_mtime)
+
+
+    def prefetch(self, filepaths: list[str], max_workers: int = MAX_WORKERS, deps: bool = False) -> list[str]:
+        """ 複数ファイルを並列でキャッシュ
+
+        * 全ファイルが揃うまで、このバッチのファイルは evict() で削除されない
+
+        Returns:
+            list[str]: キャッシュパスのリスト
+        """
+        if deps:
+            _files = list(dict.fromkeys(
+                _file for _filepath in filepaths for _file in self._get_files(_filepath, True)))
+            self.prefetch(_files, max_workers=max_workers)
+
+            return [
+                _filepath if self.is_cached_path(_filepath) or not mdk_scene.expand_sequence(_filepath)
+                else self.get_cache_path(_filepath)
+                for _filepath in filepaths
+            ]
+
+        with self._pin([self.get_cache_path(_filepath) for _filepath in filepaths]):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as _executor:
+                return list(_executor.map(self._fetch_file, filepaths))
+
+
+    def scan(self):
+        """ キャッシュフォルダを走査してインデックスを作り直す """
+        _index = {}
+        _total_size = 0
+
+        for _dirpath, _, _filenames in os.walk(self.cache_dir):
+            for _filename in _filenames:
+                _path = f'{_dirpath}/{_filename}'.replace('\\', '/')
+
+                if _filename.endswith(TMP_EXT):
+                    continue
+
+                _stat = os.stat(_path)
+                _index[_path] = [_stat.st_size, _stat.st_atime]
+                _total_size += _stat.st_size
+
+        with self._lock:
+            self._hashes = {}
+            self._index = _index
+            self._sources = {}
+            self._total_size = _total_size
+
+
+    def _copy_file(self, src: str, dst: str) -> str:
+        """ コピーしながらsha1を取る (元ファイルを一度だけ読む)
+
+        Returns:
+            str: sha1
+        """
+        _hash = hashlib.sha1()
+
+        with open(src, 'rb') as _fsrc, open(dst, 'wb') as _fdst:
+            for _chunk in iter(lambda: _fsrc.read(1024**2), b''):
+                _hash.update(_chunk)
+                _fdst.write(_chunk)
+
+        shutil.copystat(src, dst)
+
+        return _hash.hexdigest()
+
+
+    def _fetch_file(self, filepath: str) -> str:
+        """ 1ファイルをキャッシュ
+
+        * validate='hash' の場合、元ファイルが変わっていればコピーしながら取ったハッシュと
+          キャッシュのハッシュを比べ、同じなら置き換えない
+        """
+        _cache_path = self.get_cache_path(filepath)
+
+        if self.is_valid(filepath, _cache_path):
+            self._touch(_cache_path)
+            return _cache_path
+
+        _src_stat = os.stat(filepath)
+        _source = (_src_stat.st_mtime_ns, _src_stat.st_size)
+
+        _dirpath = os.path.dirname(_cache_path)
+        os.makedirs(_dirpath, exist_ok=True)
+
+        _tmp = f'{_cache_path}.{os.getpid()}.{threading.get_ident()}{TMP_EXT}'
+
+        try:
+            _hash = self._copy_file(filepath, _tmp)
+
+            if self.validate == 'hash' and _hash == self._get_hash(_cache_path):
+                with self._lock:
+                    self._sources[_cache_path] = _source
+
+                self._touch(_cache_path)
+                return _cache_path
+
+            os.replace(_tmp, _cache_path)
+
+        finally:
+            if os.path.exists(_tmp):
+                os.remove(_tmp)
+
+        _size = os.path.getsize(_cache_path)
+
+        with self._lock:
+            _old = self._index.get(_cache_path)
+            if _old:
+                self._total_size -= _old[0]
+
+            self._hashes[_cache_path] = _hash
+            self._index[_cache_path] = [_size, time.time()]
+            self._sources[_cache_path] = _source
+            self._total_size += _size
+
+        self._touch(_cache_path)
+        self.evict(keep=_cache_path)
+
+        return _cache_path
+
+
+    def _get_files(self, filepath: str, deps: bool) -> list[str]:
+        """ filepath をキャッシュするときのファイルリスト (シーケンスと依存ファイルを展開)
+
+        * 依存ファイルは、前回のパースしたファイルと見つからなかったファイルのキーが
+          同じなら crawl() しない
+        """
+        _files = mdk_scene.expand_sequence(filepath)
+
+        if not (_files and deps and mdk_deps.is_parsable(filepath) and os.path.isfile(filepath)):
+            return list(dict.fromkeys(_files))
+
+        with self._lock:
+            _entry = self._deps.get(filepath)
+
+        if not _entry or any(_get_file_key(_path) != _key for _path, _key in _entry[0]):
+            _paths = []
+            _keys = []
+
+            for _path, _size in mdk_deps.crawl(filepath, cache=self._deps_cache):
+                _paths.append(_path)
+
+                if not _size or mdk_deps.is_parsable(_path):
+                    _keys.append((_path, _get_file_key(_path)))
+
+            _entry = (_keys, _paths)
+
+            with self._lock:
+                self._deps[filepath] = _entry
+
+        # シーケンスはフレームが増えることがあるので毎回展開する
+        for _path in _entry[1]:
+            _files.extend(mdk_scene.expand_sequence(_path))
+
+        return list(dict.fromkeys(_files))
+
+
+    def _get_hash(self, cache_path: str) -> str:
+        """ キャッシュのsha1。コピーしたときのハッシュがあればそれを使う """
+        with self._lock:
+            _hash = self._hashes.get(cache_path)
+
+        if _hash is None and os.path.isfile(cache_path):
+            _hash = get_file_hash(cache_path)
+
+            with self._lock:
+                self._hashes[cache_path] = _hash
+
+        return _hash
+
+
+    @contextlib.contextmanager
+    def _pin(self, cache_paths: list[str]):
+        """ with の中は cache_paths を evict() で削除しない """
+        with self._lock:
+            self._pinned.update(cache_paths)
+
+        try:
+            yield
+
+        finally:
+            with self._lock:
+                self._pinned.subtract(cache_paths)
+                self._pinned += collections.Counter()
+
+
+    def _touch(self, cache_path: str):
+        """ atimeを更新してLRUの順番を更新する
+
+        * mtimeは検証に使うので変更しない
+        """
+        _now = time.time()
+        _stat = os.stat(cache_path)
+        os.utime(cache_path, ns=(int(_now * 1e9), _stat.st_mtime_ns))
+
+        with self._lock:
+            if cache_path in self._index:
+                self._index[cache_path][1] = _now
+
+
+class ExportCache(LocalCache):
+    """ フィンガープリントをキーにした書き出し結果のキャッシュ
+
+    * キーが一致すれば書き出しをせず、保存済みのファイルをハードリンク(できなければコピー)する
+    * ハードリンクしたファイルに上書きで書き出すとキャッシュも変わるので、
+      書き出す前に release() でリンクを外す
+    * サイズ上限とLRUの削除は LocalCache と同じ
+    """
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE):
+        super().__init__(cache_dir, max_size=max_size)
+
+        self.hits = 0
+        self.misses = 0
+
+
+    def get(self, key: str, filepath: str) -> bool:
+        """ キャッシュがあれば filepath に置く
+
+        Args:
+            key (str): フィンガープリント
+            filepath (str): 書き出し先
+
+        Returns:
+            bool: キャッシュがあったか
+        """
+        _cache_path = self.get_artifact_path(key, filepath)
+
+        with self._lock:
+            _hit = _cache_path in self._index
+
+        if _hit and not os.path.isfile(_cache_path):
+            with self._lock:
+                self._total_size -= self._index.pop(_cache_path)[0]
+
+            _hit = False
+
+        if not _hit:
+            self.misses += 1
+            return False
+
+        self.release(filepath)
+        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+
+        try:
+            os.link(_cache_path, filepath)
+        except OSError:
+            shutil.copy2(_cache_path, filepath)
+
+        self._touch(_cache_path)
+        self.hits += 1
+
+        return True
+
+
+    def get_artifact_path(self, key: str, filepath: str) -> str:
+        """ キャッシュ内のパス: <cache_dir>/<key[:2]>/<key><拡張子> """
+        _ext = os.path.splitext(filepath)[1]
+        return f'{self.cache_dir}/{key[:2]}/{key}{_ext}'.replace('\\', '/')
+
+
+    def get_stats(self) -> dict:
+        """ キャッシュの状態を取得 (hits / misses を含む) """
+        _stats = super().get_stats()
+        _stats['hits'] = self.hits
+        _stats['misses'] = self.misses
+
+        return _stats
+
+
+    def put(self, key: str, filepath: str) -> str:
+        """ 書き出したファイルをキャッシュに保存
+
+        * filepath と別のファイルとしてコピーする
+
+        Returns:
+            str: キャッシュ内のパス
+        """
+        _cache_path = self.get_artifact_path(key, filepath)
+        _tmp = f'{_cache_path}.{os.getpid()}.{threading.get_ident()}{TMP_EXT}'
+
+        os.makedirs(os.path.dirname(_cache_path), exist_ok=True)
+
+        try:
+            shutil.copy2(filepath, _tmp)
+            os.replace(_tmp, _cache_path)
+
+        finally:
+            if os.path.exists(_tmp):
+                os.remove(_tmp)
+
+        _size = os.path.getsize(_cache_path)
+
+        with self._lock:
+            _old = self._index.get(_cache_path)
+            if _old:
+                self._total_size -= _old[0]
+
+            self._index[_cache_path] = [_size, time.time()]
+            self._total_size += _size
+
+        self.evict(keep=_cache_path)
+
+        return _cache_path
+
+
+    def release(self, filepath: str):
+        """ キャッシュとハードリンクしている書き出し先を削除する """
+        if os.path.isfile(filepath) and os.stat(filepath).st_nlink > 1:
+            os.remove(filepath)
+
+
+class SettingsCache:
+    """ シーン設定を返す関数のメモ化
+
+    * get_fps() などを cached() で包むと、clear() されるまで前回の値を返す
+    * clear() はDCCの変更イベント (コールバック) から呼ぶ
+    * 環境変数 MDK_SETTINGS_CACHE=0 で無効
+
+    Examples:
+        >>> _SETTINGS_CACHE = mdk_cache.SettingsCache()
+        >>> @_SETTINGS_CACHE.cached
+        ... def get_fps() -> float:
+        ...     ...
+    """
+    def __init__(self):
+        self.enabled = os.environ.get('MDK_SETTINGS_CACHE', '1') != '0'
+        self._values = {}
+
+
+    def cached(self, func):
+        """ 関数をメモ化するデコレーター。キーワード引数がある場合はキャッシュしない
+
+        * 元の関数は uncached で呼べる
+        """
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            if not self.enabled or kwargs:
+                return func(*args, **kwargs)
+
+            _key = (func.__name__, args)
+
+            if _key not in self._values:
+                self._values[_key] = func(*args)
+
+            return self._values[_key]
+
+        _wrapper.uncached = func
+
+        return _wrapper
+
+
+    def clear(self, *args):
+        """ キャッシュをクリア。コールバックの引数は無視する """
+        self._values.clear()
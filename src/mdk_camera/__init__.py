@@ -0,0 +1,222 @@
+""" mdk_camera
+
+* DCC間でカメラを受け渡すためのカメラファイル (.npz)
+* フレームごとのワールド行列、焦点距離、フィルムバック、クリップを配列で持つ
+
+Format:
+    * np.savez の .npz。各配列の先頭の次元がフレーム
+    * frames [F], matrix [F, 4, 4], focal_length [F], film_back [F, 2], clip [F, 2]
+    * matrix は Y-up、行ベクトル (Maya/Houdini と同じく4行目が移動)
+    * header はJSON文字列 (name, fps, meters_per_unit など)
+    * 焦点距離とフィルムバックは mm。移動とクリップはヘッダーの meters_per_unit の単位
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: load(), read(), write()
+        * added: compose(), decompose(), convert_up_axis()
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_camera'
+
+import json
+import os
+
+import numpy as np
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_camera package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+EXT = '.npz'
+KEYS = ('frames', 'matrix', 'focal_length', 'film_back', 'clip')
+TMP_EXT = '.mdktmp'
+
+# Y-up -> Z-up (X軸まわりに90度、行ベクトル)
+Y_TO_Z = np.array([
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0],
+    [0.0, -1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+])
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def compose(translate: np.ndarray, rotate: np.ndarray) -> np.ndarray:
+    """ 移動と回転から行列を作る
+
+    Args:
+        translate (np.ndarray): [F, 3]
+        rotate (np.ndarray): [F, 3] の回転 (度、XYZ順)
+
+    Returns:
+        np.ndarray: [F, 4, 4] の行列 (行ベクトル)
+    """
+    _x, _y, _z = np.radians(np.asarray(rotate, dtype=np.float64)).T
+    _cx, _sx = np.cos(_x), np.sin(_x)
+    _cy, _sy = np.cos(_y), np.sin(_y)
+    _cz, _sz = np.cos(_z), np.sin(_z)
+
+    _matrix = np.zeros((len(_x), 4, 4))
+
+    # 列ベクトルの Rz @ Ry @ Rx を転置したもの
+    _matrix[:, 0, 0] = _cy * _cz
+    _matrix[:, 0, 1] = _cy * _sz
+    _matrix[:, 0, 2] = -_sy
+    _matrix[:, 1, 0] = _sx * _sy * _cz - _cx * _sz
+    _matrix[:, 1, 1] = _sx * _sy * _sz + _cx * _cz
+    _matrix[:, 1, 2] = _sx * _cy
+    _matrix[:, 2, 0] = _cx * _sy * _cz + _sx * _sz
+    _matrix[:, 2, 1] = _cx * _sy * _sz - _sx * _cz
+    _matrix[:, 2, 2] = _cx * _cy
+    _matrix[:, 3, :3] = translate
+    _matrix[:, 3, 3] = 1.0
+
+    return _matrix
+
+
+def convert_up_axis(matrix: np.ndarray, from_axis: str = 'y', to_axis: str = 'z') -> np.ndarray:
+    """ 行列のアップ軸を変換する
+
+    Args:
+        matrix (np.ndarray): [F, 4, 4] の行列 (行ベクトル)
+        from_axis (str): 'y' または 'z'
+        to_axis (str): 'y' または 'z'
+    """
+    _matrix = np.asarray(matrix, dtype=np.float64)
+
+    if {from_axis, to_axis} - {'y', 'z'}:
+        raise ValueError(f'Invalid up axis: {from_axis} -> {to_axis}')
+
+    if from_axis == to_axis:
+        return _matrix
+
+    return _matrix @ (Y_TO_Z if to_axis == 'z' else Y_TO_Z.T)
+
+
+def decompose(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """ 行列を移動と回転に分解する (スケールは捨てる)
+
+    Args:
+        matrix (np.ndarray): [F, 4, 4] の行列 (行ベクトル)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (移動 [F, 3], 回転 [F, 3] (度、XYZ順))
+    """
+    _matrix = np.asarray(matrix, dtype=np.float64)
+    _rotation = _matrix[:, :3, :3] / np.linalg.norm(_matrix[:, :3, :3], axis=2, keepdims=True)
+
+    _x = np.arctan2(_rotation[:, 1, 2], _rotation[:, 2, 2])
+    _y = np.arcsin(np.clip(-_rotation[:, 0, 2], -1.0, 1.0))
+    _z = np.arctan2(_rotation[:, 0, 1], _rotation[:, 0, 0])
+
+    # オイラー角は前のフレームに近い値に揃える
+    _rotate = np.unwrap(np.stack([_x, _y, _z], axis=1), axis=0)
+
+    return _matrix[:, 3, :3].copy(), np.degrees(_rotate)
+
+
+def load(filepath: str, up_axis: str = 'y', meters_per_unit: float = 1.0) -> dict:
+    """ カメラファイルを読み込み、DCCの軸と単位に合わせて移動と回転に分解する
+
+    Args:
+        filepath (str): カメラファイル
+        up_axis (str): 読み込むDCCのアップ軸 ('y' または 'z')
+        meters_per_unit (float): 読み込むDCCの単位 (cm なら 0.01)
+
+    Returns:
+        dict: read() の結果に 'translate' [F, 3], 'rotate' [F, 3] (度、XYZ順) を足したもの
+    """
+    _data = read(filepath)
+    _scale = _data['header']['meters_per_unit'] / meters_per_unit
+
+    _data['matrix'] = convert_up_axis(_data['matrix'], 'y', up_axis)
+    _data['matrix'][:, 3, :3] *= _scale
+    _data['clip'] = _data['clip'] * _scale
+    _data['translate'], _data['rotate'] = decompose(_data['matrix'])
+
+    return _data
+
+
+def read(filepath: str) -> dict:
+    """ カメラファイルを読み込む
+
+    Returns:
+        dict: {'header': dict, 'frames', 'matrix', 'focal_length', 'film_back', 'clip'}
+    """
+    with np.load(filepath) as _data:
+        _result = {_key: _data[_key] for _key in KEYS}
+        _result['header'] = json.loads(str(_data['header']))
+
+    return _result
+
+
+def write(
+        filepath: str,
+        frames: np.ndarray,
+        matrix: np.ndarray,
+        focal_length: np.ndarray,
+        film_back: np.ndarray,
+        clip: np.ndarray,
+        name: str = 'camera',
+        fps: float = 24.0,
+        meters_per_unit: float = 1.0,
+        source: str = None,
+    ) -> str:
+    """ カメラファイルを書き出す
+
+    Args:
+        filepath (str): 出力ファイル
+        frames (np.ndarray): [F] のフレーム
+        matrix (np.ndarray): [F, 4, 4] のワールド行列 (Y-up、行ベクトル)
+        focal_length (np.ndarray): [F] の焦点距離 (mm)
+        film_back (np.ndarray): [F, 2] のフィルムバック (mm)
+        clip (np.ndarray): [F, 2] のクリップ (near, far)
+        name (str): カメラ名
+        fps (float): フレームレート
+        meters_per_unit (float): 移動とクリップの単位 (cm なら 0.01)
+        source (str, optional): 書き出したDCC
+
+    Returns:
+        str: filepath
+    """
+    _num_frames = len(frames)
+    _arrays = {
+        'frames': np.asarray(frames, dtype=np.float64),
+        'matrix': np.asarray(matrix, dtype=np.float64).reshape(_num_frames, 4, 4),
+        'focal_length': np.asarray(focal_length, dtype=np.float64).reshape(_num_frames),
+        'film_back': np.asarray(film_back, dtype=np.float64).reshape(_num_frames, 2),
+        'clip': np.asarray(clip, dtype=np.float64).reshape(_num_frames, 2),
+    }
+    _header = {
+        'name': name,
+        'version': VERSION,
+        'fps': float(fps),
+        'meters_per_unit': float(meters_per_unit),
+        'source': source,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+    _tmp = f'{filepath}.{os.getpid()}{TMP_EXT}'
+
+    # ファイルオブジェクトで渡すと np.savez が拡張子を足さない
+    with open(_tmp, 'wb') as f:
+        np.savez(f, header=json.dumps(_header), **_arrays)
+
+    os.replace(_tmp, filepath)
+
+    return filepath
@@ -0,0 +1,303 @@
+""" mdk_deps
+
+* シーンファイルの依存関係を再帰的に解決するPythonパッケージ
+* .ma / .nk / .usd(a) の subLayers / references / payload をたどる
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: crawl()
+        * added: crawl_graph()
+        * added: DepsCache
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_deps'
+
+import concurrent.futures
+import json
+import os
+import pathlib
+import threading
+
+from .. import mdk_scene
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_deps package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+DEFAULT_CACHE_PATH = os.environ.get(
+    'MDK_DEPS_CACHE',
+    str(pathlib.Path.home() / '.mdk' / 'deps_cache.json'),
+)
+
+MAX_WORKERS = 8
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def crawl(
+        root_scene: str,
+        max_workers: int = MAX_WORKERS,
+        cache: 'DepsCache' = None,
+        process: bool = False,
+    ) -> list[tuple[str, int]]:
+    """ シーンの依存ファイルを再帰的に解決してトポロジカル順で返す
+
+    * 依存先が先、root_scene が最後になる
+    * シーケンス表記のパスは実在するファイルの合計サイズを返す
+    * 見つからないファイルのサイズは None
+
+    Args:
+        root_scene (str): 起点のシーンファイル
+        max_workers (int): 並列でパースするファイル数
+        cache (DepsCache, optional): パース結果のキャッシュ。None の場合はデフォルトパスを使う
+        process (bool): True の場合はプロセスプールでパースする
+
+    Returns:
+        list[tuple[str, int]]: (ファイルパス, サイズ) のリスト
+    """
+    _graph = crawl_graph(root_scene, max_workers=max_workers, cache=cache, process=process)
+    _result = []
+
+    for _filepath in sort_graph(_graph, _normalize(root_scene)):
+        _result.append((_filepath, get_size(_filepath)))
+
+    return _result
+
+
+def crawl_graph(
+        root_scene: str,
+        max_workers: int = MAX_WORKERS,
+        cache: 'DepsCache' = None,
+        process: bool = False,
+    ) -> dict[str, list[str]]:
+    """ シーンの依存グラフを取得
+
+    * パース可能なファイル(.ma / .nk / .usd)は並列で読み込む
+    * パース結果はファイルのフィンガープリントをキーにキャッシュする
+    * 読めないファイル、壊れたファイルは依存なしとして続ける (キャッシュはしない)
+
+    Returns:
+        dict[str, list[str]]: {ファイルパス: [依存ファイルパス, ...]}
+    """
+    if cache is None:
+        cache = DepsCache()
+
+    _root = _normalize(root_scene)
+    if not os.path.exists(_root):
+        raise FileNotFoundError(f'File is not found. {_root}')
+
+    _graph = {}
+    _executor_class = concurrent.futures.ProcessPoolExecutor if process else concurrent.futures.ThreadPoolExecutor
+
+    with _executor_class(max_workers=max_workers) as _executor:
+        _futures = {}
+
+        def _submit(filepath):
+            if filepath in _graph:
+                return
+
+            _graph[filepath] = []
+
+            if not is_parsable(filepath) or not os.path.isfile(filepath):
+                return
+
+            _key = mdk_scene.get_file_key(filepath)
+            _cached = cache.get(_key)
+
+            if _cached is None:
+                _futures[_executor.submit(parse_file, filepath)] = (filepath, _key)
+            else:
+                _resolve(filepath, _cached)
+
+        def _resolve(filepath, references):
+            _children = [resolve_path(_ref, filepath) for _ref in references]
+            _graph[filepath] = _children
+
+            for _child in _children:
+                _submit(_child)
+
+        _submit(_root)
+
+        while _futures:
+            _done, _ = concurrent.futures.wait(_futures, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for _future in _done:
+                _filepath, _key = _futures.pop(_future)
+
+                try:
+                    _references = _future.result()
+
+                except (OSError, ValueError, RuntimeError) as ex:
+                    print(f'MDK | Deps | Failed to parse, skipped: {_filepath} {ex}')
+                    continue
+
+                cache.set(_key, _references)
+                _resolve(_filepath, _references)
+
+    cache.save()
+
+    return _graph
+
+
+def get_size(filepath: str) -> int:
+    """ ファイルサイズを取得
+
+    * シーケンス表記の場合は展開したファイルの合計
+
+    Returns:
+        int: バイト数。ファイルがなければ None
+    """
+    _files = mdk_scene.expand_sequence(filepath)
+    if not _files:
+        return None
+
+    return sum(os.path.getsize(_file) for _file in _files)
+
+
+def get_total_size(dependencies: list[tuple[str, int]]) -> int:
+    """ crawl() の結果の合計サイズを取得 """
+    return sum(_size for _, _size in dependencies if _size)
+
+
+def is_parsable(filepath: str) -> bool:
+    """ 依存関係をパースできるファイルか判定 """
+    return bool(mdk_scene.is_ma(filepath) or mdk_scene.is_nk(filepath) or mdk_scene.is_usd(filepath))
+
+
+def parse_file(filepath: str) -> list[str]:
+    """ ファイルの参照パスを取得
+
+    * プロセスプールから呼ぶのでモジュールレベルに置く
+
+    Returns:
+        list[str]: 参照パス(未解決)
+    """
+    return [_path for _, _path in mdk_scene.iter_references(filepath)]
+
+
+def resolve_path(value: str, parent: str) -> str:
+    """ 参照パスを絶対パスに解決
+
+    * 環境変数を展開し、相対パスは参照元ファイルのフォルダ基準で解決
+    """
+    _value = os.path.expandvars(os.path.expanduser(value))
+
+    if not os.path.isabs(_value):
+        _value = os.path.join(os.path.dirname(parent), _value)
+
+    return _normalize(_value)
+
+
+def sort_graph(graph: dict[str, list[str]], root: str) -> list[str]:
+    """ 依存グラフをトポロジカル順に並べる
+
+    * 循環参照は一度訪れたノードで打ち切る
+
+    Returns:
+        list[str]: 依存先が先になるファイルパスのリスト
+    """
+    _result = []
+    _visited = set()
+    _stack = [(root, iter(graph.get(root, [])))]
+    _visited.add(root)
+
+    while _stack:
+        _node, _children = _stack[-1]
+
+        for _child in _children:
+            if _child not in _visited:
+                _visited.add(_child)
+                _stack.append((_child, iter(graph.get(_child, []))))
+                break
+
+        else:
+            _stack.pop()
+            _result.append(_node)
+
+    return _result
+
+
+def _normalize(filepath: str) -> str:
+    return os.path.normpath(os.path.abspath(filepath)).replace('\\', '/')
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class DepsCache:
+    """ パース結果の永続キャッシュ
+
+    * キーは mdk_scene.get_file_key() の (path, mtime_ns, size)
+    * JSONファイルに保存し、保存時は一時ファイルからリネームする
+    """
+    def __init__(self, filepath: str = DEFAULT_CACHE_PATH):
+        self.filepath = filepath
+        self._data = {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+        self.load()
+
+
+    def get(self, key: tuple) -> list[str]:
+        _filepath, _mtime, _size = key
+
+        with self._lock:
+            _entry = self._data.get(_filepath)
+
+        if _entry and _entry['mtime'] == _mtime and _entry['size'] == _size:
+            return _entry['references']
+
+
+    def load(self):
+        if self.filepath and os.path.exists(self.filepath):
+            try:
+                with open(self.filepath, 'r', encoding='utf8') as f:
+                    self._data = json.load(f)
+
+            except (OSError, ValueError) as ex:
+                print(f'MDK | Deps cache is broken, ignored: {ex}')
+                self._data = {}
+
+
+    def save(self):
+        if not self.filepath or not self._changed:
+            return
+
+        with self._lock:
+            _dirpath = os.path.dirname(self.filepath)
+            if _dirpath and not os.path.exists(_dirpath):
+                os.makedirs(_dirpath, exist_ok=True)
+
+            _tmp = f'{self.filepath}.{os.getpid()}.tmp'
+            with open(_tmp, 'w', encoding='utf8') as f:
+                json.dump(self._data, f)
+
+            os.replace(_tmp, self.filepath)
+            self._changed = False
+
+
+    def set(self, key: tuple, references: list[str]):
+        _filepath, _mtime, _size = key
+
+        with self._lock:
+            self._data[_filepath] = {
+                'mtime': _mtime,
+                'size': _size,
+                'references': list(references),
+            }
+            self._changed = True
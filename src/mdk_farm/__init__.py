@@ -0,0 +1,401 @@
+""" mdk_farm
+
+* 書き出しをバックグラウンドの mayapy に分散するPythonパッケージ
+* USDはフレームをチャンクに分けて並列に書き出し、バリュークリップでまとめる
+  (チャンクの境目は1フレーム重ねる)
+* Alembicはアセットごとに並列に書き出す
+* チェックポイント(JSON)に完了したタスクを記録し、再実行時は失敗したタスクから再開する
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: export_usd_chunks()
+        * added: export_abc_assets()
+        * added: get_asset_names(), get_task_hash()
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_farm'
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import pathlib
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+try:
+    from pxr import Sdf, UsdUtils
+except ImportError:
+    Sdf = None
+    UsdUtils = None
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_farm package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+CHECKPOINT_EXT = '.mdkfarm.json'
+CHUNKS_DIRNAME = 'chunks'
+DEFAULT_CHUNK_SIZE = 50
+MAX_WORKERS = max(1, min(8, (os.cpu_count() or 2) // 2))
+TMP_EXT = '.mdktmp'
+
+WORKER_SCRIPT = str(pathlib.Path(__file__).with_name('worker.py'))
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def export_abc_assets(
+        scene: str,
+        dirpath: str,
+        nodes: list[str],
+        start_frame: int,
+        end_frame: int,
+        max_workers: int = MAX_WORKERS,
+        executable: str|list[str] = None,
+        resume: bool = True,
+    ) -> list[str]:
+    """ Alembicをアセット(ルートノード)ごとに並列で書き出す
+
+    * ファイル名はノード名。同じ名前のノードがある場合はフルパスから作る (get_asset_names())
+
+    Args:
+        scene (str): シーンファイル
+        dirpath (str): 出力フォルダ。<dirpath>/<ノード名>.abc に書き出す
+        nodes (list[str]): ルートノード
+        start_frame (int): 開始フレーム
+        end_frame (int): 終了フレーム
+        max_workers (int): 同時に起動するワーカー数
+        executable (str|list[str], optional): ワーカーの実行ファイル。省略時は get_executable()
+        resume (bool): チェックポイントがあれば完了済みのタスクを飛ばす
+
+    Returns:
+        list[str]: 書き出したファイルリスト
+    """
+    _tasks = []
+
+    for _node, _name in zip(nodes, get_asset_names(nodes)):
+        _tasks.append({
+            'id': _name,
+            'format': 'abc',
+            'nodes': [_node],
+            'start': int(start_frame),
+            'end': int(end_frame),
+            'output': os.path.join(dirpath, f'{_name}.abc'),
+        })
+
+    _checkpoint = os.path.join(dirpath, f'{pathlib.Path(scene).stem}{CHECKPOINT_EXT}')
+    run_tasks(scene, _tasks, _checkpoint, max_workers=max_workers, executable=executable, resume=resume)
+
+    return [_task['output'] for _task in _tasks]
+
+
+def export_usd_chunks(
+        scene: str,
+        filepath: str,
+        nodes: list[str],
+        start_frame: int,
+        end_frame: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = MAX_WORKERS,
+        executable: str|list[str] = None,
+        resume: bool = True,
+        overlap: int = 1,
+    ) -> str:
+    """ USDをフレームチャンクごとに並列で書き出し、バリュークリップでまとめる
+
+    * チャンクは <filepath の親>/chunks/<stem>.<start>_<end>.usd に書き出す
+    * filepath はクリップを参照するレイヤーになる (UsdUtils.StitchClips)
+    * チャンクは overlap フレーム重ねて書き出すので、境目のサブフレーム
+      (モーションブラーなど) も前のクリップ内で補間される
+
+    Args:
+        scene (str): シーンファイル
+        filepath (str): 出力するUSDファイル
+        nodes (list[str]): 書き出すノード
+        start_frame (int): 開始フレーム
+        end_frame (int): 終了フレーム
+        chunk_size (int): 1チャンクのフレーム数
+        max_workers (int): 同時に起動するワーカー数
+        executable (str|list[str], optional): ワーカーの実行ファイル。省略時は get_executable()
+        resume (bool): チェックポイントがあれば完了済みのタスクを飛ばす
+        overlap (int): チャンクを重ねるフレーム数。シャッターが1フレームより長い場合は増やす
+
+    Returns:
+        str: filepath
+    """
+    _path = pathlib.Path(filepath)
+    _chunk_dir = _path.parent / CHUNKS_DIRNAME
+    _tasks = []
+
+    for _start, _end in split_frame_range(start_frame, end_frame, chunk_size, overlap=overlap):
+        _tasks.append({
+            'id': f'{_start}_{_end}',
+            'format': 'usd',
+            'nodes': list(nodes),
+            'start': _start,
+            'end': _end,
+            'output': str(_chunk_dir / f'{_path.stem}.{_start}_{_end}{_path.suffix}'),
+        })
+
+    _checkpoint = str(_path.with_name(f'{_path.stem}{CHECKPOINT_EXT}'))
+    run_tasks(scene, _tasks, _checkpoint, max_workers=max_workers, executable=executable, resume=resume)
+
+    stitch_usd_clips(filepath, [_task['output'] for _task in _tasks], start_frame, end_frame)
+
+    return filepath
+
+
+def get_asset_names(nodes: list[str]) -> list[str]:
+    """ ノードごとに重ならないファイル名を作る
+
+    * ネームスペースなしのノード名。重なる場合はフルパスから作る
+      (|charA|geo -> charA_geo)。それでも重なる場合はフルパスのsha1を足す
+
+    Examples:
+        >>> get_asset_names(['|charA|geo', '|charB|geo', '|prop'])
+        ['charA_geo', 'charB_geo', 'prop']
+    """
+    def _sanitize(value: str) -> str:
+        return re.sub(r'\W', '_', value.strip('|')) or 'node'
+
+    _leaves = [_sanitize(_node.rsplit('|', 1)[-1].rsplit(':', 1)[-1]) for _node in nodes]
+    _names = [
+        _leaf if _leaves.count(_leaf) == 1 else _sanitize(_node)
+        for _node, _leaf in zip(nodes, _leaves)
+    ]
+
+    return [
+        _name if _names.count(_name) == 1 else f'{_name}_{hashlib.sha1(_node.encode("utf-8")).hexdigest()[:8]}'
+        for _node, _name in zip(nodes, _names)
+    ]
+
+
+def get_executable() -> list[str]:
+    """ ワーカーの実行ファイルを取得
+
+    * 環境変数 MDK_MAYAPY があればそれを使う
+    * Maya上では実行中のMayaと同じフォルダの mayapy を使う
+
+    Returns:
+        list[str]: コマンド
+    """
+    if os.environ.get('MDK_MAYAPY'):
+        return [os.environ['MDK_MAYAPY']]
+
+    _name = 'mayapy.exe' if sys.platform == 'win32' else 'mayapy'
+    _path = pathlib.Path(sys.executable).with_name(_name)
+
+    if _path.exists():
+        return [str(_path)]
+
+    return [shutil.which(_name) or _name]
+
+
+def get_task_hash(task: dict) -> str:
+    """ タスクの定義 (format, nodes, start, end, output) のsha1
+
+    * 再開時にチェックポイントのタスクと比べる
+    """
+    _values = {_key: task.get(_key) for _key in ('format', 'nodes', 'start', 'end', 'output')}
+    return hashlib.sha1(json.dumps(_values, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def load_checkpoint(filepath: str) -> dict:
+    """ チェックポイントを読み込む。なければ空の辞書 """
+    try:
+        with open(filepath, 'r', encoding='utf8') as f:
+            return json.load(f)
+
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def run_tasks(
+        scene: str,
+        tasks: list[dict],
+        checkpoint: str,
+        max_workers: int = MAX_WORKERS,
+        executable: str|list[str] = None,
+        resume: bool = True,
+    ) -> list[dict]:
+    """ タスクをワーカーで並列に実行する
+
+    * 各タスクはJSONにしてワーカーに渡す: <executable> worker.py <task.json>
+    * タスクが終わるごとにチェックポイントを保存する
+    * 再開時はIDとタスクの定義 (get_task_hash()) が同じ完了済みタスクだけを飛ばす
+    * 失敗したタスクがあれば、すべて終わった後で RuntimeError
+
+    Args:
+        scene (str): シーンファイル
+        tasks (list[dict]): {'id', 'format', 'nodes', 'start', 'end', 'output'} のリスト
+        checkpoint (str): チェックポイントのファイルパス
+        max_workers (int): 同時に起動するワーカー数
+        executable (str|list[str], optional): ワーカーの実行ファイル
+        resume (bool): チェックポイントがあれば完了済みのタスクを飛ばす
+
+    Returns:
+        list[dict]: タスクリスト ('status', 'time', 'log' を追加)
+    """
+    if not os.path.isfile(scene):
+        raise FileNotFoundError(f'File is not found. {scene}')
+
+    if executable is None:
+        executable = get_executable()
+    elif isinstance(executable, str):
+        executable = [executable]
+
+    _outputs = [os.path.normcase(os.path.abspath(_task['output'])) for _task in tasks]
+
+    if len(set(_outputs)) != len(_outputs) or len({_task['id'] for _task in tasks}) != len(tasks):
+        raise ValueError('Task ids and outputs must be unique')
+
+    _scene = os.path.abspath(scene)
+    _state = load_checkpoint(checkpoint) if resume else {}
+
+    # シーンが変わっていたら最初からやり直す
+    if _state.get('scene') != _scene or _state.get('mtime') != os.path.getmtime(_scene):
+        _state = {}
+
+    _done = {
+        (_task['id'], _task.get('hash')) for _task in _state.get('tasks', [])
+        if _task.get('status') == 'done' and os.path.exists(_task['output'])
+    }
+
+    for _task in tasks:
+        _task['scene'] = _scene
+        _task['hash'] = get_task_hash(_task)
+        _task['status'] = 'done' if (_task['id'], _task['hash']) in _done else 'waiting'
+
+    _state = {
+        'name': NAME,
+        'version': VERSION,
+        'scene': _scene,
+        'mtime': os.path.getmtime(_scene),
+        'tasks': tasks,
+    }
+    _lock = threading.Lock()
+
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint)), exist_ok=True)
+    _save_checkpoint(checkpoint, _state)
+
+    def _run(task: dict):
+        os.makedirs(os.path.dirname(os.path.abspath(task['output'])), exist_ok=True)
+
+        _task_file = f'{task["output"]}.task.json'
+        with open(_task_file, 'w', encoding='utf8') as f:
+            json.dump(task, f, indent=4, ensure_ascii=False)
+
+        _start = time.perf_counter()
+
+        try:
+            _process = subprocess.run(
+                [*executable, WORKER_SCRIPT, _task_file],
+                capture_output=True,
+                text=True,
+            )
+        finally:
+            os.remove(_task_file)
+
+        with _lock:
+            task['time'] = time.perf_counter() - _start
+            task['status'] = 'done' if _process.returncode == 0 else 'failed'
+
+            if _process.returncode != 0:
+                task['log'] = (_process.stdout + _process.stderr)[-4000:]
+
+            _save_checkpoint(checkpoint, _state)
+
+        print(f'MDK | Farm | {task["id"]} {task["status"]} {task["time"]:.1f} sec')
+
+    _waiting = [_task for _task in tasks if _task['status'] != 'done']
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as _executor:
+        list(_executor.map(_run, _waiting))
+
+    _failed = [_task['id'] for _task in tasks if _task['status'] != 'done']
+
+    if _failed:
+        raise RuntimeError(f'Farm tasks failed: {_failed}. See {checkpoint}')
+
+    return tasks
+
+
+def split_frame_range(start_frame: int, end_frame: int, chunk_size: int, overlap: int = 0) -> list[tuple[int, int]]:
+    """ フレームレンジをチャンクに分ける
+
+    * overlap はチャンクの終わりを次のチャンクに重ねるフレーム数
+      バリュークリップの境目で補間できるように、チャンクの最後と次の最初のサンプルを同じにする
+
+    Examples:
+        >>> split_frame_range(1001, 1010, 4)
+        [(1001, 1004), (1005, 1008), (1009, 1010)]
+        >>> split_frame_range(1001, 1010, 4, overlap=1)
+        [(1001, 1005), (1005, 1009), (1009, 1010)]
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Invalid chunk_size: {chunk_size}')
+
+    if overlap < 0:
+        raise ValueError(f'Invalid overlap: {overlap}')
+
+    _result = []
+
+    for _start in range(int(start_frame), int(end_frame) + 1, chunk_size):
+        _end = min(_start + chunk_size - 1 + overlap, int(end_frame))
+
+        # 前のチャンクの重なりに含まれる場合は作らない
+        if _result and _end <= _result[-1][1]:
+            break
+
+        _result.append((_start, _end))
+
+    return _result
+
+
+def stitch_usd_clips(filepath: str, clip_files: list[str], start_frame: int, end_frame: int):
+    """ チャンクのUSDをバリュークリップとしてまとめる
+
+    * クリップはデフォルトプリムに設定する
+    """
+    if UsdUtils is None:
+        raise ImportError('pxr is not found')
+
+    _clip_path = Sdf.Layer.FindOrOpen(clip_files[0]).defaultPrim
+
+    if not _clip_path:
+        raise ValueError(f'Default prim is not found: {clip_files[0]}')
+
+    if os.path.exists(filepath):
+        os.remove(filepath)
+
+    _layer = Sdf.Layer.CreateNew(filepath)
+    UsdUtils.StitchClips(_layer, clip_files, Sdf.Path(f'/{_clip_path}'), start_frame, end_frame)
+    _layer.Save()
+
+
+def _save_checkpoint(filepath: str, state: dict):
+    """ チェックポイントを一時ファイル経由で保存 """
+    _tmp = f'{filepath}.{os.getpid()}{TMP_EXT}'
+
+    with open(_tmp, 'w', encoding='utf8') as f:
+        json.dump(state, f, indent=4, ensure_ascii=False)
+
+    os.replace(_tmp, filepath)
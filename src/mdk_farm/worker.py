@@ -0,0 +1,63 @@
+""" mdk_farm worker
+
+* mayapy で実行する書き出しワーカー。mdkapps はインポートしない
+* 使い方: mayapy worker.py <task.json>
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+"""
+
+import json
+import sys
+
+
+def export_task(task: dict):
+    import maya.cmds as cmds
+
+    cmds.file(task['scene'], open=True, force=True)
+
+    if task['format'] == 'abc':
+        cmds.loadPlugin('AbcExport', quiet=True)
+
+        _roots = ' '.join(f'-root {_node}' for _node in cmds.ls(task['nodes'], long=True))
+        _filepath = task['output'].replace('\\', '/')
+
+        cmds.AbcExport(j=[
+            f'-frameRange {task["start"]} {task["end"]} -stripNamespaces -uvWrite {_roots} -file "{_filepath}"'
+        ])
+
+    elif task['format'] == 'usd':
+        cmds.loadPlugin('mayaUsdPlugin', quiet=True)
+        cmds.select(task['nodes'])
+
+        cmds.mayaUSDExport(
+            file=task['output'],
+            selection=True,
+            exportInstances=True,
+            frameRange=[task['start'], task['end']],
+            frameStride=1.0,
+        )
+
+    else:
+        raise ValueError(f'Not supported format: {task["format"]}')
+
+
+def main(argv: list[str]) -> int:
+    with open(argv[1], 'r', encoding='utf8') as f:
+        _task = json.load(f)
+
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+
+    try:
+        export_task(_task)
+    finally:
+        maya.standalone.uninitialize()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -8,6 +8,23 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.3 [v0.3.0] 2026-10-19 Tatsuya Yamagishi
+        * added: ローカルキャッシュ対応 (mdk_cache)
+        * added: collect_files()
+        * added: open_file()
+        * added: batch()
+        * added: AppMain.import_files()
+        * fixed: AppMain.import_vdb() がノードを返していなかった
+        * added: ImportQueue
+        * added: AppMain.import_usd(proxy=True), AppMain.load_payloads() (configurestage ノードのロードマスク)
+        * added: get_points(), set_points()
+        * added: get_points(frame=...), get_attrib(), get_normals(), get_uvs()
+        * added: export_pointcache(), cook_pointcache(), AppMain.import_pointcache(), release_pointcache() (mdk_pointcache)
+        * added: sample()
+        * added: set_keys()
+        * added: export_camera(), import_camera() (mdk_camera)
+        * added: シーン設定のキャッシュ (get_filepath())。hou.hipFile のイベントでクリアする
+
     * v0.0.2 [v0.0.2] 2025-12-15 Tatsuya Yamagishi
         * added: get_frame_range()
 
@@ -15,17 +32,26 @@ Release Note:
         * New
 """
 
-VERSION = 'v0.0.2'
+VERSION = 'v0.0.3'
 NAME = 'mdk_houdini'
 
+import contextlib
 import os
 import re
 import pathlib
 import platform
 import subprocess
 import sys
+import time
 
 import hou
+import numpy as np
+
+from .. import mdk_cache
+from .. import mdk_camera
+from .. import mdk_pointcache
+from .. import mdk_queue
+from .. import mdk_scene
 
 
 if os.environ.get('MDK_DEBUG'):
@@ -75,11 +101,103 @@ FILENODE_DICT = {
     'volume': 'filepath1',
 }
 
+LOP_NETWORK_TYPES = ('stage', 'lopnet')
+
+LOAD_MASK_PARM_DICT = {
+    'mode': ('loadpayloads', 'loadmask'),
+    'paths': ('loadpaths',),
+}
+
+OPEN_PROFILE_DICT = {
+    'full': {
+        'update_mode': None,
+        'ignore_load_warnings': False,
+    },
+    'fast_inspect': {
+        'update_mode': 'manual',
+        'ignore_load_warnings': True,
+    },
+}
+
 SCRIPT_EXT_LIST = ['.py']
 
+_SETTINGS_CACHE = mdk_cache.SettingsCache()
+
+UPDATE_MODE_DICT = {
+    'auto': hou.updateMode.AutoUpdate,
+    'manual': hou.updateMode.Manual,
+    'on_mouse_up': hou.updateMode.OnMouseUp,
+}
+
+# ======================================= #
+# Context
+# ======================================= #
+@contextlib.contextmanager
+def batch(label: str = 'mdk_batch'):
+    """ 一括処理用のコンテキスト
+
+    * 更新モードをManualにしてノード作成ごとのクックを止める
+    * アンドゥを1グループにまとめる
+    * 例外が出ても更新モードを元に戻す
+    """
+    _update_mode = hou.updateModeSetting()
+    hou.setUpdateMode(hou.updateMode.Manual)
+
+    try:
+        with hou.undos.group(label):
+            yield
+
+    finally:
+        hou.setUpdateMode(_update_mode)
+
+
+# ======================================= #
+# Callbacks
+# ======================================= #
+def _clear_settings_cache(event_type):
+    """ シーン設定のキャッシュをクリアする hou.hipFile のコールバック
+
+    * fps とフレームレンジは変更イベントがないのでキャッシュしない
+    """
+    _SETTINGS_CACHE.clear()
+
+
+def _add_settings_callbacks():
+    """ コールバックを登録。reload した場合は前のコールバックを外す """
+    _old = globals().get('_SETTINGS_CALLBACK')
+
+    if _old is not None and _old in hou.hipFile.eventCallbacks():
+        hou.hipFile.removeEventCallback(_old)
+
+    hou.hipFile.addEventCallback(_clear_settings_cache)
+    globals()['_SETTINGS_CALLBACK'] = _clear_settings_cache
+
+
+_add_settings_callbacks()
+
+
 # ======================================= #
 # Get
 # ======================================= #
+def _get_load_parms(node) -> tuple:
+    """ configurestage ノードのロードマスクのパラメータを取得する
+
+    Raises:
+        RuntimeError: パラメータがない (proxy を反映できない)
+    """
+    _parms = []
+
+    for _key in ('mode', 'paths'):
+        _parm = next((node.parm(_name) for _name in LOAD_MASK_PARM_DICT[_key] if node.parm(_name)), None)
+
+        if _parm is None:
+            raise RuntimeError(f'Load mask parm is not found: {node.path()} {LOAD_MASK_PARM_DICT[_key]}')
+
+        _parms.append(_parm)
+
+    return tuple(_parms)
+
+
 def get_ext() -> str:
     """ 拡張子を返す
     * モードを判定して拡張子を返す
@@ -108,6 +226,7 @@ def get_fps() -> float:
     """
     return hou.fps()
     
+@_SETTINGS_CACHE.cached
 def get_filepath() -> str:
     """ Plugin Builtin Function """
     return hou.hipFile.path()
@@ -132,6 +251,57 @@ def get_main_window():
     return hou.qt.mainWindow()
 
 
+def get_attrib(geo: hou.Geometry, name: str, frame: float=None) -> np.ndarray:
+    """ ポイント、またはバーテックスのfloatアトリビュートを取得
+
+    * *FloatAttribValuesAsString() と np.frombuffer で一括取得する
+
+    Args:
+        geo (hou.Geometry|hou.SopNode): ジオメトリ、またはSOPノード
+        name (str): アトリビュート名
+        frame (float, optional): フレーム。SOPノードの場合は geometryAtFrame() で評価する
+
+    Returns:
+        np.ndarray: [要素, アトリビュートサイズ] の float32
+    """
+    if isinstance(geo, hou.SopNode):
+        geo = geo.geometry() if frame is None else geo.geometryAtFrame(frame)
+
+    _attrib = geo.findPointAttrib(name)
+
+    if _attrib is not None:
+        _values = geo.pointFloatAttribValuesAsString(name)
+    else:
+        _attrib = geo.findVertexAttrib(name)
+
+        if _attrib is None:
+            raise ValueError(f'Attribute is not found: {name}')
+
+        _values = geo.vertexFloatAttribValuesAsString(name)
+
+    return np.frombuffer(_values, dtype=np.float32).reshape(-1, _attrib.size())
+
+
+def get_normals(geo: hou.Geometry, frame: float=None) -> np.ndarray:
+    """ 法線 (N) を取得 ([要素, 3]) """
+    return get_attrib(geo, 'N', frame=frame)
+
+
+def get_points(geo: hou.Geometry, frame: float=None) -> np.ndarray:
+    """ ポイント位置を取得
+
+    * pointFloatAttribValuesAsString() で一括取得する
+
+    Args:
+        geo (hou.Geometry|hou.SopNode): ジオメトリ、またはSOPノード
+        frame (float, optional): フレーム。SOPノードの場合は geometryAtFrame() で評価する
+
+    Returns:
+        np.ndarray: [ポイント, 3] の float32
+    """
+    return get_attrib(geo, 'P', frame=frame)
+
+
 def get_selected_nodes() -> list:
     """ 選択しているノードを取得
     
@@ -140,6 +310,10 @@ def get_selected_nodes() -> list:
     """
     return hou.selectedNodes()
 
+def get_uvs(geo: hou.Geometry, frame: float=None) -> np.ndarray:
+    """ UV (uv) を取得 ([要素, 2]) """
+    return get_attrib(geo, 'uv', frame=frame)[:, :2]
+
 def get_script_exts() -> list[str]:
     """ スクリプト拡張子リストを取得
     
@@ -156,6 +330,36 @@ def set_fps(value: float):
     """ フレームレートを設定 """
     hou.setFps(int(value+0.05))
 
+def set_keys(parm: hou.Parm, frames, values):
+    """ キーをまとめてセット
+
+    * 既存のキーは消し、parm.setKeyframes() で1回でセットする。補間はリニア
+
+    Args:
+        parm (hou.Parm): パラメータ
+        frames (np.ndarray|list): フレーム
+        values (np.ndarray|list): 値
+    """
+    _keys = []
+
+    for _frame, _value in zip(frames, values):
+        _key = hou.Keyframe()
+        _key.setFrame(float(_frame))
+        _key.setValue(float(_value))
+        _key.setExpression('linear()')
+        _keys.append(_key)
+
+    parm.deleteAllKeyframes()
+    parm.setKeyframes(_keys)
+
+def set_points(geo: hou.Geometry, points: np.ndarray):
+    """ ポイント位置を一括でセット
+
+    * 編集できるジオメトリ (Python SOP の hou.pwd().geometry() など) に使う
+    """
+    geo.setPointFloatAttribValuesFromString('P', np.ascontiguousarray(points, dtype=np.float32).tobytes())
+
+
 def set_framerange(head_in: int, cut_in: int, cut_out: int, tail_out: int):
     """ フレームレンジを設定
     
@@ -185,6 +389,47 @@ def set_unit(unit: str):
 # ======================================= #
 # Functins
 # ======================================= #
+def collect_files() -> list[str]:
+    """ シーンが参照している外部ファイルを取得
+
+    * FILENODE_DICT のノードのファイルパス
+    * mdkapps.package() の files に渡す
+
+    Returns:
+        list[str]: ファイルパスリスト
+    """
+    _result = []
+
+    for _node in hou.node('/').allSubChildren():
+        _parm_name = FILENODE_DICT.get(_node.type().name())
+        if not _parm_name:
+            continue
+
+        _parm = _node.parm(_parm_name)
+        if _parm is None:
+            continue
+
+        _filepath = _parm.eval().replace(':SDF_FORMAT_ARGS:format=usda', '')
+        if _filepath:
+            _result.append(_filepath)
+
+    return list(dict.fromkeys(_result))
+
+
+def cook_pointcache(node: hou.SopNode, filepath: str, name: str=None):
+    """ Python SOP からポイントキャッシュの現在のフレームを読み込む
+
+    * 入力ジオメトリのポイント数はキャッシュと同じであること
+    * ファイルはmemmapで開いたまま使い回す。ファイルが更新されていれば開き直す
+
+    Examples:
+        Python SOP のコード
+        >>> import mdkapps
+        >>> mdkapps.cook_pointcache(hou.pwd(), '/path/to/cache.mdkpc')
+    """
+    set_points(node.geometry(), mdk_pointcache.open_cache(filepath).get_points(hou.frame(), name))
+
+
 def create_playblast(
         filepath: str,
         size: tuple[int]|list[int],
@@ -208,6 +453,110 @@ def create_playblast(
     _scene.flipbook(_scene.curViewport(), _flip_options)
 
 
+def export_camera(node: hou.ObjNode|str, filepath: str, frame_range: tuple=None) -> str:
+    """ カメラをカメラファイル (mdk_camera) に書き出す
+
+    * パラメータは sample()、ワールド行列は worldTransformAtTime() で取るので、
+      カレントフレームは変わらない
+    * 焦点距離は mm (focalunits) とする。縦のアパーチャは解像度とピクセル比から求める
+
+    Args:
+        node (hou.ObjNode|str): カメラノード、またはノードパス
+        filepath (str): 出力ファイル (.npz)
+        frame_range (tuple, optional): (start, end)。省略時は get_frame_range()
+
+    Returns:
+        str: filepath
+    """
+    if isinstance(node, str):
+        node = hou.node(node)
+
+    if frame_range is None:
+        frame_range = get_frame_range()
+
+    _frames = np.arange(frame_range[0], frame_range[-1] + 1)
+    _values = sample([node], ['focal', 'aperture', 'resx', 'resy', 'aspect', 'near', 'far'], (_frames[0], _frames[-1]))
+    _matrix = np.array(
+        [node.worldTransformAtTime(hou.frameToTime(_frame)).asTuple() for _frame in _frames], dtype=np.float64)
+
+    _focal, _aperture, _resx, _resy, _aspect, _near, _far = _values.T
+    _film_back = np.stack([_aperture, _aperture * _resy / (_resx * _aspect)], axis=1)
+
+    return mdk_camera.write(
+        filepath,
+        _frames,
+        _matrix.reshape(-1, 4, 4),
+        _focal,
+        _film_back,
+        np.stack([_near, _far], axis=1),
+        name=node.name(),
+        fps=get_fps(),
+        meters_per_unit=1.0,
+        source=NAME,
+    )
+
+
+def export_pointcache(filepath: str, nodes: list[hou.SopNode], start_frame: int, end_frame: int) -> str:
+    """ SOPノードのポイント位置を mdk_pointcache 形式で書き出す
+
+    * オブジェクト名はノード名
+    * geometryAtFrame() で各フレームを評価するので、再生位置は動かさない
+
+    Args:
+        filepath (str): 出力ファイル (.mdkpc)
+        nodes (list[hou.SopNode]): SOPノード
+        start_frame (int): 開始フレーム
+        end_frame (int): 終了フレーム
+
+    Returns:
+        str: filepath
+    """
+    if not nodes:
+        raise ValueError('Select any nodes')
+
+    _objects = [(_node.name(), _node.geometry().intrinsicValue('pointcount')) for _node in nodes]
+
+    with mdk_pointcache.PointCacheWriter(filepath, _objects, start_frame, end_frame) as _writer:
+        for _frame in range(int(start_frame), int(end_frame) + 1):
+            _writer.write_frame([get_points(_node.geometryAtFrame(_frame)) for _node in nodes])
+
+    return filepath
+
+
+def import_camera(filepath: str, name: str=None) -> hou.ObjNode:
+    """ カメラファイル (mdk_camera) からキー付きのカメラを作る
+
+    * キーは set_keys() でパラメータごとにまとめてセットする
+    * アパーチャは横のフィルムバックを使う。縦は解像度で決まる
+
+    Returns:
+        hou.ObjNode: カメラノード
+    """
+    _data = mdk_camera.load(filepath, up_axis='y', meters_per_unit=1.0)
+    _frames = _data['frames']
+
+    _node = hou.node('/obj').createNode('cam', name or _data['header']['name'])
+    _node.parm('focalunits').set('mm')
+    _node.parm('aperture').set(float(_data['film_back'][0, 0]))
+
+    _keys = {
+        'tx': _data['translate'][:, 0],
+        'ty': _data['translate'][:, 1],
+        'tz': _data['translate'][:, 2],
+        'rx': _data['rotate'][:, 0],
+        'ry': _data['rotate'][:, 1],
+        'rz': _data['rotate'][:, 2],
+        'focal': _data['focal_length'],
+        'near': _data['clip'][:, 0],
+        'far': _data['clip'][:, 1],
+    }
+
+    for _name, _values in _keys.items():
+        set_keys(_node.parm(_name), _frames, _values)
+
+    return _node
+
+
 def open_dir(filepath):
     """
     フォルダを開く
@@ -253,6 +602,41 @@ def open_folder(value: str):
 
 
 
+def open_file(filepath: str, profile: str=None):
+    """ Plugin Builtin Function
+
+    * profile を指定した場合は OPEN_PROFILE_DICT の設定で開き、更新モードは開いた後に元に戻す
+
+    Args:
+        filepath (str): 開くファイル
+        profile (str, optional): 'full' / 'fast_inspect'
+    """
+    if profile is not None and profile not in OPEN_PROFILE_DICT:
+        raise ValueError(f'Invalid profile: {profile}')
+
+    _profile = OPEN_PROFILE_DICT.get(profile or 'full')
+    _update_mode = hou.updateModeSetting()
+
+    if _profile['update_mode']:
+        hou.setUpdateMode(UPDATE_MODE_DICT[_profile['update_mode']])
+
+    _start = time.perf_counter()
+
+    try:
+        hou.hipFile.load(
+            filepath,
+            suppress_save_prompt=True,
+            ignore_load_warnings=_profile['ignore_load_warnings'])
+
+    except hou.LoadWarning as ex:
+        print(f'MDK | Houdini | {ex}')
+
+    finally:
+        hou.setUpdateMode(_update_mode)
+
+    print(f'MDK | Open File | profile={profile or "full"} {time.perf_counter() - _start:.2f} sec')
+
+
 def open_in_explorer(filepath: str):
     """
     Explorerでフォルダを開く
@@ -274,6 +658,61 @@ def open_in_explorer(filepath: str):
         raise FileNotFoundError(f'File is not found.')
 
 
+def release_pointcache(filepath: str=None):
+    """ 開いたままのポイントキャッシュを閉じる
+
+    Args:
+        filepath (str, optional): ポイントキャッシュ。省略時は全て閉じる
+    """
+    mdk_pointcache.release(filepath)
+
+
+def sample(nodes: list, attrs: list[str], frame_range: tuple=None, step: float=1.0) -> np.ndarray:
+    """ フレームレンジのパラメータ値をまとめて取得
+
+    * parm.evalAtFrame() で評価するので、カレントフレームは変わらない
+    * 列は nodes x attrs の順。t などのパラメータタプルは要素に展開する
+
+    Args:
+        nodes (list[hou.Node|str]): ノード、またはノードパス
+        attrs (list[str]): パラメータ名、またはパラメータタプル名
+        frame_range (tuple, optional): (start, end) または get_framerange() の4つ。
+            省略時は get_frame_range()
+        step (float): フレームの間隔
+
+    Returns:
+        np.ndarray: [フレーム, パラメータ] の float64
+    """
+    if frame_range is None:
+        frame_range = get_frame_range()
+
+    _frames = np.arange(frame_range[0], frame_range[-1] + step * 0.5, step)
+    _parms = []
+
+    for _node in nodes:
+        if isinstance(_node, str):
+            _node = hou.node(_node)
+
+        for _attr in attrs:
+            _parm = _node.parm(_attr)
+
+            if _parm is not None:
+                _parms.append(_parm)
+                continue
+
+            _parm_tuple = _node.parmTuple(_attr)
+
+            if _parm_tuple is None:
+                raise ValueError(f'Parm is not found: {_node.path()}/{_attr}')
+
+            _parms.extend(_parm_tuple)
+
+    return np.array(
+        [[_parm.evalAtFrame(_frame) for _parm in _parms] for _frame in _frames],
+        dtype=np.float64,
+    ).reshape(len(_frames), len(_parms))
+
+
 def save_file(filepath: str):
     """ Plugin Builtin Function
     
@@ -285,6 +724,32 @@ def save_file(filepath: str):
 # ======================================= #
 # Class
 # ======================================= #
+class ImportQueue(mdk_queue.ImportQueue):
+    """ イベントループコールバックで少しずつ読み込むインポートキュー
+
+    * 1回の tick() は batch() でまとめる
+    """
+    _callback = None
+
+    def import_file(self, filepath: str):
+        return AppMain().import_file(filepath)
+
+
+    def _start(self):
+        self._callback = self.tick
+        hou.ui.addEventLoopCallback(self._callback)
+
+
+    def _stop(self):
+        if self._callback is not None:
+            hou.ui.removeEventLoopCallback(self._callback)
+            self._callback = None
+
+
+    def _tick_context(self):
+        return batch('mdk_import_queue')
+
+
 class AppMain:
     def __init__(self):
         self._unit_scale = 0.01
@@ -422,16 +887,105 @@ class AppMain:
         
 
 
+    def import_files(self, filepath_list: list[str]) -> list:
+        """ 複数ファイルを一括でインポートする
+
+        * batch() の中でノードを作成し、レイアウトは最後に一度だけ行う
+        * LOPネットワークではUSDファイルを1つのreferenceノードにまとめる
+
+        Args:
+            filepath_list (list[str]): インポートするファイルリスト
+
+        Returns:
+            list: 作成したノードリスト
+        """
+        for _filepath in filepath_list:
+            if not os.path.exists(_filepath):
+                raise FileNotFoundError(f'File is not found. {_filepath}')
+
+        _network_path = self.get_current_network_path()
+        _root_node = hou.node(_network_path)
+        _is_lop = _root_node.type().name() in LOP_NETWORK_TYPES
+        _result = []
+
+        with batch('mdk_import_files'):
+            _usd_files = [_filepath for _filepath in filepath_list if self.is_usd(_filepath)]
+
+            if _is_lop and _usd_files:
+                _result.append(self.import_usd_files(_usd_files, root_node=_root_node))
+
+            for _filepath in filepath_list:
+                _name = self.optimize_name(pathlib.Path(_filepath).stem)
+                _node = None
+
+                if self.is_usd(_filepath):
+                    if not _is_lop:
+                        _node = self.import_usd(_filepath, name=_name, network=_network_path, root_node=_root_node)
+
+                elif self.is_vdb(_filepath):
+                    _node = self.import_vdb(_filepath, name=_name, network=_network_path, root_node=_root_node)
+
+                elif self.is_hip(_filepath):
+                    self.import_hipfile(_filepath)
+
+                else:
+                    raise TypeError(f'MDK | Not supported file type: {_filepath}')
+
+                if _node:
+                    _result.append(_node)
+
+            if _result:
+                _root_node.layoutChildren(items=_result)
+
+        return _result
+
+
     def import_hipfile(self, filepath: str):
         """ hipファイルを読み込み """
+        filepath = mdk_cache.cache_path(filepath)
 
         _node = self.get_current_node()
         _node.loadItemsFromFile(filepath)
 
 
 
-    def import_usd(self, filepath: str, name: str=None, network=None, root_node=None):
-        """ USDファイルをインポートする """
+    def import_pointcache(self, filepath: str, input_node=None, name: str=None):
+        """ ポイントキャッシュを読み込むPython SOPを作成する
+
+        Args:
+            filepath (str): ポイントキャッシュ (.mdkpc)
+            input_node (hou.SopNode, optional): ポイント数が同じ入力ジオメトリ
+            name (str, optional): キャッシュ内のオブジェクト名
+
+        Returns:
+            hou.SopNode: Python SOP
+        """
+        _root_node = input_node.parent() if input_node else self.get_current_node()
+        _node = _root_node.createNode('python', self.optimize_name(pathlib.Path(filepath).stem))
+        filepath = mdk_cache.cache_path(filepath)
+        _node.parm('python').set(
+            'import mdkapps\n'
+            f'mdkapps.cook_pointcache(hou.pwd(), {filepath!r}, name={name!r})\n'
+        )
+
+        if input_node:
+            _node.setInput(0, input_node)
+            _node.moveToGoodPosition()
+
+        _node.setDisplayFlag(True)
+
+        return _node
+
+
+    def import_usd(self, filepath: str, name: str=None, network=None, root_node=None, proxy: bool=False):
+        """ USDファイルをインポートする
+
+        * proxy=True の場合、referenceノードの下に configurestage ノードを作成し
+          そのノードのロードマスクでpayloadを読まない (ビューポートの設定は変更しない)
+          必要な部分は load_payloads() で読み込む
+        * proxy=True はLOPネットワークのみ対応。それ以外では ValueError
+        """
+        filepath = mdk_cache.cache_path(filepath)
         _node = None
         _node_type = root_node.type().name()
         _DISPLAY_FLAG = True
@@ -447,6 +1001,10 @@ class AppMain:
         print(f'MDK | Houdini | {filepath=}')
 
 
+        if proxy and _node_type not in LOP_NETWORK_TYPES:
+            raise ValueError(f'proxy=True is only supported in LOP networks: {_node_type}')
+
+
         if _node_type == 'obj':
             _node = root_node.createNode('geo', name)
             _usd_node = _node.createNode('usdimport')
@@ -463,11 +1021,50 @@ class AppMain:
             _node.parm('filepath1').set(filepath)
             _node.setDisplayFlag(_DISPLAY_FLAG)
 
+            if proxy:
+                _mask_node = root_node.createNode('configurestage', f'{_node.name()}_load')
+                _mask_node.setInput(0, _node)
+                _mask_node.moveToGoodPosition()
+
+                try:
+                    self.set_load_paths(_mask_node, [])
+                except RuntimeError:
+                    _mask_node.destroy()
+                    raise
+
+                _mask_node.setDisplayFlag(_DISPLAY_FLAG)
+                _node = _mask_node
+
+
+        return _node
+
+
+    def import_usd_files(self, filepath_list: list[str], root_node=None):
+        """ 複数のUSDファイルを1つのreferenceノードで読み込む (LOP)
+
+        Args:
+            filepath_list (list[str]): USDファイルリスト
+            root_node (hou.Node, optional): LOPネットワーク
+
+        Returns:
+            hou.Node: referenceノード
+        """
+        if root_node is None:
+            root_node = self.get_current_node()
+
+        _node = root_node.createNode('reference')
+        _node.parm('num_files').set(len(filepath_list))
+
+        for _index, _filepath in enumerate(filepath_list, 1):
+            _node.parm(f'filepath{_index}').set(mdk_cache.cache_path(_filepath))
+
+        _node.setDisplayFlag(True)
 
         return _node
 
 
     def import_vdb(self, filepath: str, name: str=None, network=None, root_node=None):
+        filepath = mdk_cache.cache_path(filepath)
         _node = None
         _node_type = root_node.type().name()
 
@@ -485,7 +1082,7 @@ class AppMain:
 
         
         elif _node_type == 'geo':
-            _node = _node.createNode('file')
+            _node = root_node.createNode('file')
             _node.parm('file').set(filepath)
             _node.setDisplayFlag(False)
 
@@ -495,6 +1092,8 @@ class AppMain:
             _node.parm('filepath1').set(filepath)
             _node.bypass(True)
 
+        return _node
+
 
 
 
@@ -514,6 +1113,30 @@ class AppMain:
         return FILE_FILTER_VBD.match(filepath)
     
 
+    def load_payloads(self, node, pattern: str='*', unload: bool=False) -> list[str]:
+        """ configurestage ノードのロードマスクにpayloadをプリムパスのパターンで追加する
+
+        Args:
+            node (hou.LopNode): import_usd(proxy=True) が返した configurestage ノード
+            pattern (str): プリムパスのfnmatchパターン (例: '/city/block_01/*')
+            unload (bool): True の場合はロードマスクから外す
+
+        Returns:
+            list[str]: 対象のプリムパス
+        """
+        _paths = mdk_scene.find_payload_paths(node.stage(), pattern)
+        _load_paths = self.get_load_paths(node)
+
+        if unload:
+            _load_paths = [_path for _path in _load_paths if _path not in _paths]
+        else:
+            _load_paths += [_path for _path in _paths if _path not in _load_paths]
+
+        self.set_load_paths(node, _load_paths)
+
+        return _paths
+
+
     def open_dir(self):
         print('MDK | Open Dir')
 
@@ -567,3 +1190,29 @@ class AppMain:
 
         _root_node.saveItemsToFile(_nodes, filepath)
 
+
+
+    def get_load_paths(self, node) -> list[str]:
+        """ configurestage ノードのロードパスを取得する """
+        _mode_parm, _paths_parm = _get_load_parms(node)
+        return _paths_parm.evalAsString().split()
+
+
+    def set_load_paths(self, node, paths: list[str]):
+        """ configurestage ノードのロードマスクを設定する
+
+        * payloadは読まず、paths のプリムだけ読み込む
+
+        Args:
+            node (hou.LopNode): configurestage ノード
+            paths (list[str]): 読み込むプリムパス
+        """
+        _mode_parm, _paths_parm = _get_load_parms(node)
+
+        _tokens = [_token for _token in _mode_parm.menuItems() if 'none' in _token.lower()]
+
+        if not _tokens:
+            raise RuntimeError(f'Load mode is not found: {_mode_parm.path()}')
+
+        _mode_parm.set(_tokens[0])
+        _paths_parm.set(' '.join(paths))
@@ -8,6 +8,12 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.4 [v0.3.0] 2026-10-19 Tatsuya Yamagishi
+        * added: get_fps()
+        * added: シーン設定のキャッシュ (get_filepath(), get_fps(), get_frame_range())。
+          callbacks.addScript のイベントでクリアする
+        * changed: AppMain.get_fps(), AppMain.get_framerange() はキャッシュを使う
+
     * v0.0.3 [v0.0.3] 2025-12-15 Tatsuya Yamagishi
         * added: get_frame_range
     * v0.0.2 (v0.0.2) 2025-03-31 Tatsuya Yamagishi
@@ -18,7 +24,7 @@ Release Note:
         * added: path
 """
 
-VERSION = 'v0.0.3'
+VERSION = 'v0.0.4'
 NAME = 'mdk_max'
 
 import os
@@ -30,6 +36,8 @@ import sys
 import pymxs
 rt = pymxs.runtime
 
+from .. import mdk_cache
+
 try:
     from PySide6 import QtCore, QtGui, QtWidgets
 except:
@@ -56,6 +64,37 @@ EXT_LIST = [
 
 FILE_FILTER_SCRIPT = re.compile(r'.+\.(py|ms)')
 
+SETTINGS_CALLBACK_ID = 'mdk_settings_cache'
+SETTINGS_EVENTS = (
+    'animationRangeChange',
+    'filePostOpen',
+    'filePostSave',
+    'systemPostNew',
+    'systemPostReset',
+    'timeunitsChange',
+)
+
+_SETTINGS_CACHE = mdk_cache.SettingsCache()
+
+
+#=======================================#
+# Callbacks
+#=======================================#
+def _clear_settings_cache():
+    """ シーン設定のキャッシュをクリアするコールバック """
+    _SETTINGS_CACHE.clear()
+
+
+def _add_settings_callbacks():
+    """ コールバックを登録。同じIDのコールバックは先に外す """
+    rt.callbacks.removeScripts(id=rt.Name(SETTINGS_CALLBACK_ID))
+
+    for _event in SETTINGS_EVENTS:
+        rt.callbacks.addScript(rt.Name(_event), _clear_settings_cache, id=rt.Name(SETTINGS_CALLBACK_ID))
+
+
+_add_settings_callbacks()
+
 #=======================================#
 # Functions
 #=======================================#
@@ -82,10 +121,17 @@ def open_in_explorer(filepath: str):
 # ======================================= #
 # Get
 # ======================================= #
+@_SETTINGS_CACHE.cached
 def get_filepath() -> str:
     """現在開いているファイルパスを取得"""
     return f'{rt.maxFilePath}/{rt.maxFileName}'
 
+@_SETTINGS_CACHE.cached
+def get_fps() -> int:
+    """ FPSを取得 """
+    return rt.frameRate
+
+@_SETTINGS_CACHE.cached
 def get_frame_range() -> tuple[int, int]:
     """ フレームレンジを取得
    
@@ -163,12 +209,11 @@ class AppMain:
     
 
     def get_fps(self) -> int:
-        return rt.frameRate
+        return get_fps()
     
 
     def get_framerange(self) -> tuple[int]:
-        _start_frame = int(rt.animationRange.start.frame)
-        _end_frame = int(rt.animationRange.end.frame)
+        _start_frame, _end_frame = get_frame_range()
 
         return _start_frame, _start_frame, _end_frame, _end_frame
 
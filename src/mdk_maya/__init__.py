@@ -9,6 +9,46 @@ Info:
 
     
 Release Note:
+    * v0.0.5 [v0.3.0] 2026-10-19 Tatsuya Yamagishi
+        * added: ローカルキャッシュ対応 (mdk_cache)
+        * added: collect_files()
+        * added: batch()
+        * added: bulk_import()
+        * changed: AppMain.import_files() は bulk_import() を使う
+        * added: reference_file(deferred=True), open_file(deferred=True)
+        * added: load_references()
+        * fixed: AppMain.reference_files()
+        * added: open_file(profile=...)
+        * added: ImportQueue
+        * added: import_usd(proxy=True), load_payloads()
+        * added: export_abc_batch()
+        * fixed: export_abc() のファイルパスをクォートする
+        * added: AppMain.export_abc_farm(), AppMain.export_usd_farm() (mdk_farm)
+        * fixed: AppMain.export_abc() がなかった
+        * added: 書き出しキャッシュ (export_cached(), get_export_key())
+          キーはマテリアルとファイル名のアトリビュートのファイルの更新日時、サイズも含む
+        * changed: AppMain.export_nodes(), AppMain.export_usd() は書き出しキャッシュを使う
+        * added: apply_alembic_caches()
+        * changed: AppMain.apply_alembic_cache() は選択しているすべてのノードに適用する
+        * added: get_points(), set_points()
+        * added: get_points(frame=...), get_normals(), get_uvs()
+        * added: export_pointcache(), import_pointcache(), attach_pointcache(), release_pointcache() (mdk_pointcache)
+        * added: sample()
+        * added: set_keys()
+        * added: AppMain.export_camera(), AppMain.import_camera() (mdk_camera)
+        * changed: AppMain.set_aperture_size(camera=...)
+        * added: start_end_infinity() (複数ノードをまとめて処理)
+        * fixed: AppMain.start_end_infinity() のアニメーションカーブのタイプ判定が常に True だった
+        * added: NodeHandle, get_selected_handles(), iter_handles(), get_node_types() (OpenMaya 2.0 のクエリ)
+        * changed: get_selected_nodes(handles=True), clear_plugins(), open_dir(), AppMain.get_all_lights(),
+          AppMain.open_dir() は OpenMaya 2.0 のクエリを使う
+        * added: get_plug(), get_attr(), set_attr(), set_attrs() (MPlug キャッシュ、MDGModifier)
+        * changed: get_render_size(), set_render_size(), AppMain.get_render_size(), AppMain.set_render_size(),
+          AppMain.set_render_path(), AppMain.set_camera_image_plane(), AppMain.set_aperture_size() は
+          MPlug を直接使う
+        * added: シーン設定のキャッシュ (get_filepath(), get_fps(), get_frame_range(), get_render(),
+          get_render_size())。MEventMessage とアトリビュートの変更、save_file() でクリアする
+
     * v0.0.4 [v0.2.0] 2025-12-15 Tatsuya Yamagishi
         * added: get_frame_range()
 
@@ -29,24 +69,45 @@ Release Note:
 
 """
 
-VERSION = 'v0.0.4'
+VERSION = 'v0.0.5'
 NAME = 'mdk_maya'
 
 #=======================================#
 # Import Built-in
 #=======================================#
+import contextlib
+import ctypes
+import fnmatch
+import functools
+import itertools
 import os
 import pathlib
 import platform
 import re
 import subprocess
 import sys
+import time
+
+#=======================================#
+# Import mdkapps Modules
+#=======================================#
+from .. import mdk_cache
+from .. import mdk_camera
+from .. import mdk_farm
+from .. import mdk_pointcache
+from .. import mdk_queue
+from .. import mdk_scene
+from . import mdk_modifier
 
 #=======================================#
 # Import Maya Modules
 #=======================================#
+import maya.api.OpenMaya as om2
+import maya.OpenMaya as om1
+import maya.api.OpenMayaAnim as oma2
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.utils
 from maya import OpenMayaUI as omui
 
 from maya.app.renderSetup.model import selector
@@ -59,6 +120,7 @@ from maya.app.renderSetup.model import typeIDs
 import mayaUsd.ufe
 import mayaUsd.lib
 import mayaUsd_createStageWithNewLayer
+from pxr import Sdf
 
 
 try:
@@ -75,6 +137,13 @@ except:
 
 import ufe
 
+import numpy as np
+
+try:
+    from alembic import Abc
+except ImportError:
+    Abc = None
+
 
 #=======================================#
 # Modlue Settings
@@ -89,6 +158,8 @@ if os.environ.get('MDK_DEBUG'):
 #=======================================#
 # MayaSettings
 #=======================================#
+ABC_EXPORT_OPTIONS = ['-stripNamespaces', '-uvWrite']
+
 ATTR_LIST = ('tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz')
 
 EXT_LIST = [
@@ -120,6 +191,12 @@ FILE_FILTER_SCRIPT = re.compile(r'.+\.(py)')
 FILE_FILTER_TEXT = re.compile(r'.+\.(doc|txt|text|json|py|usda|nk|sh|zsh|bat)')
 
 FILE_NODES_LIST = ['filetexture', ]
+FILENODE_DICT = {
+    'file': 'fileTextureName',
+    'AlembicNode': 'abc_File',
+    'imagePlane': 'imageName',
+    'mayaUsdProxyShape': 'filePath',
+}
 FPS_MAP = {
     15: 'game',
     23.976: '23.976fps',
@@ -128,6 +205,19 @@ FPS_MAP = {
     30: 'ntsc',
     60: 'ntscf'
 }
+OPEN_PROFILE_DICT = {
+    'full': {
+        'flags': {},
+        'option_vars': {},
+    },
+    'fast_inspect': {
+        # リファレンスはアンロード、uiConfigurationScriptNode などのscriptNodeは実行しない
+        # フレームレンジは sceneConfigurationScriptNode だけを実行して読み込む
+        'flags': {'loadReferenceDepth': 'none', 'executeScriptNodes': False},
+        'option_vars': {'useScenePanelConfig': 0},
+        'scene_config': True,
+    },
+}
 SCRIPT_EXT_LIST = ['.py', '.mel', '.bat', '.sh', '.zsh']
 
 UNIT_MAP = {
@@ -139,9 +229,481 @@ UNIT_MAP = {
 
 
 
+_INT_TYPES = {
+    om2.MFnNumericData.kByte,
+    om2.MFnNumericData.kChar,
+    om2.MFnNumericData.kShort,
+    om2.MFnNumericData.kInt,
+    om2.MFnNumericData.kLong,
+    om2.MFnNumericData.kInt64,
+}
+
+_BATCH_DEPTH = 0
+_PLUG_CACHE = {}    # {(node, attr): (om2.MObjectHandle, om2.MPlug)}
+_QUERY_CALLBACK_IDS = globals().get('_QUERY_CALLBACK_IDS', [])   # reload しても残る
+_SETTINGS_CACHE = mdk_cache.SettingsCache()
+_SETTINGS_CALLBACK_IDS = globals().get('_SETTINGS_CALLBACK_IDS', [])
+_SETTINGS_NODE_CALLBACK_IDS = globals().get('_SETTINGS_NODE_CALLBACK_IDS', [])
+
+
+# ======================================= #
+# Context
+# ======================================= #
+@contextlib.contextmanager
+def batch(undo: bool = True):
+    """ 一括処理用のコンテキスト
+
+    * ビューポートの更新を止める (refresh suspend)
+    * undo=True ならアンドゥを1チャンクにまとめ、False ならアンドゥを記録しない
+    * 評価グラフのアイドル時リビルドを止める
+    * 例外が出ても元の状態に戻す。入れ子の場合は一番外側だけが切り替える
+
+    Args:
+        undo (bool): アンドゥを記録するか
+
+    Examples:
+        >>> with mdkapps.batch():
+        ...     mdkapps.import_file(filepath_a)
+        ...     mdkapps.import_file(filepath_b)
+    """
+    global _BATCH_DEPTH
+
+    _BATCH_DEPTH += 1
+
+    if _BATCH_DEPTH > 1:
+        try:
+            yield
+        finally:
+            _BATCH_DEPTH -= 1
+
+        return
+
+    _undo_state = cmds.undoInfo(q=True, state=True)
+    _idle_build = None
+
+    try:
+        _idle_build = cmds.evaluationManager(q=True, idleBuild=True)
+    except (RuntimeError, TypeError):
+        pass
+
+    try:
+        cmds.refresh(suspend=True)
+
+        if _idle_build is not None:
+            cmds.evaluationManager(idleBuild=False)
+
+        if undo:
+            cmds.undoInfo(openChunk=True, chunkName='mdk_batch')
+        else:
+            cmds.undoInfo(stateWithoutFlush=False)
+
+        yield
+
+    finally:
+        if undo:
+            cmds.undoInfo(closeChunk=True)
+        else:
+            cmds.undoInfo(stateWithoutFlush=_undo_state)
+
+        if _idle_build is not None:
+            cmds.evaluationManager(idleBuild=_idle_build)
+
+        cmds.refresh(suspend=False)
+        _BATCH_DEPTH -= 1
+
+
+# ======================================= #
+# Query
+# ======================================= #
+@functools.lru_cache(maxsize=None)
+def get_node_types(classification: str, exclude: str=None) -> frozenset[str]:
+    """ 分類に含まれるノードタイプを取得
+
+    * 結果はキャッシュする。プラグインのロード、アンロードでクリアする
+
+    Args:
+        classification (str): 'light' など
+        exclude (str, optional): 除外する分類 (':' 区切り)
+
+    Returns:
+        frozenset[str]: ノードタイプ
+    """
+    if exclude:
+        return frozenset(cmds.listNodeTypes(classification, exclude=exclude) or [])
+
+    return frozenset(cmds.listNodeTypes(classification) or [])
+
+
+def get_attr(node: str, attr: str):
+    """ アトリビュートの値を get_plug() で取得
+
+    * 角度と距離はUIの単位、列挙型は番号で返す (getAttr と同じ)
+    """
+    return _get_plug_value(get_plug(node, attr))
+
+
+def get_plug(node: str, attr: str) -> om2.MPlug:
+    """ MPlug を取得
+
+    * (node, attr) ごとにキャッシュする。ノードが消えたり名前が変わっていれば取り直す
+    * シーンの新規作成、読み込みでキャッシュをクリアする
+    """
+    _key = (node, attr)
+    _cache = _PLUG_CACHE.get(_key)
+
+    if _cache is not None and _is_valid_handle(_cache[0], node):
+        return _cache[1]
+
+    _selection = om2.MSelectionList()
+    _selection.add(f'{node}.{attr}')
+    _plug = _selection.getPlug(0)
+
+    _PLUG_CACHE[_key] = (om2.MObjectHandle(_plug.node()), _plug)
+
+    return _plug
+
+
+def get_selected_handles() -> list['NodeHandle']:
+    """ 選択しているノードを NodeHandle で取得
+
+    * MGlobal.getActiveSelectionList() から取るので、名前の文字列を経由しない
+    """
+    _selection = om2.MGlobal.getActiveSelectionList()
+    _result = []
+
+    for _index in range(_selection.length()):
+        try:
+            _dag = _selection.getDagPath(_index)
+            _result.append(NodeHandle(_dag.node(), _dag))
+        except TypeError:
+            _result.append(NodeHandle(_selection.getDependNode(_index)))
+
+    return _result
+
+
+def iter_handles(fn_type: int=om2.MFn.kDependencyNode, type_names: set[str]=None):
+    """ シーンのノードを NodeHandle で返すジェネレーター
+
+    * MItDependencyNodes を fn_type で絞り込み、type_names があればタイプ名でさらに絞る
+
+    Args:
+        fn_type (int): om2.MFn のタイプ
+        type_names (set[str], optional): ノードタイプ名
+
+    Yields:
+        NodeHandle: ノード
+    """
+    _iter = om2.MItDependencyNodes(fn_type)
+
+    while not _iter.isDone():
+        _node = _iter.thisNode()
+
+        if type_names is None or om2.MFnDependencyNode(_node).typeName in type_names:
+            yield NodeHandle(_node)
+
+        _iter.next()
+
+
+def set_attr(node: str, attr: str, value, undo: bool=True):
+    """ アトリビュートの値を MPlug でセット。set_attrs() を参照 """
+    set_attrs({(node, attr): value}, undo=undo)
+
+
+def set_attrs(values: dict|list[tuple], undo: bool=True):
+    """ 複数のアトリビュートを MDGModifier でまとめてセット
+
+    * 順番にセットする。角度と距離はUIの単位、列挙型は番号か名前
+    * undo=True の場合は mdk_modifier プラグインのコマンドで実行し、1回でアンドゥできる
+
+    Args:
+        values (dict|list[tuple]): {(ノード, アトリビュート): 値}。
+            同じアトリビュートを2回セットする場合は [((ノード, アトリビュート), 値)] のリスト
+        undo (bool): アンドゥを記録するか
+
+    Examples:
+        >>> set_attrs({
+        ...     ('defaultResolution', 'width'): 1920,
+        ...     ('defaultResolution', 'height'): 1080,
+        ... })
+    """
+    _modifier = om2.MDGModifier()
+
+    _items = values.items() if isinstance(values, dict) else values
+
+    for (_node, _attr), _value in _items:
+        _set_plug_value(_modifier, get_plug(_node, _attr), _value)
+
+    if not undo:
+        _modifier.doIt()
+        return
+
+    _path = mdk_modifier.__file__
+
+    if not cmds.pluginInfo(_path, q=True, loaded=True):
+        cmds.loadPlugin(_path, quiet=True)
+
+    mdk_modifier.get_shared().pending.append(_modifier)
+
+    try:
+        getattr(cmds, mdk_modifier.COMMAND_NAME)()
+    finally:
+        if _modifier in mdk_modifier.get_shared().pending:
+            mdk_modifier.get_shared().pending.remove(_modifier)
+
+
+def _clear_node_type_cache(*args):
+    get_node_types.cache_clear()
+
+
+def _clear_plug_cache(*args):
+    _PLUG_CACHE.clear()
+
+
+def _is_valid_handle(handle: om2.MObjectHandle, node: str) -> bool:
+    """ キャッシュしたノードがまだあり、名前が node と一致するか """
+    if not handle.isValid():
+        return False
+
+    _obj = handle.object()
+
+    if not _obj.hasFn(om2.MFn.kDagNode):
+        return om2.MFnDependencyNode(_obj).name() == node
+
+    _fn = om2.MFnDagNode(_obj)
+
+    if node.startswith('|'):
+        return _fn.fullPathName() == node
+
+    return _fn.partialPathName() == node
+
+
+def _get_plug_value(plug: om2.MPlug):
+    """ プラグの値をアトリビュートのタイプに合わせて取得 """
+    _attr = plug.attribute()
+
+    if _attr.hasFn(om2.MFn.kTypedAttribute):
+        return plug.asString()
+
+    if _attr.hasFn(om2.MFn.kEnumAttribute):
+        return plug.asShort()
+
+    if _attr.hasFn(om2.MFn.kUnitAttribute):
+        _type = om2.MFnUnitAttribute(_attr).unitType()
+
+        if _type == om2.MFnUnitAttribute.kAngle:
+            return plug.asMAngle().asUnits(om2.MAngle.uiUnit())
+        elif _type == om2.MFnUnitAttribute.kDistance:
+            return plug.asMDistance().asUnits(om2.MDistance.uiUnit())
+
+        return plug.asDouble()
+
+    if _attr.hasFn(om2.MFn.kNumericAttribute):
+        _type = om2.MFnNumericAttribute(_attr).numericType()
+
+        if _type == om2.MFnNumericData.kBoolean:
+            return plug.asBool()
+        elif _type in _INT_TYPES:
+            return plug.asInt()
+
+    return plug.asDouble()
+
+
+def _set_plug_value(modifier: om2.MDGModifier, plug: om2.MPlug, value):
+    """ プラグの値をセットする操作を modifier に追加 """
+    _attr = plug.attribute()
+
+    if _attr.hasFn(om2.MFn.kTypedAttribute):
+        modifier.newPlugValueString(plug, str(value))
+
+    elif _attr.hasFn(om2.MFn.kEnumAttribute):
+        if isinstance(value, str):
+            value = om2.MFnEnumAttribute(_attr).fieldValue(value)
+
+        modifier.newPlugValueShort(plug, int(value))
+
+    elif _attr.hasFn(om2.MFn.kUnitAttribute):
+        _type = om2.MFnUnitAttribute(_attr).unitType()
+
+        if _type == om2.MFnUnitAttribute.kAngle:
+            modifier.newPlugValueMAngle(plug, om2.MAngle(float(value), om2.MAngle.uiUnit()))
+        elif _type == om2.MFnUnitAttribute.kDistance:
+            modifier.newPlugValueMDistance(plug, om2.MDistance(float(value), om2.MDistance.uiUnit()))
+        else:
+            modifier.newPlugValueDouble(plug, float(value))
+
+    elif _attr.hasFn(om2.MFn.kNumericAttribute):
+        _type = om2.MFnNumericAttribute(_attr).numericType()
+
+        if _type == om2.MFnNumericData.kBoolean:
+            modifier.newPlugValueBool(plug, bool(value))
+        elif _type in _INT_TYPES:
+            modifier.newPlugValueInt(plug, int(value))
+        else:
+            modifier.newPlugValueDouble(plug, float(value))
+
+    else:
+        raise TypeError(f'Not supported attribute: {plug.name()}')
+
+
+for _id in _QUERY_CALLBACK_IDS:
+    om2.MMessage.removeCallback(_id)
+
+_QUERY_CALLBACK_IDS[:] = [
+    *[
+        om2.MSceneMessage.addStringArrayCallback(_message, _clear_node_type_cache)
+        for _message in (om2.MSceneMessage.kAfterPluginLoad, om2.MSceneMessage.kAfterPluginUnload)
+    ],
+    *[
+        om2.MSceneMessage.addCallback(_message, _clear_plug_cache)
+        for _message in (om2.MSceneMessage.kBeforeNew, om2.MSceneMessage.kBeforeOpen)
+    ],
+]
+
+
+def _watch_settings_nodes(*args):
+    """ シーン設定のキャッシュをクリアし、設定ノードのアトリビュート変更のコールバックを入れ直す
+
+    * defaultRenderGlobals などはシーンを開くと作り直されるので、開くたびに呼ぶ
+    """
+    _SETTINGS_CACHE.clear()
+
+    for _id in _SETTINGS_NODE_CALLBACK_IDS:
+        om2.MMessage.removeCallback(_id)
+
+    _SETTINGS_NODE_CALLBACK_IDS.clear()
+
+    for _node in ('defaultRenderGlobals', 'defaultResolution'):
+        _selection = om2.MSelectionList()
+
+        try:
+            _selection.add(_node)
+        except RuntimeError:
+            continue
+
+        _SETTINGS_NODE_CALLBACK_IDS.append(
+            om2.MNodeMessage.addAttributeChangedCallback(_selection.getDependNode(0), _SETTINGS_CACHE.clear))
+
+
+for _id in _SETTINGS_CALLBACK_IDS:
+    om2.MMessage.removeCallback(_id)
+
+_SETTINGS_CALLBACK_IDS[:] = [
+    *[
+        om2.MEventMessage.addEventCallback(_event, _watch_settings_nodes)
+        for _event in ('SceneOpened', 'NewSceneOpened')
+    ],
+    *[
+        om2.MEventMessage.addEventCallback(_event, _SETTINGS_CACHE.clear)
+        for _event in ('SceneSaved', 'timeUnitChanged', 'playbackRangeChanged', 'playbackRangeSliderChanged')
+    ],
+]
+
+_watch_settings_nodes()
+
+
 # ======================================= #
 # Get
 # ======================================= #
+def get_alembic_objects(filepath: str) -> list[str]:
+    """ Alembicのオブジェクト名(ネームスペースなし)をすべて取得
+
+    * alembic モジュールがない場合は空のリスト
+    """
+    if Abc is None:
+        return []
+
+    _result = []
+    _objects = [Abc.IArchive(filepath).getTop()]
+
+    while _objects:
+        _object = _objects.pop()
+
+        for _index in range(_object.getNumChildren()):
+            _child = _object.getChild(_index)
+            _result.append(_child.getName().rsplit(':', 1)[-1])
+            _objects.append(_child)
+
+    return _result
+
+
+def get_export_key(
+        filepath: str,
+        nodes: list[str],
+        start_frame: int = None,
+        end_frame: int = None,
+        options: dict = None) -> str:
+    """ 書き出しのフィンガープリントを取得
+
+    * DAG(パスとタイプ)、ヒストリーのノードとデフォルト値でないアトリビュート、
+      アニメーションカーブのキー、トランスフォームの matrix、
+      メッシュの頂点位置(現在のフレーム)、トポロジー、UV、
+      シェーディンググループの割り当てとその上流のノード、
+      ファイル名のアトリビュート (usedAsFilename) のファイルの更新日時とサイズ、
+      リファレンスファイルの更新日時、フレームレンジ、オプションから作る
+    * 書き出しと違ってフレームを進めないので、書き出しよりずっと軽い
+      メッシュは getRawPoints() などのバッファをそのままハッシュする
+
+    Returns:
+        str: sha1
+    """
+    _nodes = cmds.ls(nodes, long=True)
+    _dag = _nodes + (cmds.listRelatives(_nodes, allDescendents=True, fullPath=True) or [])
+    _history = cmds.listHistory(_dag) or []
+    _curves = sorted(set(
+        cmds.ls(_history, type='animCurve')
+        + (cmds.listConnections(_dag, type='animCurve', source=True, destination=False) or [])
+    ))
+
+    _keys = []
+    if _curves:
+        _keys = [
+            cmds.keyframe(_curves, q=True, timeChange=True, valueChange=True),
+            cmds.keyTangent(_curves, q=True, inAngle=True, outAngle=True),
+        ]
+
+    # マテリアルも書き出されるので、シェーディンググループとその上流を入れる
+    # 他のメッシュのヒストリーまで辿らないように DAG ノードで止める
+    _shading_groups = sorted(set(cmds.listConnections(_dag, type='shadingEngine') or []))
+    _shading = cmds.listHistory(_shading_groups, pruneDagObjects=True) if _shading_groups else []
+    _dag_set = set(cmds.ls(_dag, long=True))
+    _members = [
+        (_shading_group, sorted(
+            _member for _member in cmds.ls(cmds.sets(_shading_group, q=True) or [], long=True)
+            if _member.split('.', 1)[0] in _dag_set
+        ))
+        for _shading_group in _shading_groups
+    ]
+
+    # アニメーションカーブはキーで、time1 は現在のフレームが入るので除く
+    _skip = set(cmds.ls(_history + _shading, type=('animCurve', 'time'), long=True)) | _dag_set
+    _inputs = [_node for _node in cmds.ls(_history, long=True) if _node not in _skip]
+    _inputs += [_node for _node in cmds.ls(_shading, long=True) if _node not in _skip and _node not in _inputs]
+
+    _references = [
+        (_filepath, os.path.getmtime(_filepath) if os.path.exists(_filepath) else None)
+        for _filepath in cmds.file(q=True, reference=True, withoutCopyNumber=True) or []
+    ]
+
+    return mdk_cache.get_key(
+        VERSION,
+        os.path.splitext(filepath)[1].lower(),
+        start_frame,
+        end_frame,
+        options,
+        cmds.ls(_dag, long=True, showType=True),
+        cmds.ls(_history, showType=True),
+        cmds.ls(_shading, showType=True),
+        _members,
+        _get_non_default_values(_inputs),
+        _get_file_stats(_inputs),
+        _curves,
+        _keys,
+        [cmds.getAttr(f'{_node}.matrix') for _node in cmds.ls(_dag, type='transform', long=True)],
+        [_get_mesh_key(_mesh) for _mesh in cmds.ls(_dag, type='mesh', long=True, noIntermediate=True)],
+        _references,
+    )
+
+
 def get_ext() -> str:
     """ 拡張子を返す 
     
@@ -156,6 +718,7 @@ def get_filename() -> str:
     if _filepath:
         return pathlib.Path(_filepath).name
     
+@_SETTINGS_CACHE.cached
 def get_filepath() -> str:
     """ 現在のシーンファイルパスを取得 
     
@@ -164,6 +727,7 @@ def get_filepath() -> str:
     """
     return cmds.file(q=True, sn=True)
 
+@_SETTINGS_CACHE.cached
 def get_fps() -> int:
     fps_dict = {
         "game": 15,
@@ -178,6 +742,7 @@ def get_fps() -> int:
     fps = cmds.currentUnit(query=True, time=True)
     return fps_dict.get(fps)
 
+@_SETTINGS_CACHE.cached
 def get_frame_range() -> tuple[int, int]:
     """ フレームレンジを取得
     
@@ -198,18 +763,85 @@ def get_main_window():
         return wrapInstance(int(ptr), QtWidgets.QWidget)
 
 
+def get_normals(node: str, frame: float=None, world: bool=False) -> np.ndarray:
+    """ メッシュの頂点法線を取得
+
+    * MFnMesh.getVertexNormals() で一括取得する
+    * ワールド座標は逆行列の転置で変換するので、非一様スケールでも正しい
+
+    Args:
+        node (str): メッシュ、またはそのトランスフォーム
+        frame (float, optional): フレーム。指定した場合は現在の時間を変えずにそのフレームで評価する
+        world (bool): ワールド座標で取得するか
+
+    Returns:
+        np.ndarray: [ポイント, 3] の float32
+    """
+    _fn = _get_mesh_fn(node, frame)
+    _normals = _to_array(_fn.getVertexNormals(False, om2.MSpace.kObject), np.float32, 3)
+
+    if world:
+        _matrix = np.linalg.inv(_get_world_matrix(node, frame)[:3, :3]).T
+        _normals = (_normals @ _matrix).astype(np.float32)
+        _normals /= np.linalg.norm(_normals, axis=1, keepdims=True)
+
+    return _normals
+
+
+def get_points(node: str, frame: float=None, world: bool=False) -> np.ndarray:
+    """ メッシュのポイント位置を取得
+
+    * OpenMaya 1.0 の MFnMesh.getRawPoints() のバッファを numpy でコピーする
+      (MPointArray を Python のオブジェクトに変換しない)
+
+    Args:
+        node (str): メッシュ、またはそのトランスフォーム
+        frame (float, optional): フレーム。指定した場合は現在の時間を変えずにそのフレームで評価する
+        world (bool): ワールド座標で取得するか
+
+    Returns:
+        np.ndarray: [ポイント, 3] の float32
+    """
+    _fn = _get_raw_mesh_fn(node, frame)
+    _points = _get_raw_points(_fn).copy()
+
+    if world:
+        _matrix = _get_world_matrix(node, frame)
+        _points = (_points @ _matrix[:3, :3] + _matrix[3, :3]).astype(np.float32)
+
+    return _points
+
+
+def get_uvs(node: str, uv_set: str=None) -> np.ndarray:
+    """ メッシュのUVを取得
+
+    Args:
+        node (str): メッシュ、またはそのトランスフォーム
+        uv_set (str, optional): UVセット。省略時はカレント
+
+    Returns:
+        np.ndarray: [UV, 2] の float32
+    """
+    _fn = om2.MFnMesh(_get_dag_path(node))
+    _u, _v = _fn.getUVs(uv_set or _fn.currentUVSetName())
+
+    return np.column_stack([_to_array(_u, np.float32), _to_array(_v, np.float32)])
+
+
+@_SETTINGS_CACHE.cached
 def get_render() -> str:
     """ 現在のレンダラーを取得 """
     return cmds.getAttr('defaultRenderGlobals.currentRenderer')
 
+@_SETTINGS_CACHE.cached
 def get_render_size() -> tuple[int, int]:
     """ レンダーサイズを取得
     
     Returns:
         tuple[int, int]: レンダーサイズ(width, height)
     """
-    _width = cmds.getAttr("defaultResolution.width")
-    _height = cmds.getAttr("defaultResolution.height")
+    _width = get_attr('defaultResolution', 'width')
+    _height = get_attr('defaultResolution', 'height')
 
     return (_width, _height)
 
@@ -217,15 +849,19 @@ def get_script_exts() -> list:
     """ スクリプト拡張子リストを取得 """
     return SCRIPT_EXT_LIST
 
-def get_selected_nodes(long=True) -> list[str]:
+def get_selected_nodes(long=True, handles=False) -> list[str]:
     """ 選択しているノードを返す
 
     Args:
         long(bool): True: フルパス, False: ノード名のみ
+        handles(bool): True: NodeHandle のリストを返す (コンポーネント、プラグは含まない)
     
     Returns:
-        list[str]: 選択しているノードリスト
+        list[str]: 選択しているノードリスト (cmds.ls(sl=True) と同じ)
     """
+    if handles:
+        return get_selected_handles()
+
     return cmds.ls(sl=True, long=long)
 
 # ======================================= #
@@ -296,6 +932,65 @@ def set_fps(value: int):
     cmds.currentUnit(time=unit)
 
 
+def set_keys(node: str, attr: str, frames, values) -> str:
+    """ アニメーションカーブを作り、キーをまとめてセット
+
+    * MFnAnimCurve.addKeys() で1回で追加する。接線はリニア
+    * 値は内部単位 (移動は cm、回転はラジアン)
+
+    Args:
+        node (str): ノード
+        attr (str): アトリビュート
+        frames (np.ndarray|list): フレーム
+        values (np.ndarray|list): 値
+
+    Returns:
+        str: アニメーションカーブ
+    """
+    _selection = om2.MSelectionList()
+    _selection.add(f'{node}.{attr}')
+    _plug = _selection.getPlug(0)
+
+    _unit = om2.MTime.uiUnit()
+    _times = om2.MTimeArray([om2.MTime(float(_frame), _unit) for _frame in frames])
+
+    _fn = oma2.MFnAnimCurve()
+    _fn.create(_plug)
+    _fn.addKeys(
+        _times,
+        om2.MDoubleArray(np.asarray(values, dtype=np.float64).tolist()),
+        oma2.MFnAnimCurve.kTangentLinear,
+        oma2.MFnAnimCurve.kTangentLinear,
+    )
+
+    return _fn.name()
+
+
+def set_points(node: str, points: np.ndarray):
+    """ メッシュのポイント位置を一括でセット (オブジェクト座標)
+
+    * 作業用にコピーしたメッシュの getRawPoints() のバッファに numpy で書き込み、
+      そこから MFloatPointArray を作って setPoints() する。要素ごとの変換はしない
+
+    Args:
+        node (str): メッシュ、またはそのトランスフォーム
+        points (np.ndarray): [ポイント, 3]
+    """
+    _fn = _get_raw_mesh_fn(node)
+    _points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+
+    if len(_points) != _fn.numVertices():
+        raise ValueError(f'Point count mismatch: {len(_points)} / {_fn.numVertices()}')
+
+    _copy = om1.MFnMesh()
+    _copy.copy(_fn.object(), om1.MFnMeshData().create())
+    _get_raw_points(_copy)[:] = _points
+
+    _array = om1.MFloatPointArray()
+    _copy.getPoints(_array)
+    _fn.setPoints(_array)
+
+
 def set_renderer(renderer: str):
     render_globals_node = cmds.ls(type='renderGlobals')[0]
 
@@ -336,21 +1031,26 @@ def set_render_frame_range(first_frame: int, last_frame: int):
 def set_render_size(width: int, height: int):
     print(f'set render size = {width} x {height}')
 
-    cmds.setAttr("defaultResolution.aspectLock", 0)
     renderer = get_render()
 
     if renderer == 'vray':
         vray_setting = 'vraySettings'
-        cmds.setAttr(f'{vray_setting}.aspectLock', 0)
-        cmds.setAttr(f'{vray_setting}.width', width)
-        cmds.setAttr(f'{vray_setting}.height', height)
-        cmds.setAttr(f'{vray_setting}.pixelAspect', 1.0)
-        cmds.setAttr(f'{vray_setting}.aspectLock', True)
+        set_attrs([
+            (('defaultResolution', 'aspectLock'), 0),
+            ((vray_setting, 'aspectLock'), 0),
+            ((vray_setting, 'width'), width),
+            ((vray_setting, 'height'), height),
+            ((vray_setting, 'pixelAspect'), 1.0),
+            ((vray_setting, 'aspectLock'), True),
+        ])
 
     else:
         default_resolution = 'defaultResolution'
-        cmds.setAttr(f'{default_resolution}.width', int(width))
-        cmds.setAttr(f'{default_resolution}.height', int(height))
+        set_attrs({
+            (default_resolution, 'aspectLock'): 0,
+            (default_resolution, 'width'): int(width),
+            (default_resolution, 'height'): int(height),
+        })
 
 def set_unit(unit: str):
     """ 単位を設定
@@ -379,6 +1079,88 @@ def add_recent_file(filepath: str):
         cmd = 'addRecentFile( "{}", "mayaBinary")'.format(filepath)
         mel.eval(cmd)
 
+def apply_alembic_caches(filepath: str, nodes: list[str]=None) -> dict:
+    """ Alembicキャッシュを複数のノードに一括で適用する
+
+    * Alembicの階層は一度だけ読み、シーン側はネームスペースを除いた名前の辞書で照合する
+    * 照合できたノードのうち一番上のものを、1回の AbcImport -connect に渡す
+    * Alembicの階層の読み込みには alembic モジュール (PyAlembic) を使う
+      ない場合は警告を出して照合せずにルートノードを接続し、matched / unmatched は None
+
+    Args:
+        filepath (str): Alembicファイル
+        nodes (list[str], optional): 適用するルートノード。省略時は選択しているノード
+
+    Returns:
+        dict: {'matched': [シーンのノード], 'unmatched': [Alembicのオブジェクト名]}
+    """
+    if nodes is None:
+        nodes = cmds.ls(sl=True, long=True)
+
+    if not nodes:
+        raise ValueError('Select any nodes')
+
+    _roots = cmds.ls(nodes, long=True)
+    cmds.loadPlugin('AbcImport', quiet=True)
+
+    if Abc is None:
+        print('MDK | Apply Alembic Cache | WARNING: alembic module is not found. Connect without matching')
+        cmds.AbcImport(filepath, mode='import', connect=' '.join(_roots))
+
+        return {'matched': None, 'unmatched': None}
+
+    _index = {}
+
+    for _node in _roots + (cmds.listRelatives(_roots, allDescendents=True, fullPath=True) or []):
+        _name = _node.rsplit('|', 1)[-1].rsplit(':', 1)[-1]
+        _index.setdefault(_name, []).append(_node)
+
+    _matched = []
+    _unmatched = []
+
+    for _name in get_alembic_objects(filepath):
+        if _name in _index:
+            _matched.extend(_index[_name])
+        else:
+            _unmatched.append(_name)
+
+    _matched = list(dict.fromkeys(_matched))
+
+    # 子は親の接続で一緒につながるので、親が照合できていないノードだけを渡す
+    _matched_set = set(_matched)
+    _connect = []
+
+    for _node in _matched:
+        _parts = _node.split('|')
+
+        if not any('|'.join(_parts[:_index]) in _matched_set for _index in range(2, len(_parts))):
+            _connect.append(_node)
+
+    if _connect:
+        cmds.AbcImport(filepath, mode='import', connect=' '.join(_connect))
+
+    print(f'MDK | Apply Alembic Cache | {filepath} matched={len(_matched)} unmatched={len(_unmatched)}')
+
+    for _name in _unmatched:
+        print(f'MDK | Apply Alembic Cache | unmatched: {_name}')
+
+    return {'matched': _matched, 'unmatched': _unmatched}
+
+
+def attach_pointcache(filepath: str, nodes: list[str]=None) -> int:
+    """ フレームが変わるたびにポイントキャッシュを読み込む
+
+    * timeChanged の scriptJob を登録する。削除は cmds.scriptJob(kill=id)
+
+    Returns:
+        int: scriptJob のID
+    """
+    _meshes = _get_pointcache_targets(nodes)
+    import_pointcache(filepath, _meshes)
+
+    return cmds.scriptJob(event=['timeChanged', lambda: import_pointcache(filepath, _meshes)])
+
+
 def clear_plugins():
     """ 不要なプラグインデータを削除 """
     print('MDK | [Clear Plugins]')
@@ -397,7 +1179,7 @@ def clear_plugins():
                 print('args:' + str(error.args))
 
 
-    nodes_ = cmds.ls(type='unknown')
+    nodes_ = [_handle.name for _handle in iter_handles(om2.MFn.kUnknown)]
     if nodes_:
         for node_ in nodes_:
             try:
@@ -409,6 +1191,26 @@ def clear_plugins():
                 print('type:' + str(type(error)))
                 print('args:' + str(error.args))
                 
+def collect_files() -> list[str]:
+    """ シーンが参照している外部ファイルを取得
+
+    * リファレンスファイルと FILENODE_DICT のノードのファイルパス
+    * mdkapps.package() の files に渡す
+
+    Returns:
+        list[str]: ファイルパスリスト
+    """
+    _result = cmds.file(q=True, reference=True, withoutCopyNumber=True) or []
+
+    for _node_type, _attr in FILENODE_DICT.items():
+        for _node in cmds.ls(type=_node_type) or []:
+            _filepath = cmds.getAttr(f'{_node}.{_attr}')
+
+            if _filepath:
+                _result.append(_filepath)
+
+    return list(dict.fromkeys(_result))
+
 def create_playblast(
             filepath: str,
             size: list|tuple=None,
@@ -485,34 +1287,204 @@ def export_abc(
     """
     if not nodes:
         raise ValueError('Select any nodes')
-    
-    cmds.select(nodes)
-    if (start_frame is None) and (end_frame is None):
-        frames = ''
+
+    return export_abc_batch([(filepath, nodes, start_frame, end_frame)])[0]
+
+
+def export_abc_batch(jobs: list[tuple], options: list[str]=None) -> list[dict]:
+    """ 複数のAlembicを1回の AbcExport で書き出す
+
+    * 1つのコマンドに複数の -j を渡すので、タイムラインは1回だけ評価される
+    * ノードがトランスフォームかどうかは書き出し前にまとめて確認する
+    * ファイルパスはクォートするのでスペースを含んでもよい
+
+    Args:
+        jobs (list[tuple]): [(filepath, nodes, start_frame, end_frame), ...]
+            フレームが None の場合は現在のフレームのみ
+        options (list[str], optional): 各ジョブのオプション。省略時は ABC_EXPORT_OPTIONS
+
+    Returns:
+        list[dict]: {'filepath', 'nodes', 'size'(byte), 'time'(sec)} のリスト
+            time はコマンド全体の時間
+    """
+    if options is None:
+        options = ABC_EXPORT_OPTIONS
+
+    _job_args = []
+    _invalid = []
+
+    for _filepath, _nodes, _start_frame, _end_frame in jobs:
+        if not _nodes:
+            raise ValueError(f'No nodes: {_filepath}')
+
+        _all = cmds.ls(_nodes, long=True)
+        _roots = cmds.ls(_nodes, type='transform', long=True)
+
+        if len(_all) < len(set(_nodes)):
+            raise ValueError(f'Nodes are not found: {_filepath}')
+
+        _invalid.extend(sorted(set(_all) - set(_roots)))
+
+        _args = []
+        if (_start_frame is not None) and (_end_frame is not None):
+            _args.append(f'-frameRange {_start_frame} {_end_frame}')
+
+        _args.extend(options)
+        _args.extend(f'-root {_root}' for _root in _roots)
+        _args.append(f'-file "{_filepath.replace(chr(92), "/")}"')
+
+        _job_args.append(' '.join(_args))
+
+    if _invalid:
+        raise ValueError(f'Not transform nodes: {_invalid}')
+
+    for _dirname in {os.path.dirname(_job[0]) for _job in jobs}:
+        if _dirname:
+            os.makedirs(_dirname, exist_ok=True)
+
+    _start = time.perf_counter()
+    cmds.AbcExport(j=_job_args)
+    _time = time.perf_counter() - _start
+
+    _result = []
+
+    for _filepath, _nodes, _, _ in jobs:
+        _size = os.path.getsize(_filepath) if os.path.exists(_filepath) else None
+        _result.append({'filepath': _filepath, 'nodes': list(_nodes), 'size': _size, 'time': _time})
+
+        print(f'MDK | AbcExport | {_filepath} {(_size or 0) / 1024**2:.1f} MB')
+
+    print(f'MDK | AbcExport | {len(jobs)} jobs {_time:.2f} sec')
+
+    return _result
+
+
+def export_pointcache(filepath: str, nodes: list[str], start_frame: int, end_frame: int) -> str:
+    """ メッシュのポイント位置を mdk_pointcache 形式で書き出す
+
+    * オブジェクト名はネームスペースを除いたトランスフォーム名
+    * フレームごとにメモリにためずに追記する
+
+    Args:
+        filepath (str): 出力ファイル (.mdkpc)
+        nodes (list[str]): メッシュ、またはその親
+        start_frame (int): 開始フレーム
+        end_frame (int): 終了フレーム
+
+    Returns:
+        str: filepath
+    """
+    _meshes = _get_pointcache_targets(nodes)
+
+    if not _meshes:
+        raise ValueError('Select any meshes')
+
+    _fns = [_get_raw_mesh_fn(_mesh) for _mesh in _meshes.values()]
+    _objects = [(_name, _fn.numVertices()) for _name, _fn in zip(_meshes, _fns)]
+    _current_time = cmds.currentTime(q=True)
+
+    try:
+        with batch(undo=False):
+            with mdk_pointcache.PointCacheWriter(filepath, _objects, start_frame, end_frame) as _writer:
+                for _frame in range(int(start_frame), int(end_frame) + 1):
+                    cmds.currentTime(_frame, update=True)
+                    _writer.write_frame([_get_raw_points(_fn) for _fn in _fns])
+
+    finally:
+        cmds.currentTime(_current_time, update=True)
+
+    return filepath
+
+
+def export_cached(
+        export_func,
+        filepath: str,
+        nodes: list[str],
+        start_frame: int = None,
+        end_frame: int = None,
+        options: dict = None):
+    """ 書き出しキャッシュを使って書き出す
+
+    * 書き出しキャッシュ (mdk_cache.get_export_cache()) が無効なら export_func をそのまま呼ぶ
+    * フィンガープリントが一致すれば書き出さずにキャッシュを置く
+
+    Args:
+        export_func (callable): export_func(filepath, nodes, start_frame, end_frame)
+        options (dict, optional): フィンガープリントに含める書き出しオプション
+    """
+    _cache = mdk_cache.get_export_cache()
+
+    if _cache is None:
+        return export_func(filepath, nodes, start_frame, end_frame)
+
+    _key = get_export_key(filepath, nodes, start_frame, end_frame, options=options)
+
+    if _cache.get(_key, filepath):
+        print(f'MDK | Export cache hit | {filepath}')
+        return
+
+    _cache.release(filepath)
+    _result = export_func(filepath, nodes, start_frame, end_frame)
+
+    if os.path.isfile(filepath):
+        _cache.put(_key, filepath)
+
+    return _result
+
+
+def bulk_import(filepath_list: list[str], namespace: str|list[str]=None, undo: bool=True) -> list:
+    """ 複数ファイルを一括でインポート
+
+    * batch() の中で全ファイルをインポートする
+    * ネームスペースは最初にまとめて作成する
+
+    Args:
+        filepath_list (list[str]): インポートするファイルリスト
+        namespace (str|list[str], optional): 全ファイル共通、またはファイルごとのネームスペース
+        undo (bool): アンドゥを記録するか
+
+    Returns:
+        list: import_file() の戻り値のリスト
+    """
+    if isinstance(namespace, (list, tuple)):
+        if len(namespace) != len(filepath_list):
+            raise ValueError('namespace and filepath_list must be the same length')
+
+        _namespaces = list(namespace)
 
     else:
-        frames = f'-frameRange {start_frame} {end_frame}'
-    if nodes and cmds.nodeType(nodes[0]) == "transform":
-        name = nodes[0]
-        if name.find("|")!= -1:
-            name = name.rsplit("|",1)[1]
-
-        nodes = "".join([" -root "+x for x in nodes])
-        mel_cmd = f'AbcExport -j "{frames} -stripNamespaces -uvWrite{nodes} -file {filepath}"'
-
-        # Make directory
-        dirname = os.path.dirname(filepath)
-        if not os.path.exists(dirname):
-            os.makedirs(dirname)
-        
-        try:
-            mel.eval(mel_cmd)
-        except Exception as ex:
-            raise ValueError (ex)
-        
+        _namespaces = [namespace] * len(filepath_list)
+
+    _result = []
+    _start = time.perf_counter()
+
+    with batch(undo=undo):
+        _existing = set(cmds.namespaceInfo(':', listOnlyNamespaces=True, recurse=True, absoluteName=True) or [])
+
+        for _namespace in dict.fromkeys(_namespaces):
+            if _namespace and f':{_namespace}' not in _existing:
+                cmds.namespace(add=f':{_namespace}')
+
+        for _filepath, _namespace in zip(filepath_list, _namespaces):
+            if _namespace:
+                _filepath = mdk_cache.cache_path(_filepath)
+
+                if not os.path.exists(_filepath):
+                    raise FileNotFoundError(f'File is not found. {_filepath}')
+
+                _result.append(cmds.file(_filepath, i=True, mergeNamespacesOnClash=False, namespace=_namespace))
+
+            else:
+                _result.append(import_file(_filepath))
+
+    print(f'MDK | Bulk Import | {len(filepath_list)} files {time.perf_counter() - _start:.2f} sec')
+
+    return _result
 
 
 def import_file(filepath, namespace=None):    
+    filepath = mdk_cache.cache_path(filepath)
+
     if os.path.exists(filepath):
         file, ext = os.path.splitext(filepath)
 
@@ -549,6 +1521,36 @@ def import_file(filepath, namespace=None):
         raise FileNotFoundError()
 
 
+def import_pointcache(filepath: str, nodes: list[str]|dict=None, frame: int=None) -> list[str]:
+    """ ポイントキャッシュのフレームをメッシュに読み込む
+
+    * 名前(ネームスペースなし)が一致するメッシュのポイント位置をセットする
+    * ファイルはmemmapで開いたまま使い回す。ファイルが更新されていれば開き直す
+
+    Args:
+        filepath (str): ポイントキャッシュ (.mdkpc)
+        nodes (list[str], optional): 対象のメッシュ、またはその親。省略時は選択しているノード
+        frame (int, optional): フレーム。省略時は現在のフレーム
+
+    Returns:
+        list[str]: 読み込んだオブジェクト名
+    """
+    _cache = mdk_pointcache.open_cache(filepath)
+    _meshes = nodes if isinstance(nodes, dict) else _get_pointcache_targets(nodes)
+
+    if frame is None:
+        frame = cmds.currentTime(q=True)
+
+    _result = []
+
+    for _name, _mesh in _meshes.items():
+        if _name in _cache.objects:
+            set_points(_mesh, _cache.get_points(frame, _name))
+            _result.append(_name)
+
+    return _result
+
+
 def import_texture(filepath: str, colorspace=None):
     """ テクスチャをインポート 
     
@@ -556,6 +1558,7 @@ def import_texture(filepath: str, colorspace=None):
         filepath (str): テクスチャファイルパス
         colorspace (str, optional): カラー空間. Defaults to None.
     """
+    filepath = mdk_cache.cache_path(filepath)
     node_name = pathlib.Path(filepath).stem
     # file_node = cmds.shadingNode('file', asShader=True, name=node_name)
     file_node = cmds.shadingNode('file', asShader=True)
@@ -576,8 +1579,31 @@ def import_texture(filepath: str, colorspace=None):
     return file_node
 
 
-def import_usd(filepath: str, namespace: str=None):
-    cmds.file(filepath, i=True, type='USD Import', preserveReferences=True)
+def import_usd(filepath: str, namespace: str=None, proxy: bool=False):
+    """ USDファイルの読み込み
+
+    * proxy=True の場合はMayaのノードに変換せず、payloadをアンロードした
+      mayaUsdProxyShape を作成する。必要な部分は load_payloads() で読み込む
+
+    Returns:
+        str: proxy=True の場合はプロキシシェイプ
+    """
+    filepath = mdk_cache.cache_path(filepath)
+
+    if not proxy:
+        cmds.file(filepath, i=True, type='USD Import', preserveReferences=True)
+        return
+
+    _name = namespace or re.sub(r'\W', '_', pathlib.Path(filepath).stem)
+    _transform = cmds.createNode('transform', name=_name)
+    _shape = cmds.createNode('mayaUsdProxyShape', name=f'{_transform}Shape', parent=_transform)
+
+    # ステージが開かれる前に設定する
+    cmds.setAttr(f'{_shape}.loadPayloads', False)
+    cmds.setAttr(f'{_shape}.filePath', filepath, type='string')
+    cmds.connectAttr('time1.outTime', f'{_shape}.time')
+
+    return cmds.ls(_shape, long=True)[0]
 
 
 def is_image(filepath: str) -> tuple:
@@ -594,13 +1620,12 @@ def is_usd(filepath: str) -> tuple:
 
 def open_dir():
     """ Plugin Builtin Function """
-    _nodes = get_selected_nodes()
+    _nodes = get_selected_handles()
     if _nodes:
         for _node in _nodes:
-            if cmds.nodeType(_node) in FILE_NODES_LIST:
-                if cmds.nodeType(_node) == 'file':
-                    _filepath = cmds.getAttr(f'{_node}.fileTextureName')
-                    open_in_explorer(_filepath)
+            if _node.type_name == 'file':
+                _filepath = cmds.getAttr(f'{_node.name}.fileTextureName')
+                open_in_explorer(_filepath)
             
     else:
         _filepath = get_filepath()
@@ -636,12 +1661,55 @@ def open_folder(filepath):
 
 
 
-def open_file(filepath, recent=False):
-    """ Plugin Builtin Function """
+def open_file(filepath, recent=False, deferred=False, profile: str=None):
+    """ Plugin Builtin Function
+
+    * profile を指定した場合は OPEN_PROFILE_DICT の設定で開き、optionVarは開いた後に元に戻す
+    * scriptNodeを実行しない場合も、フレームレンジ (playbackOptions) は
+      sceneConfigurationScriptNode だけを実行して読み込む
+
+    Args:
+        filepath (str): 開くファイル
+        recent (bool): 最近使ったファイルに追加するか
+        deferred (bool): True の場合はリファレンスをアンロードのまま開く
+        profile (str, optional): 'full' / 'fast_inspect'
+    """
+    if profile is not None and profile not in OPEN_PROFILE_DICT:
+        raise ValueError(f'Invalid profile: {profile}')
+
+    _profile = OPEN_PROFILE_DICT.get(profile or 'full')
+    _flags = dict(_profile['flags'])
+
+    if deferred:
+        _flags['loadReferenceDepth'] = 'none'
+
     if recent:
         add_recent_file(filepath)
 
-    cmds.file(filepath, open=True, force=True)
+    _option_vars = {}
+    for _name, _value in _profile['option_vars'].items():
+        if cmds.optionVar(exists=_name):
+            _option_vars[_name] = cmds.optionVar(q=_name)
+
+        cmds.optionVar(iv=(_name, _value))
+
+    _start = time.perf_counter()
+
+    try:
+        cmds.file(filepath, open=True, force=True, **_flags)
+
+        if _profile.get('scene_config') and cmds.objExists('sceneConfigurationScriptNode'):
+            mel.eval(cmds.getAttr('sceneConfigurationScriptNode.before') or '')
+            _SETTINGS_CACHE.clear()
+
+    finally:
+        for _name in _profile['option_vars']:
+            if _name in _option_vars:
+                cmds.optionVar(iv=(_name, _option_vars[_name]))
+            else:
+                cmds.optionVar(remove=_name)
+
+    print(f'MDK | Open File | profile={profile or "full"} {time.perf_counter() - _start:.2f} sec')
 
 
 def open_in_explorer(filepath: str):
@@ -662,26 +1730,176 @@ def open_in_explorer(filepath: str):
         else:
             subprocess.Popen(["xdg-open", filepath])
     else:
-        raise FileNotFoundError(f'File is not found.')
+        raise FileNotFoundError(f'File is not found.')
+
+
+def reference_file(filepath: str, namespace: str=None, deferred: bool=False):
+    """ ファイルをリファレンス
+
+    Updated 2024/02/14 Yamagishi
+        * namaspcae 判定に or namespace == '' を追加
+
+    Args:
+        plugin(object): パイプライン用Mayaプラグインクラス
+        filepath(str): リファレンスするファイル
+        namespace(:obj:`str`, optional): namespace=None
+        deferred(bool): True の場合はアンロード状態で作成し、load_references() で読み込む
+    """
+    # cmds.createReference(filepath, ns=namespace)
+    filepath = mdk_cache.cache_path(filepath)
+    
+    if (namespace is None) or (namespace ==''):
+        namespace = ':'
+
+    return cmds.file(
+                filepath,
+                reference=True,
+                deferReference=deferred,
+                mergeNamespacesOnClash=True,
+                namespace=namespace)
+
+
+def get_references(loaded: bool=None) -> list[str]:
+    """ リファレンスノードを取得
+
+    Args:
+        loaded (bool, optional): True: ロード済みのみ, False: アンロードのみ, None: すべて
+
+    Returns:
+        list[str]: リファレンスノードリスト
+    """
+    _result = []
+
+    for _node in cmds.ls(type='reference') or []:
+        if _node == 'sharedReferenceNode' or _node.endswith('_UNKNOWN_REF_NODE_'):
+            continue
+
+        try:
+            _is_loaded = cmds.referenceQuery(_node, isLoaded=True)
+        except RuntimeError:
+            continue
+
+        if loaded is None or _is_loaded == loaded:
+            _result.append(_node)
+
+    return _result
+
+
+def load_references(reference_nodes: list[str]=None, pattern: str=None) -> list[dict]:
+    """ アンロード状態のリファレンスをまとめて読み込む
+
+    * batch() の中で読み込むので、ビューポートの更新は最後に一度だけ
+
+    Args:
+        reference_nodes (list[str], optional): 読み込むリファレンスノード。None の場合はアンロード中のすべて
+        pattern (str, optional): リファレンスノード名、またはファイルパスに対するfnmatchパターン
+
+    Returns:
+        list[dict]: {'reference', 'filepath', 'time'(sec), 'memory'(MB)} のリスト
+    """
+    if reference_nodes is None:
+        reference_nodes = get_references(loaded=False)
+
+    _result = []
+
+    with batch(undo=False):
+        for _node in reference_nodes:
+            _filepath = cmds.referenceQuery(_node, filename=True, withoutCopyNumber=True)
+
+            if pattern and not (fnmatch.fnmatch(_node, pattern) or fnmatch.fnmatch(_filepath, pattern)):
+                continue
+
+            _memory = cmds.memory(heapMemory=True, megaByte=True)
+            _start = time.perf_counter()
+
+            cmds.file(loadReference=_node)
+
+            _result.append({
+                'reference': _node,
+                'filepath': _filepath,
+                'time': time.perf_counter() - _start,
+                'memory': cmds.memory(heapMemory=True, megaByte=True) - _memory,
+            })
+
+    for _item in _result:
+        print(f'MDK | Load Reference | {_item["reference"]} {_item["time"]:.2f} sec {_item["memory"]:+.1f} MB')
+
+    return _result
+
+
+def load_payloads(node: str, pattern: str='*', unload: bool=False) -> list[str]:
+    """ プロキシシェイプのpayloadをプリムパスのパターンで読み込む
+
+    * 対象をまとめて LoadAndUnload するので、再コンポジションは一度だけ
+
+    Args:
+        node (str): mayaUsdProxyShape、またはそのトランスフォーム
+        pattern (str): プリムパスのfnmatchパターン (例: '/city/block_01/*')
+        unload (bool): True の場合はアンロードする
+
+    Returns:
+        list[str]: 対象のプリムパス
+    """
+    _shapes = cmds.ls(node, long=True, type='mayaUsdProxyShape') \
+        or cmds.listRelatives(node, shapes=True, fullPath=True, type='mayaUsdProxyShape')
+
+    if not _shapes:
+        raise TypeError(f'Not mayaUsdProxyShape: {node}')
+
+    _stage = mayaUsd.ufe.getStage(f'|world{_shapes[0]}')
+    _paths = {Sdf.Path(_path) for _path in mdk_scene.find_payload_paths(_stage, pattern)}
+
+    if unload:
+        _stage.LoadAndUnload(set(), _paths)
+    else:
+        _stage.LoadAndUnload(_paths, set())
 
+    return sorted(str(_path) for _path in _paths)
 
-def reference_file(filepath: str, namespace: str=None):
-    """ ファイルをリファレンス
 
-    Updated 2024/02/14 Yamagishi
-        * namaspcae 判定に or namespace == '' を追加
+def release_pointcache(filepath: str=None):
+    """ 開いたままのポイントキャッシュを閉じる
 
     Args:
-        plugin(object): パイプライン用Mayaプラグインクラス
-        filepath(str): リファレンスするファイル
-        namespace(:obj:`str`, optional): namespace=None
+        filepath (str, optional): ポイントキャッシュ。省略時は全て閉じる
     """
-    # cmds.createReference(filepath, ns=namespace)
-    
-    if (namespace is None) or (namespace ==''):
-        namespace = ':'
+    mdk_pointcache.release(filepath)
+
+
+def sample(nodes: list[str], attrs: list[str], frame_range: tuple=None, step: float=1.0) -> np.ndarray:
+    """ フレームレンジのアトリビュート値をまとめて取得
+
+    * MDGContext で各フレームを評価するので、カレントタイムは変わらない
+    * 列は nodes x attrs の順。translate などのコンパウンドは子アトリビュートに展開する
+    * 角度と距離はUIの単位で返す (getAttr と同じ)
+
+    Args:
+        nodes (list[str]): ノード
+        attrs (list[str]): アトリビュート
+        frame_range (tuple, optional): (start, end) または get_framerange() の4つ。
+            省略時は get_frame_range()
+        step (float): フレームの間隔
 
-    return cmds.file(filepath, reference=True, mergeNamespacesOnClash=True, namespace=namespace)
+    Returns:
+        np.ndarray: [フレーム, アトリビュート] の float64
+    """
+    if frame_range is None:
+        frame_range = get_frame_range()
+
+    _frames = np.arange(frame_range[0], frame_range[-1] + step * 0.5, step)
+    _readers = _get_sample_readers(nodes, attrs)
+    _result = np.empty((len(_frames), len(_readers)), dtype=np.float64)
+    _unit = om2.MTime.uiUnit()
+
+    for _index, _frame in enumerate(_frames):
+        _guard = om2.MDGContextGuard(om2.MDGContext(om2.MTime(float(_frame), _unit)))
+
+        try:
+            _result[_index] = [_reader() for _reader in _readers]
+        finally:
+            del _guard
+
+    return _result
 
 
 def save_file(filepath: str, mkdir=False, recent=False):
@@ -696,6 +1914,7 @@ def save_file(filepath: str, mkdir=False, recent=False):
 
 
     cmds.file(rename=filepath)
+    _SETTINGS_CACHE.clear()     # rename だけでは保存のコールバックが呼ばれない
 
     filename, ext = os.path.splitext(filepath)
     if ext.lower() == '.mb':
@@ -730,9 +1949,394 @@ def save_selection(filepath: str):
 
     
 
+def start_end_infinity(nodes: str|list[str], start_frame: float, end_frame: float, attrs: list[str]=ATTR_LIST) -> list[str]:
+    """ ノードのアニメーションカーブのスタートとエンドのキーの接線とInfinityをまとめて設定
+
+    * 接続しているカーブは listConnections() 1回で集める
+    * 対象は animCurveTA / animCurveTL (移動と回転)
+    * keyTangent と setInfinity はカーブ全体に1回ずつ
+    * グラフエディタがある場合のみ Infinity を表示する
+
+    Args:
+        nodes (str|list[str]): ノード
+        start_frame (float): スタートフレーム
+        end_frame (float): エンドフレーム
+        attrs (list[str]): アトリビュート
+
+    Returns:
+        list[str]: 設定したアニメーションカーブ
+    """
+    if isinstance(nodes, str):
+        nodes = [nodes]
+
+    _plugs = [f'{_node}.{_attr}' for _node in nodes for _attr in attrs]
+    _curves = cmds.listConnections(_plugs, source=True, destination=False, type='animCurve') or []
+    _curves = cmds.ls(sorted(set(_curves)), type=['animCurveTA', 'animCurveTL'])
+
+    if not _curves:
+        return []
+
+    cmds.keyTangent(_curves, edit=True, time=[(start_frame, start_frame), (end_frame, end_frame)], itt='spline', ott='spline')
+    cmds.setInfinity(_curves, pri='linear', poi='linear')
+
+    if not cmds.about(batch=True) and cmds.animCurveEditor('graphEditor1GraphEd', exists=True):
+        cmds.animCurveEditor('graphEditor1GraphEd', edit=True, displayInfinities='on')
+        cmds.optionVar(intValue=('graphEditorDisplayInfinities', 1))
+
+    return _curves
+
+
+def _get_dag_path(node: str) -> om2.MDagPath:
+    """ ノード名から MDagPath を取得 """
+    _selection = om2.MSelectionList()
+    _selection.add(node)
+
+    return _selection.getDagPath(0)
+
+
+def _get_dag_path1(node: str) -> om1.MDagPath:
+    """ ノード名から OpenMaya 1.0 の MDagPath を取得 """
+    _selection = om1.MSelectionList()
+    _selection.add(node)
+
+    _dag = om1.MDagPath()
+    _selection.getDagPath(0, _dag)
+
+    return _dag
+
+
+def _get_file_stats(nodes: list[str]) -> list[tuple]:
+    """ ファイル名のアトリビュート (usedAsFilename) のファイルの更新日時とサイズ (get_export_key() 用)
+
+    * AlembicNode、cacheFile、gpuCache、file などのファイルを同じパスで上書きした場合も変わる
+    """
+    if not nodes:
+        return []
+
+    _selection = om2.MSelectionList()
+
+    for _node in nodes:
+        _selection.add(_node)
+
+    _result = []
+
+    for _index in range(_selection.length()):
+        _fn = om2.MFnDependencyNode(_selection.getDependNode(_index))
+
+        for _attr_index in range(_fn.attributeCount()):
+            _attr = om2.MFnAttribute(_fn.attribute(_attr_index))
+
+            if not _attr.usedAsFilename or not _attr.parent.isNull():
+                continue
+
+            _plug = _fn.findPlug(_attr.object(), False)
+            _plugs = [_plug.elementByPhysicalIndex(_i) for _i in range(_plug.numElements())] if _plug.isArray else [_plug]
+
+            for _plug in _plugs:
+                _filepath = os.path.expandvars(_plug.asString())
+
+                try:
+                    _stat = os.stat(_filepath)
+                    _result.append((_filepath, _stat.st_mtime_ns, _stat.st_size))
+                except OSError:
+                    _result.append((_filepath, None, None))
+
+    return _result
+
+
+def _get_mesh_fn(node: str, frame: float=None) -> om2.MFnMesh:
+    """ MFnMesh を取得
+
+    * frame を指定した場合は MDGContext でそのフレームの outMesh を評価する
+    """
+    _dag = _get_dag_path(node)
+
+    if frame is None:
+        return om2.MFnMesh(_dag)
+
+    if _dag.apiType() == om2.MFn.kTransform:
+        _dag.extendToShape()
+
+    _plug = om2.MFnDependencyNode(_dag.node()).findPlug('outMesh', False)
+    _guard = om2.MDGContextGuard(om2.MDGContext(om2.MTime(frame, om2.MTime.uiUnit())))
+
+    try:
+        return om2.MFnMesh(_plug.asMObject())
+    finally:
+        del _guard
+
+
+def _get_raw_mesh_fn(node: str, frame: float=None) -> om1.MFnMesh:
+    """ OpenMaya 1.0 の MFnMesh を取得 (getRawPoints() 用)
+
+    * frame を指定した場合はそのフレームの outMesh を評価する
+    """
+    _dag = _get_dag_path1(node)
+
+    if frame is None:
+        return om1.MFnMesh(_dag)
+
+    if _dag.apiType() == om1.MFn.kTransform:
+        _dag.extendToShape()
+
+    _plug = om1.MFnDependencyNode(_dag.node()).findPlug('outMesh', False)
+    _context = om1.MDGContext(om1.MTime(frame, om1.MTime.uiUnit()))
+
+    return om1.MFnMesh(_plug.asMObject(_context))
+
+
+def _get_raw_points(fn: om1.MFnMesh) -> np.ndarray:
+    """ MFnMesh.getRawPoints() のバッファを [ポイント, 3] の float32 として返す
+
+    * コピーしないので、メッシュが変わる前に使い終わること
+    """
+    _count = fn.numVertices() * 3
+
+    if not _count:
+        return np.zeros((0, 3), dtype=np.float32)
+
+    _buffer = (ctypes.c_float * _count).from_address(int(fn.getRawPoints()))
+
+    return np.frombuffer(_buffer, dtype=np.float32).reshape(-1, 3)
+
+
+def _to_array(values, dtype, width: int=1) -> np.ndarray:
+    """ MFloatVectorArray, MIntArray などを numpy の配列にする
+
+    * np.array() は要素ごとに形状を調べるので遅い。平らにして np.fromiter() で読む
+    """
+    if width == 1:
+        return np.fromiter(values, dtype=dtype, count=len(values))
+
+    _values = itertools.chain.from_iterable(values)
+
+    return np.fromiter(_values, dtype=dtype, count=len(values) * width).reshape(-1, width)
+
+
+def _get_world_matrix(node: str, frame: float=None) -> np.ndarray:
+    """ 4x4 のワールド行列を取得 (行ベクトル)
+
+    * frame を指定した場合は現在の時間を変えずにそのフレームで評価する
+    """
+    _dag = _get_dag_path(node)
+
+    if frame is None:
+        return np.array(list(_dag.inclusiveMatrix()), dtype=np.float64).reshape(4, 4)
+
+    if _dag.apiType() == om2.MFn.kTransform:
+        _dag.extendToShape()
+
+    return np.array(
+        cmds.getAttr(f'{_dag.fullPathName()}.worldMatrix', time=frame), dtype=np.float64).reshape(4, 4)
+
+
+def _get_mesh_key(node: str) -> str:
+    """ メッシュのポイント位置、トポロジー、UVのキー (get_export_key() 用) """
+    _raw_fn = _get_raw_mesh_fn(node)
+    _fn = _get_mesh_fn(node)
+    _counts, _ids = _fn.getVertices()
+
+    _values = [_get_raw_points(_raw_fn), _to_array(_counts, np.int32), _to_array(_ids, np.int32)]
+
+    for _uv_set in _fn.getUVSetNames():
+        _u, _v = _fn.getUVs(_uv_set)
+        _uv_counts, _uv_ids = _fn.getAssignedUVs(_uv_set)
+        _values.extend([
+            _uv_set,
+            _to_array(_u, np.float32),
+            _to_array(_v, np.float32),
+            _to_array(_uv_counts, np.int32),
+            _to_array(_uv_ids, np.int32),
+        ])
+
+    return mdk_cache.get_key(*_values)
+
+
+def _get_non_default_values(nodes: list[str]) -> list[list[str]]:
+    """ ノードごとにデフォルト値でないアトリビュートを setAttr コマンドの形で取得
+
+    * .ma に保存されるものと同じ (MPlug.getSetAttrCmds())
+      デフォーマのウェイト、ブレンドシェイプのターゲット、polySmooth の分割数なども入る
+    """
+    if not nodes:
+        return []
+
+    _selection = om2.MSelectionList()
+
+    for _node in nodes:
+        _selection.add(_node)
+
+    _result = []
+
+    for _index in range(_selection.length()):
+        _fn = om2.MFnDependencyNode(_selection.getDependNode(_index))
+        _values = []
+
+        for _attr_index in range(_fn.attributeCount()):
+            _attr = om2.MFnAttribute(_fn.attribute(_attr_index))
+
+            if not _attr.parent.isNull() or not _attr.storable:
+                continue
+
+            _plug = _fn.findPlug(_attr.object(), False)
+            _values.extend(_plug.getSetAttrCmds(om2.MPlug.kNonDefault))
+
+        _result.append(_values)
+
+    return _result
+
+
+def _get_pointcache_targets(nodes: list[str]=None) -> dict[str, str]:
+    """ ポイントキャッシュの対象メッシュを取得
+
+    Returns:
+        dict[str, str]: {ネームスペースなしのトランスフォーム名: メッシュ}
+    """
+    if nodes is None:
+        nodes = cmds.ls(sl=True, long=True)
+
+    _result = {}
+
+    for _mesh in cmds.ls(nodes, dag=True, type='mesh', noIntermediate=True, long=True):
+        _transform = _mesh.rsplit('|', 1)[0]
+        _result[_transform.rsplit('|', 1)[-1].rsplit(':', 1)[-1]] = _mesh
+
+    return _result
+
+
+def _get_sample_readers(nodes: list[str], attrs: list[str]) -> list:
+    """ sample() 用に、プラグの値をUIの単位で返す関数のリストを作る """
+    _selection = om2.MSelectionList()
+
+    for _node in nodes:
+        for _attr in attrs:
+            _selection.add(f'{_node}.{_attr}')
+
+    _plugs = []
+
+    for _index in range(_selection.length()):
+        _plug = _selection.getPlug(_index)
+
+        if _plug.isCompound:
+            _plugs.extend(_plug.child(_child) for _child in range(_plug.numChildren()))
+        else:
+            _plugs.append(_plug)
+
+    _readers = [functools.partial(_get_plug_value, _plug) for _plug in _plugs]
+
+    return _readers
+
+
 # ======================================= #
 # Class
 # ======================================= #
+class ImportQueue(mdk_queue.ImportQueue):
+    """ idleEvent の scriptJob で少しずつ読み込むインポートキュー
+
+    * 1回の tick() は batch() でまとめる
+    """
+    _job = None
+
+    def import_file(self, filepath: str):
+        return import_file(filepath)
+
+
+    def _start(self):
+        self._job = cmds.scriptJob(idleEvent=self.tick)
+
+
+    def _stop(self):
+        if self._job is not None:
+            # 自分のコールバック内では削除できないので遅延実行する
+            maya.utils.executeDeferred(cmds.scriptJob, kill=self._job, force=True)
+            self._job = None
+
+
+    def _tick_context(self):
+        return batch()
+
+
+class NodeHandle:
+    """ MObjectHandle を持つノードハンドル
+
+    * 名前やタイプ名は必要になったときに取る
+    * ノードがリネーム、リペアレントされても同じノードを指す
+
+    Args:
+        mobject (om2.MObject): ノード
+        dag_path (om2.MDagPath, optional): インスタンスの場合のパス
+    """
+    __slots__ = ('_handle', '_dag_path')
+
+    def __init__(self, mobject: om2.MObject, dag_path: om2.MDagPath=None):
+        self._handle = om2.MObjectHandle(mobject)
+        self._dag_path = dag_path
+
+
+    def __eq__(self, other):
+        return isinstance(other, NodeHandle) and self._handle == other._handle
+
+
+    def __hash__(self):
+        return self._handle.hashCode()
+
+
+    def __repr__(self):
+        return f'NodeHandle({self.name!r})'
+
+
+    def __str__(self):
+        return self.name
+
+
+    @property
+    def name(self) -> str:
+        """ フルパス """
+        return self.get_name(long=True)
+
+
+    @property
+    def object(self) -> om2.MObject:
+        if not self._handle.isValid():
+            raise RuntimeError('Node is deleted')
+
+        return self._handle.object()
+
+
+    @property
+    def type_name(self) -> str:
+        return om2.MFnDependencyNode(self.object).typeName
+
+
+    def get_dag_path(self) -> om2.MDagPath:
+        """ MDagPath を取得。DAGノードでなければ None """
+        if self._dag_path is not None and self._dag_path.isValid():
+            return self._dag_path
+
+        _object = self.object
+
+        if _object.hasFn(om2.MFn.kDagNode):
+            return om2.MDagPath.getAPathTo(_object)
+
+
+    def get_name(self, long: bool=True) -> str:
+        """ 名前を取得
+
+        Args:
+            long (bool): True: フルパス, False: ノード名のみ
+        """
+        _dag = self.get_dag_path()
+
+        if _dag is None:
+            return om2.MFnDependencyNode(self.object).name()
+
+        return _dag.fullPathName() if long else _dag.partialPathName()
+
+
+    def is_valid(self) -> bool:
+        return self._handle.isValid()
+
+
 class AppMain:
     def __init__(self):
         pass
@@ -755,7 +2359,7 @@ class AppMain:
             
         # Alembicキャッシュを適用
         print(f'Apply Alembic Cache: {filepath}')
-        cmds.AbcImport(filepath, mode="import", connect=_selection[0])
+        return apply_alembic_caches(filepath, cmds.ls(_selection, long=True))
         # cmds.AbcImport(filepath, mode="import", rpr=_selection[0], merge=True)
 
 
@@ -802,6 +2406,102 @@ class AppMain:
     #             raise ValueError (ex)
 
 
+    def export_abc(
+                self,
+                filepath: str,
+                nodes: list[str],
+                startframe=None,
+                endframe=None):
+        """ Plugin Builtin Function """
+        return export_abc(filepath, nodes, startframe, endframe)
+
+
+    def export_abc_farm(
+                self,
+                dirpath: str,
+                nodes: list[str],
+                startframe: int,
+                endframe: int,
+                max_workers: int = mdk_farm.MAX_WORKERS,
+                executable: str|list[str] = None) -> list[str]:
+        """ バックグラウンドの mayapy でAlembicをアセットごとに並列で書き出す
+
+        Args:
+            dirpath (str): 出力フォルダ。<dirpath>/<アセット名>.abc に書き出す
+                (mdk_farm.get_asset_names()。同じノード名があればフルパスから作る)
+            nodes (list[str]): ルートノード
+            executable (str|list[str], optional): ワーカーの実行ファイル
+
+        Returns:
+            list[str]: 書き出したファイルリスト
+        """
+        if not nodes:
+            raise ValueError('Select any nodes')
+
+        _scene = self.get_farm_scene(dirpath)
+
+        return mdk_farm.export_abc_assets(
+            _scene,
+            dirpath,
+            cmds.ls(nodes, long=True),
+            startframe,
+            endframe,
+            max_workers=max_workers,
+            executable=executable,
+        )
+
+
+    def export_camera(self, node: str, filepath: str, frame_range: tuple=None) -> str:
+        """ カメラをカメラファイル (mdk_camera) に書き出す
+
+        * カメラシェイプは sample()、ワールド行列は getAttr(time=...) で取るので、
+          カレントタイムは変わらない
+        * 行列はシーンのアップ軸から Y-up に変換して書き出す
+
+        Args:
+            node (str): カメラ、またはそのトランスフォーム
+            filepath (str): 出力ファイル (.npz)
+            frame_range (tuple, optional): (start, end)。省略時は get_frame_range()
+
+        Returns:
+            str: filepath
+        """
+        _shape = self.get_camera_shape(node)
+
+        if not _shape:
+            raise ValueError(f'Camera is not found: {node}')
+
+        if frame_range is None:
+            frame_range = get_frame_range()
+
+        _transform = cmds.listRelatives(_shape, parent=True, fullPath=True)[0]
+        _frames = np.arange(frame_range[0], frame_range[-1] + 1)
+
+        _values = sample(
+            [_shape],
+            ['focalLength', 'horizontalFilmAperture', 'verticalFilmAperture', 'nearClipPlane', 'farClipPlane'],
+            (_frames[0], _frames[-1]),
+        )
+        _matrix = np.array(
+            [cmds.getAttr(f'{_transform}.worldMatrix', time=_frame) for _frame in _frames], dtype=np.float64)
+
+        # worldMatrix は内部単位 (cm)、クリップはUIの単位
+        _clip_scale = om2.MDistance(1.0, om2.MDistance.uiUnit()).asCentimeters()
+
+        return mdk_camera.write(
+            filepath,
+            _frames,
+            mdk_camera.convert_up_axis(_matrix.reshape(-1, 4, 4), cmds.upAxis(q=True, axis=True), 'y'),
+            _values[:, 0],
+            _values[:, 1:3] * 25.4,
+            _values[:, 3:5] * _clip_scale,
+            name=_transform.rsplit('|', 1)[-1].rsplit(':', 1)[-1],
+            fps=get_fps(),
+            meters_per_unit=0.01,
+            source=NAME,
+        )
+
+
     def export_fbx(
                 self,
                 filepath: str,
@@ -848,8 +2548,22 @@ class AppMain:
                     filepath: str,
                     nodes: list[str],
                     startframe=None,
-                    endframe=None):
-        
+                    endframe=None,
+                    cache=True):
+        """ Plugin Builtin Function
+
+        * cache=True の場合は書き出しキャッシュを使う (export_cached())
+        """
+        if cache:
+            return export_cached(
+                functools.partial(self.export_nodes, cache=False),
+                filepath,
+                nodes,
+                startframe,
+                endframe,
+                options={'func': 'export_nodes', 'abc': ABC_EXPORT_OPTIONS},
+            )
+
         if self.is_abc(filepath):
             self.export_abc(filepath, nodes, startframe, endframe)
         
@@ -871,18 +2585,30 @@ class AppMain:
                 filepath: str,
                 nodes: list[str],
                 startframe=None,
-                endframe=None):
+                endframe=None,
+                cache=True):
         
         """ Export USD Selection
 
         * Reference from:
             - https://zenn.dev/remiria/articles/9ac3e31df4da98ba2f0b
             - https://github.com/Autodesk/maya-usd/blob/dev/lib/mayaUsd/commands/Readme.md
-        
+
+        * cache=True の場合は書き出しキャッシュを使う (export_cached())
         """
         if not nodes:
             raise ValueError('Select any nodes')
 
+        if cache:
+            return export_cached(
+                functools.partial(self.export_usd, cache=False),
+                filepath,
+                nodes,
+                startframe,
+                endframe,
+                options={'func': 'export_usd', 'exportInstances': True},
+            )
+
 
         cmds.select(nodes)
         if (startframe is None) or (endframe is None):
@@ -898,6 +2624,45 @@ class AppMain:
             )
 
 
+    def export_usd_farm(
+                self,
+                filepath: str,
+                nodes: list[str],
+                startframe: int,
+                endframe: int,
+                chunk_size: int = mdk_farm.DEFAULT_CHUNK_SIZE,
+                max_workers: int = mdk_farm.MAX_WORKERS,
+                executable: str|list[str] = None) -> str:
+        """ バックグラウンドの mayapy でUSDをフレームチャンクごとに並列で書き出す
+
+        * チャンクはバリュークリップとして filepath にまとめる
+
+        Args:
+            filepath (str): 出力するUSDファイル
+            nodes (list[str]): 書き出すノード
+            chunk_size (int): 1チャンクのフレーム数
+            executable (str|list[str], optional): ワーカーの実行ファイル
+
+        Returns:
+            str: filepath
+        """
+        if not nodes:
+            raise ValueError('Select any nodes')
+
+        _scene = self.get_farm_scene(os.path.dirname(filepath))
+
+        return mdk_farm.export_usd_chunks(
+            _scene,
+            filepath,
+            cmds.ls(nodes, long=True),
+            startframe,
+            endframe,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            executable=executable,
+        )
+
+
     def get_all_lights(self) -> list[str]:
         """
         typeList = [
@@ -910,11 +2675,31 @@ class AppMain:
         
         """
         _exclude_classifications = 'light/vloume:light/filter:hidden'
-        _type_list = cmds.listNodeTypes('light', exclude=_exclude_classifications)
+        _type_list = get_node_types('light', exclude=_exclude_classifications)
         
-        return cmds.ls(type=_type_list)
+        return cmds.ls(type=list(_type_list)) if _type_list else []
     
 
+    def get_farm_scene(self, dirpath: str) -> str:
+        """ ワーカーに渡すシーンファイルを取得
+
+        * 保存済みで未変更なら現在のファイルを使う (チェックポイントから再開できる)
+        * それ以外は dirpath に一時シーンを書き出す
+        """
+        _filepath = get_filepath()
+
+        if _filepath and not cmds.file(q=True, modified=True):
+            return _filepath
+
+        _stem = pathlib.Path(_filepath).stem if _filepath else 'untitled'
+        _scene = os.path.join(dirpath, f'{_stem}.mdkfarm.ma').replace('\\', '/')
+
+        os.makedirs(dirpath, exist_ok=True)
+        cmds.file(_scene, exportAll=True, type='mayaAscii', preserveReferences=True, force=True)
+
+        return _scene
+
+
     def get_camera_shape(self, node: str) -> str:
         """ カメラのシェイプノードを取得 """
         if cmds.objectType(node, isType='camera'):
@@ -1016,14 +2801,14 @@ class AppMain:
 
         if _render == 'vray':
             vray_setting = 'vraySettings'
-            _width = cmds.getAttr(f'{vray_setting}.width')
-            _height = cmds.getAttr(f'{vray_setting}.height')
+            _width = get_attr(vray_setting, 'width')
+            _height = get_attr(vray_setting, 'height')
 
             return _width, _height
         
         else:
-            _width = cmds.getAttr('defaultResolution.width')
-            _height = cmds.getAttr('defaultResolution.height')
+            _width = get_attr('defaultResolution', 'width')
+            _height = get_attr('defaultResolution', 'height')
 
             return _width, _height
 
@@ -1032,7 +2817,47 @@ class AppMain:
 
 
 
+    def import_camera(self, filepath: str, name: str=None) -> str:
+        """ カメラファイル (mdk_camera) からキー付きのカメラを作る
+
+        * キーは set_keys() でアトリビュートごとにまとめてセットする
+        * フィルムバックは最初のフレームの値を set_aperture_size() でセットする
+
+        Returns:
+            str: カメラのトランスフォーム
+        """
+        _data = mdk_camera.load(filepath, up_axis=cmds.upAxis(q=True, axis=True), meters_per_unit=0.01)
+        _frames = _data['frames']
+
+        _transform, _shape = cmds.camera(name=name or _data['header']['name'])
+        self.set_aperture_size(*_data['film_back'][0], camera=_shape)
+
+        _keys = {
+            _transform: {
+                'translateX': _data['translate'][:, 0],
+                'translateY': _data['translate'][:, 1],
+                'translateZ': _data['translate'][:, 2],
+                'rotateX': np.radians(_data['rotate'][:, 0]),
+                'rotateY': np.radians(_data['rotate'][:, 1]),
+                'rotateZ': np.radians(_data['rotate'][:, 2]),
+            },
+            _shape: {
+                'focalLength': _data['focal_length'],
+                'nearClipPlane': _data['clip'][:, 0],
+                'farClipPlane': _data['clip'][:, 1],
+            },
+        }
+
+        for _node, _attrs in _keys.items():
+            for _attr, _values in _attrs.items():
+                set_keys(_node, _attr, _frames, _values)
+
+        return _transform
+
+
     def import_file(self, filepath, namespace=None):    
+        filepath = mdk_cache.cache_path(filepath)
+
         if os.path.exists(filepath):
             file, ext = os.path.splitext(filepath)
 
@@ -1065,8 +2890,7 @@ class AppMain:
         
 
     def import_files(self, filepath_list: list[str], namespace=None):
-        for _filepath in filepath_list:
-            self.import_file(_filepath, namespace=namespace)
+        return bulk_import(filepath_list, namespace=namespace)
 
 
     # def import_texture(self, filepath, colorspace=None):
@@ -1118,7 +2942,7 @@ class AppMain:
         ノードを選択していなければ、現在のファイルのフォルダ
         ノードを選択していれば、ノードタイプに基づいたフォルダを開く
         """
-        _nodes = cmds.ls(sl=True)
+        _nodes = get_selected_handles()
 
         if len(_nodes)==0:
             _filepath = self.get_filepath()
@@ -1128,10 +2952,10 @@ class AppMain:
         else:
             for _node in _nodes:
                 _filepath = None
-                _node_type = cmds.nodeType(_node)
+                _node_type = _node.type_name
 
                 if _node_type == 'file':
-                    _filepath = cmds.getAttr(f'{_node}.fileTextureName')
+                    _filepath = cmds.getAttr(f'{_node.name}.fileTextureName')
 
                     if _filepath:
                         open_in_explorer(_filepath)
@@ -1141,15 +2965,16 @@ class AppMain:
 
 
 
-    def reference_files(self, filepath_list: list[str], namespace: str=None):
+    def reference_files(self, filepath_list: list[str], namespace: str=None, deferred: bool=False):
         """ 複数ファイルをリファレンス
 
         Args:
             filepaths(list[str]): リファレンスするファイルリスト
             namespace(:obj:`str`, optional): namespace=None
+            deferred(bool): True の場合はアンロード状態で作成
         """
-        for _filepath in filepath_list:
-            self.reference_file(_filepath, namespace=namespace)
+        with batch():
+            return [reference_file(_filepath, namespace=namespace, deferred=deferred) for _filepath in filepath_list]
 
 
     def select_nodes(self, nodes: list[str]):
@@ -1161,19 +2986,25 @@ class AppMain:
         cmds.select(nodes, r=True)
 
 
-    def set_aperture_size(self, width: float, height: float):
+    def set_aperture_size(self, width: float, height: float, camera: str=None):
         """ カメラのアパーチャサイズを設定
         
         Args:
             width(float): 幅(mm)
             height(float): 高さ(mm)
+            camera(str, optional): カメラ。省略時は選択しているカメラ
         """
-        _camera_shape = self.get_camera_shape_from_selection()
+        if camera is None:
+            _camera_shape = self.get_camera_shape_from_selection()
+        else:
+            _camera_shape = self.get_camera_shape(camera)
 
         if _camera_shape:
-            cmds.setAttr(f'{_camera_shape}.horizontalFilmAperture', width / 25.4)
-            cmds.setAttr(f'{_camera_shape}.verticalFilmAperture', height / 25.4)
-            cmds.setAttr(f'{_camera_shape}.filmFit', 1)
+            set_attrs({
+                (_camera_shape, 'horizontalFilmAperture'): width / 25.4,
+                (_camera_shape, 'verticalFilmAperture'): height / 25.4,
+                (_camera_shape, 'filmFit'): 1,
+            })
 
 
     def set_camera_image_plane(self, filepath: str):
@@ -1181,10 +3012,12 @@ class AppMain:
         _camera_shape = self.get_camera_shape_from_selection()
         _plane = self.get_imageplane(_camera_shape, create=True)
 
-        cmds.setAttr(f'{_plane}.imageName', filepath, type='string')
-        cmds.setAttr(f'{_plane}.useFrameExtension', 1)
-        cmds.setAttr(f'{_plane}.ignoreColorSpaceFileRules', 1)
-        cmds.setAttr(f'{_plane}.colorSpace', 'sRGB - Texture', type='string')
+        set_attrs({
+            (_plane, 'imageName'): filepath,
+            (_plane, 'useFrameExtension'): 1,
+            (_plane, 'ignoreColorSpaceFileRules'): 1,
+            (_plane, 'colorSpace'): 'sRGB - Texture',
+        })
 
 
     def set_fps(self, value: int):
@@ -1271,59 +3104,53 @@ class AppMain:
 
         if _renderer == 'vray':
             vray_setting = 'vraySettings'
-            cmds.setAttr(f'{vray_setting}.imageFileNamePrefix', value, type='string')
+            set_attr(vray_setting, 'imageFileNamePrefix', value)
 
         elif _renderer == 'arnold':
             _arnold_render_globals = 'defaultRenderGlobals'
-            cmds.setAttr(f'{_arnold_render_globals}.imageFilePrefix', value, type='string')
+            set_attr(_arnold_render_globals, 'imageFilePrefix', value)
 
         else:
             _default_render_globals = 'defaultRenderGlobals'
-            cmds.setAttr(f'{_default_render_globals}.imageFilePrefix', value, type='string')
+            set_attr(_default_render_globals, 'imageFilePrefix', value)
 
 
 
     def set_render_size(self, width, height):
         print(f'set render size = {width} x {height}')
 
-        cmds.setAttr("defaultResolution.aspectLock", 0)
         renderer = self.get_render()
 
         if renderer == 'vray':
             vray_setting = 'vraySettings'
-            cmds.setAttr(f'{vray_setting}.aspectLock', 0)
-            cmds.setAttr(f'{vray_setting}.width', width)
-            cmds.setAttr(f'{vray_setting}.height', height)
-            cmds.setAttr(f'{vray_setting}.pixelAspect', 1.0)
-            cmds.setAttr(f'{vray_setting}.aspectLock', True)
+            set_attrs([
+                (('defaultResolution', 'aspectLock'), 0),
+                ((vray_setting, 'aspectLock'), 0),
+                ((vray_setting, 'width'), width),
+                ((vray_setting, 'height'), height),
+                ((vray_setting, 'pixelAspect'), 1.0),
+                ((vray_setting, 'aspectLock'), True),
+            ])
 
         else:
             default_resolution = 'defaultResolution'
-            cmds.setAttr(f'{default_resolution}.width', int(width))
-            cmds.setAttr(f'{default_resolution}.height', int(height))
+            set_attrs({
+                (default_resolution, 'aspectLock'): 0,
+                (default_resolution, 'width'): int(width),
+                (default_resolution, 'height'): int(height),
+            })
 
 
 
 
 
-    def start_end_infinity(self, node, start_frame, end_frame):
+    def start_end_infinity(self, node: str|list[str], start_frame, end_frame):
         """ 
         nodeのスタートとエンドInfityを設定
+
+        * start_end_infinity() を参照
         """
-        # animation key edit
-        for attr in ATTR_LIST:
-            cam_connection = cmds.connectionInfo(node + '.' + attr, sourceFromDestination=True)
-            if cam_connection:
-                object_type = cmds.objectType(cam_connection)
-                if object_type == 'animCurveTA' or 'animCurveTL':
-                    cmds.selectKey(clear=True)
-                    anim_key = cam_connection.split('.', 1)[0]
-                    cmds.selectKey(anim_key, add=True, time=(start_frame, start_frame), keyframe=True)
-                    cmds.selectKey(anim_key, add=True, time=(end_frame, end_frame), keyframe=True)
-                    cmds.keyTangent(e=True, itt='spline', ott='spline')  # start/end tangent type spline
-                    cmds.setInfinity(pri='linear', poi='linear')  # start/end infinity setting
-
-        mel.eval("animCurveEditor -edit -displayInfinities true graphEditor1GraphEd; optionVar -intValue graphEditorDisplayInfinities true;")
+        start_end_infinity(node, start_frame, end_frame)
     
 
     def warning_dialog(self, message: str):
@@ -0,0 +1,79 @@
+""" mdk_modifier
+
+* MDGModifier をアンドゥキューに載せるためのMayaプラグイン (OpenMaya 2.0)
+* mdk_maya.set_attrs() が読み込んで使う。直接は使わない
+* 渡したい MDGModifier を共有モジュールの pending に積んでから mdkModifier コマンドを実行する
+  プラグインは Maya が別のモジュールとして読み込むので、sys.modules の共有モジュールでやりとりする
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+"""
+
+import sys
+import types
+
+import maya.api.OpenMaya as om2
+
+
+COMMAND_NAME = 'mdkModifier'
+SHARED_NAME = '_mdk_modifier_shared'
+
+
+def get_shared() -> types.ModuleType:
+    """ mdk_maya とプラグインで共有するモジュール """
+    _shared = sys.modules.get(SHARED_NAME)
+
+    if _shared is None:
+        _shared = types.ModuleType(SHARED_NAME)
+        _shared.pending = []
+        sys.modules[SHARED_NAME] = _shared
+
+    return _shared
+
+
+def maya_useNewAPI():
+    pass
+
+
+class ModifierCommand(om2.MPxCommand):
+    """ pending の MDGModifier を実行し、アンドゥ、リドゥを受け持つ """
+    def __init__(self):
+        super().__init__()
+        self._modifier = None
+
+
+    @staticmethod
+    def creator():
+        return ModifierCommand()
+
+
+    def doIt(self, args):
+        _shared = get_shared()
+
+        if not _shared.pending:
+            raise RuntimeError('No pending modifier')
+
+        self._modifier = _shared.pending.pop(0)
+        self._modifier.doIt()
+
+
+    def isUndoable(self):
+        return True
+
+
+    def redoIt(self):
+        self._modifier.doIt()
+
+
+    def undoIt(self):
+        self._modifier.undoIt()
+
+
+def initializePlugin(plugin):
+    om2.MFnPlugin(plugin, 'MedakaVFX', '0.0.1').registerCommand(COMMAND_NAME, ModifierCommand.creator)
+
+
+def uninitializePlugin(plugin):
+    om2.MFnPlugin(plugin).deregisterCommand(COMMAND_NAME)
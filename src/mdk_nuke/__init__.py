@@ -8,6 +8,20 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.0.3 [v0.3.0] 2026-10-19 Tatsuya Yamagishi
+        * added: collect_files()
+        * added: open_file(profile=...)
+        * added: connect_viewers()
+        * added: import_sequences()
+        * changed: import_files() は画像・ジオメトリを import_sequences() で読み込む
+        * added: ImportQueue
+        * added: sample()
+        * added: set_keys()
+        * added: export_camera(), import_camera() (mdk_camera)
+        * added: AppMain.set_aperture_size()
+        * added: シーン設定のキャッシュ (get_filepath())。
+          スクリプトの読み込み、保存、クローズでクリアする
+
     * v0.0.2 [v0.2.0] 2025-12-15 Tatsuya Yamagishi
         * added: get_frame_range()
 
@@ -15,18 +29,26 @@ Release Note:
         * added: new
 """
 
-VERSION = 'v0.0.2'
+VERSION = 'v0.0.3'
 NAME = 'mdk_nuke'
 
 import os
 import pathlib
 import platform
 import re
+import struct
 import subprocess
 import sys
+import time
 
 import nuke
 import nukescripts
+import numpy as np
+
+from .. import mdk_cache
+from .. import mdk_camera
+from .. import mdk_queue
+from .. import mdk_scene
 
 try: 
     from PySide2 import QtWidgets
@@ -58,10 +80,62 @@ EXT_LIST = [
 
 FILE_NODES_LIST = ['Read', 'Write', 'ReadGeo2', ]
 
+FILE_FILTER_GEO = re.compile(r'.+\.(abc|fbx|obj|usd|usda|usdc|usdz)$', re.IGNORECASE)
+FILE_FILTER_READ = re.compile(r'.+\.(exr|dpx|png|jpeg|jpg|tif|tiff|tga|hdr|mov|mp4|mxf)$', re.IGNORECASE)
 FILE_FILTER_SCRIPT = re.compile(r'.+\.(py)')
 
+OPEN_PROFILE_DICT = {
+    'full': {
+        'root_knobs': {},
+        'viewers': True,
+    },
+    'fast_inspect': {
+        'root_knobs': {'proxy': True},
+        'viewers': False,
+    },
+}
+
 SCRIPT_EXT_LIST = ['.py', '.nk']
 
+IMPORT_GRID = {
+    'columns': 10,
+    'width': 120,
+    'height': 150,
+}
+
+_SETTINGS_CACHE = mdk_cache.SettingsCache()
+_VIEWER_INPUTS = {}
+
+
+
+# ======================================= #
+# Callbacks
+# ======================================= #
+def _clear_settings_cache():
+    """ シーン設定のキャッシュをクリアするコールバック
+
+    * Root の knobChanged はUIの変更でしか呼ばれないので、fps とフレームレンジはキャッシュしない
+    """
+    _SETTINGS_CACHE.clear()
+
+
+def _add_settings_callbacks():
+    """ コールバックを登録。reload した場合は前のコールバックを外す """
+    _old = globals().get('_SETTINGS_CALLBACK')
+
+    if _old is not None:
+        nuke.removeOnScriptLoad(_old)
+        nuke.removeOnScriptSave(_old)
+        nuke.removeOnScriptClose(_old)
+
+    nuke.addOnScriptLoad(_clear_settings_cache)
+    nuke.addOnScriptSave(_clear_settings_cache)
+    nuke.addOnScriptClose(_clear_settings_cache)
+
+    globals()['_SETTINGS_CALLBACK'] = _clear_settings_cache
+
+
+_add_settings_callbacks()
 
 
 # ======================================= #
@@ -83,6 +157,7 @@ def get_fps() -> float:
     """
     return nuke.root()['fps'].value()
 
+@_SETTINGS_CACHE.cached
 def get_filepath() -> str:
     """ 現在開いているファイルパスを取得 
     
@@ -162,9 +237,50 @@ def set_frame_range(first: int, last: int):
     nuke.root()['last_frame'].setValue(int(last))
 
 
+def set_keys(knob, frames, values, index: int=0):
+    """ キーをまとめてセット
+
+    * 既存のキーは消し、AnimationCurve.addKey() で1回でセットする。補間はリニア
+
+    Args:
+        knob (nuke.Array_Knob): ノブ
+        frames (np.ndarray|list): フレーム
+        values (np.ndarray|list): 値
+        index (int): 配列のインデックス
+    """
+    knob.clearAnimated(index)
+    knob.setAnimated(index)
+
+    _curve = knob.animation(index)
+    _curve.addKey([nuke.AnimationKey(float(_frame), float(_value)) for _frame, _value in zip(frames, values)])
+    _curve.changeInterpolation(_curve.keys(), nuke.LINEAR)
+
+    return _curve
+
+
 # ======================================= #
 # Functins
 # ======================================= #
+def collect_files() -> list[str]:
+    """ スクリプトが参照している外部ファイルを取得
+
+    * FILE_NODES_LIST のノードのファイルパス
+    * mdkapps.package() の files に渡す
+
+    Returns:
+        list[str]: ファイルパスリスト
+    """
+    _result = []
+
+    for _node in nuke.allNodes(recurseGroups=True):
+        if _node.Class() in FILE_NODES_LIST:
+            _filepath = nuke.filename(_node)
+
+            if _filepath:
+                _result.append(_filepath)
+
+    return list(dict.fromkeys(_result))
+
 def create_playblast(
         filepath: str,
         size: list|tuple=None,
@@ -181,6 +297,84 @@ def create_playblast(
 
     raise RuntimeError('未実装')
 
+def export_camera(node, filepath: str, frame_range: tuple=None, meters_per_unit: float=1.0) -> str:
+    """ カメラをカメラファイル (mdk_camera) に書き出す
+
+    * sample() と world_matrix ノブの getValueAt() で取るので、カレントフレームは変わらない
+
+    Args:
+        node (nuke.Node|str): カメラノード、またはノード名
+        filepath (str): 出力ファイル (.npz)
+        frame_range (tuple, optional): (start, end)。省略時は get_frame_range()
+        meters_per_unit (float): Nukeの1単位のメートル (cm なら 0.01)
+
+    Returns:
+        str: filepath
+    """
+    if isinstance(node, str):
+        node = nuke.toNode(node)
+
+    if frame_range is None:
+        frame_range = get_frame_range()
+
+    _frames = np.arange(frame_range[0], frame_range[-1] + 1)
+    _values = sample([node], ['focal', 'haperture', 'vaperture', 'near', 'far'], (_frames[0], _frames[-1]))
+
+    # world_matrix は列ベクトル (4列目が移動) なので転置する
+    _knob = node['world_matrix']
+    _matrix = np.array(
+        [[_knob.getValueAt(_frame, _index) for _index in range(16)] for _frame in _frames],
+        dtype=np.float64,
+    ).reshape(-1, 4, 4).transpose(0, 2, 1)
+
+    return mdk_camera.write(
+        filepath,
+        _frames,
+        _matrix,
+        _values[:, 0],
+        _values[:, 1:3],
+        _values[:, 3:5],
+        name=node.name(),
+        fps=get_fps(),
+        meters_per_unit=meters_per_unit,
+        source=NAME,
+    )
+
+
+def import_camera(filepath: str, name: str=None, meters_per_unit: float=1.0):
+    """ カメラファイル (mdk_camera) からキー付きのカメラを作る
+
+    * キーは set_keys() でノブごとにまとめてセットする
+    * アパーチャは最初のフレームの値を AppMain.set_aperture_size() でセットする
+
+    Args:
+        filepath (str): カメラファイル
+        name (str, optional): ノード名
+        meters_per_unit (float): Nukeの1単位のメートル (cm なら 0.01)
+
+    Returns:
+        nuke.Node: カメラノード
+    """
+    _data = mdk_camera.load(filepath, up_axis='y', meters_per_unit=meters_per_unit)
+    _frames = _data['frames']
+
+    _node = nuke.nodes.Camera2(name=name or _data['header']['name'])
+    _node['rot_order'].setValue('XYZ')
+    _node['xform_order'].setValue('SRT')
+
+    AppMain().set_aperture_size(*_data['film_back'][0], camera=_node)
+
+    for _index in range(3):
+        set_keys(_node['translate'], _frames, _data['translate'][:, _index], _index)
+        set_keys(_node['rotate'], _frames, _data['rotate'][:, _index], _index)
+
+    set_keys(_node['focal'], _frames, _data['focal_length'])
+    set_keys(_node['near'], _frames, _data['clip'][:, 0])
+    set_keys(_node['far'], _frames, _data['clip'][:, 1])
+
+    return _node
+
+
 def import_file(filepath: str):
     """ ファイルの読み込み
     
@@ -203,8 +397,96 @@ def import_file(filepath: str):
         raise TypeError('"Filepath" type is not str')
 
 def import_files(filepath_list: list[str]):
+    """ 複数ファイルの読み込み
+
+    * 画像・ムービー・ジオメトリは import_sequences() でまとめて読み込む
+    """
+    _read_files = [_filepath for _filepath in filepath_list if is_read_file(_filepath)]
+    _result = import_sequences(_read_files) if _read_files else []
+
     for _filepath in filepath_list:
-        import_file(_filepath)
+        if not is_read_file(_filepath):
+            _result.extend(import_file(_filepath))
+
+    return _result
+
+
+def import_sequences(filepath_list: list[str]|str, columns: int=None) -> list:
+    """ 画像・ジオメトリを Read / ReadGeo2 ノードとして読み込む
+
+    * tcl drop を使わず nuke.nodes で直接ノードを作成する
+    * 連番はまとめて1つのReadにし、フレームレンジとフォーマットはファイルヘッダーから設定する
+    * ムービーとジオメトリは連番にせず、1ファイルずつ読み込む
+    * ノードは既存ノードの下にグリッド状に一度で配置する
+
+    Args:
+        filepath_list (list[str]|str): ファイルリスト、またはフォルダ
+        columns (int, optional): グリッドの列数
+
+    Returns:
+        list: 作成したノードリスト
+    """
+    if isinstance(filepath_list, str):
+        if not os.path.isdir(filepath_list):
+            raise TypeError('"filepath_list" is not list or directory')
+
+        filepath_list = [
+            os.path.join(filepath_list, _name) for _name in sorted(os.listdir(filepath_list))
+        ]
+
+    _sequences = mdk_scene.find_sequences(
+        [_filepath for _filepath in filepath_list if is_read_file(_filepath)])
+
+    if columns is None:
+        columns = IMPORT_GRID['columns']
+
+    _nodes = nuke.allNodes()
+    _x = min((_node.xpos() for _node in _nodes), default=0)
+    _y = max((_node.ypos() for _node in _nodes), default=0) + IMPORT_GRID['height']
+
+    _formats = {(_format.width(), _format.height()): _format.name() for _format in nuke.formats()}
+    _result = []
+
+    nuke.Undo.begin('mdk import sequences')
+
+    try:
+        for _index, (_filepath, _first, _last) in enumerate(_sequences):
+            if FILE_FILTER_GEO.match(_filepath):
+                _node = nuke.nodes.ReadGeo2(file=_filepath)
+
+            else:
+                _node = nuke.nodes.Read(file=_filepath)
+
+                if _first is not None:
+                    for _knob in ('first', 'origfirst'):
+                        _node[_knob].setValue(_first)
+
+                    for _knob in ('last', 'origlast'):
+                        _node[_knob].setValue(_last)
+
+                _size = _read_image_size(_filepath, _first)
+
+                if _size:
+                    if _size not in _formats:
+                        _name = f'mdk_{_size[0]}x{_size[1]}'
+                        nuke.addFormat(f'{_size[0]} {_size[1]} 1.0 {_name}')
+                        _formats[_size] = _name
+
+                    _node['format'].setValue(_formats[_size])
+
+            _row, _column = divmod(_index, columns)
+            _node.setXYpos(_x + _column * IMPORT_GRID['width'], _y + _row * IMPORT_GRID['height'])
+            _result.append(_node)
+
+    finally:
+        nuke.Undo.end()
+
+    return _result
+
+
+def is_read_file(filepath: str):
+    """ Read / ReadGeo2 で読み込むファイル判定 """
+    return FILE_FILTER_READ.match(filepath) or FILE_FILTER_GEO.match(filepath)
 
 def open_dir(filepath) -> None:
     """
@@ -230,9 +512,66 @@ def open_dir(filepath) -> None:
         else:
             subprocess.Popen(["xdg-open", _filepath])
 
-def open_file(filepath):
-    """ Plugin Builtin Function """
+def connect_viewers():
+    """ disconnect_viewers() で外したViewerの入力を元に戻す """
+    for _name, _inputs in _VIEWER_INPUTS.items():
+        _viewer = nuke.toNode(_name)
+        if _viewer is None:
+            continue
+
+        for _index, _input_name in _inputs.items():
+            _input = nuke.toNode(_input_name)
+            if _input is not None:
+                _viewer.setInput(_index, _input)
+
+    _VIEWER_INPUTS.clear()
+
+
+def disconnect_viewers():
+    """ Viewerの入力を外してビューアの描画を止める
+
+    * 外した入力は connect_viewers() で戻せる
+    """
+    for _viewer in nuke.allNodes('Viewer'):
+        _inputs = {}
+
+        for _index in range(_viewer.inputs()):
+            _input = _viewer.input(_index)
+
+            if _input is not None:
+                _inputs[_index] = _input.fullName()
+                _viewer.setInput(_index, None)
+
+        if _inputs:
+            _VIEWER_INPUTS[_viewer.fullName()] = _inputs
+
+
+def open_file(filepath, profile: str=None):
+    """ Plugin Builtin Function
+
+    * profile を指定した場合は OPEN_PROFILE_DICT の設定で開く
+    * Root のノブは開いた後にセットする (スクリプトに保存された値より優先)
+
+    Args:
+        filepath (str): 開くファイル
+        profile (str, optional): 'full' / 'fast_inspect'
+    """
+    if profile is not None and profile not in OPEN_PROFILE_DICT:
+        raise ValueError(f'Invalid profile: {profile}')
+
+    _profile = OPEN_PROFILE_DICT.get(profile or 'full')
+
+    _start = time.perf_counter()
+
     nuke.scriptOpen(filepath)
+
+    for _name, _value in _profile['root_knobs'].items():
+        nuke.root()[_name].setValue(_value)
+
+    if not _profile['viewers']:
+        disconnect_viewers()
+
+    print(f'MDK | Open File | profile={profile or "full"} {time.perf_counter() - _start:.2f} sec')
     
 def open_in_explorer(filepath: str):
     """
@@ -255,6 +594,61 @@ def open_in_explorer(filepath: str):
         raise FileNotFoundError(f'File is not found.')
 
 
+def sample(nodes: list, attrs: list[str], frame_range: tuple=None, step: float=1.0) -> np.ndarray:
+    """ フレームレンジのノブの値をまとめて取得
+
+    * knob.getValueAt() で評価するので、カレントフレームは変わらない
+    * 列は nodes x attrs の順。translate などの配列ノブは要素に展開する
+
+    Args:
+        nodes (list[nuke.Node|str]): ノード、またはノード名
+        attrs (list[str]): ノブ名。'translate', 'translate[0]' など
+        frame_range (tuple, optional): (start, end)。省略時は get_frame_range()
+        step (float): フレームの間隔
+
+    Returns:
+        np.ndarray: [フレーム, ノブ] の float64
+    """
+    if frame_range is None:
+        frame_range = get_frame_range()
+
+    _frames = np.arange(frame_range[0], frame_range[-1] + step * 0.5, step)
+    _items = []
+
+    for _node in nodes:
+        if isinstance(_node, str):
+            _node = nuke.toNode(_node)
+
+        for _attr in attrs:
+            _match = re.match(r'(.+)\[(\d+)\]$', _attr)
+            _name, _index = (_match.group(1), int(_match.group(2))) if _match else (_attr, None)
+            _knob = _node.knob(_name)
+
+            if _knob is None:
+                raise ValueError(f'Knob is not found: {_node.fullName()}.{_name}')
+
+            if _index is not None:
+                _items.append((_knob, _index))
+            else:
+                _items.extend((_knob, _array_index) for _array_index in range(_knob.arraySize()))
+
+    return np.array(
+        [[_knob.getValueAt(_frame, _index) for _knob, _index in _items] for _frame in _frames],
+        dtype=np.float64,
+    ).reshape(len(_frames), len(_items))
+
+
+def _read_image_size(filepath: str, first: int=None) -> tuple[int, int]:
+    """ 連番の最初のファイルのヘッダーからサイズを取得 """
+    if first is not None:
+        filepath = re.sub(r'#+', lambda x: f'{first:0{len(x.group(0))}d}', filepath)
+
+    try:
+        return mdk_scene.read_image_size(filepath)
+    except (OSError, struct.error):
+        return None
+
+
 def save_file(filepath):
     """ ファイル保存 """
     nuke.scriptSaveAs(filepath, -1)
@@ -268,6 +662,15 @@ def save_selection(filepath):
 # ======================================= #
 # Class
 # ======================================= #
+class ImportQueue(mdk_queue.ImportQueue):
+    """ Qtタイマーで少しずつ読み込むインポートキュー """
+    def import_file(self, filepath: str):
+        if is_read_file(filepath):
+            return import_sequences([filepath])
+
+        return import_file(filepath)
+
+
 class AppMain:
     def __init__(self):
         pass
@@ -317,11 +720,23 @@ class AppMain:
 
 
 
-    def set_aperture_size(self, width: int, height: int):
+    def set_aperture_size(self, width: float, height: float, camera=None):
         """ Plugin Builtin Function
         * アパーチャーサイズを設定
+
+        Args:
+            width (float): 幅(mm)
+            height (float): 高さ(mm)
+            camera (nuke.Node, optional): カメラ。省略時は選択しているカメラ
         """
-        pass
+        if camera is None:
+            _nodes = [_node for _node in nuke.selectedNodes() if 'haperture' in _node.knobs()]
+        else:
+            _nodes = [camera]
+
+        for _node in _nodes:
+            _node['haperture'].setValue(float(width))
+            _node['vaperture'].setValue(float(height))
 
 
     def set_framerange(self, headin: int, cutin: int, cutout: int, tailout: int):
@@ -0,0 +1,414 @@
+""" mdk_package
+
+* シーンと外部ファイルを収集するPythonパッケージ
+* 外注への受け渡しやアーカイブ用
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: package()
+        * added: remap_references()
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_package'
+
+import collections
+import concurrent.futures
+import datetime
+import errno
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+
+from .. import mdk_deps
+from .. import mdk_scene
+
+try:
+    from pxr import Sdf, UsdUtils
+except ImportError:
+    Sdf = None
+    UsdUtils = None
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_package package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+CHUNK_SIZE = 8 * 1024**2
+FILES_DIRNAME = 'files'
+MANIFEST_NAME = 'manifest.json'
+MAX_WORKERS = 8
+TMP_EXT = '.mdktmp'
+
+# Nukeはスクリプトのフォルダからの相対パスをこの式で書く
+NK_SCRIPT_DIR = '[file dirname [value root.name]]'
+
+_NK_FILE_KNOB = re.compile(rb'^([ \t]*file[ \t]+)(.+?)([ \t]*)$', re.MULTILINE)
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def package(
+        scene: str,
+        dest: str,
+        files: list[str] = None,
+        max_workers: int = MAX_WORKERS,
+        hardlink: bool = True,
+    ) -> dict:
+    """ シーンと外部ファイルを dest に収集する
+
+    * files を省略した場合は mdk_deps.crawl() でシーンファイルから依存ファイルを解決する
+      DCC上では各モジュールの collect_files() の結果を渡す
+    * シーケンス表記のパスは実在するファイルに展開する
+    * 同じ内容のファイルは一度だけコピーし、残りはハードリンクにする
+    * シーンのフォルダ以下のファイルは dest 以下の同じ相対パスに置く
+      それ以外の外部ファイルは dest/files 以下に元のフォルダ構成のまま置く
+    * コピーした .ma / .nk / .usd の参照パスは、収集先への相対パスに書き換える
+      (remap_references())。書き換えた内容はマニフェストの remap に残す
+
+    Args:
+        scene (str): シーンファイル
+        dest (str): 出力先フォルダ
+        files (list[str], optional): 外部ファイルのリスト
+        max_workers (int): 並列コピー数
+        hardlink (bool): False の場合は重複ファイルもコピーする
+
+    Returns:
+        dict: マニフェスト (dest/manifest.json にも保存)
+    """
+    if not os.path.isfile(scene):
+        raise FileNotFoundError(f'File is not found. {scene}')
+
+    if files is None:
+        files = [_path for _path, _ in mdk_deps.crawl(scene, max_workers=max_workers)]
+
+    _scene = os.path.abspath(scene)
+    _dest = os.path.abspath(dest)
+    _root = os.path.dirname(_scene)
+
+    _sources = {_scene: get_package_path(_scene, _dest, _root)}
+    _missing = []
+
+    for _filepath in files:
+        _expanded = mdk_scene.expand_sequence(_filepath)
+        if not _expanded:
+            _missing.append(_filepath)
+
+        for _path in _expanded:
+            _path = os.path.abspath(_path)
+            _sources.setdefault(_path, get_package_path(_path, _dest, _root))
+
+    # 同じサイズのファイルだけハッシュを取って重複を判定する
+    _sizes = {_path: os.path.getsize(_path) for _path in _sources}
+    _hashes = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as _executor:
+        _by_size = collections.defaultdict(list)
+        for _path, _size in _sizes.items():
+            _by_size[_size].append(_path)
+
+        _candidates = [_path for _paths in _by_size.values() if len(_paths) > 1 for _path in _paths]
+        _hashes.update(zip(_candidates, _executor.map(get_file_hash, _candidates)))
+
+        # 内容ごとに最初のファイルをコピー、残りはリンク
+        _copies = {}
+        _links = {}
+
+        for _path in _sources:
+            _key = _hashes.get(_path) or _path
+
+            if hardlink and _key in _copies:
+                _links[_path] = _copies[_key]
+            else:
+                _copies.setdefault(_key, _path)
+
+        _copy_list = [_path for _path in _sources if _path not in _links]
+        list(_executor.map(lambda x: copy_file(x, _sources[x]), _copy_list))
+
+    for _path, _src in _links.items():
+        link_file(_sources[_src], _sources[_path])
+
+    # 参照パスを収集先に書き換える。ハードリンクは remap_references() で切れる
+    _packaged = {_normalize(_path): _dst for _path, _dst in _sources.items()}
+    _remaps = {}
+
+    for _path, _dst in _sources.items():
+        if mdk_deps.is_parsable(_path):
+            _mapping = _get_remap(_path, _dst, _packaged)
+
+            if _mapping:
+                remap_references(_dst, _mapping)
+                _remaps[_path] = _mapping
+
+    _manifest = {
+        'name': NAME,
+        'version': VERSION,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'scene': _scene,
+        'dest': _dest,
+        'files': [
+            {
+                'source': _path,
+                'path': os.path.relpath(_sources[_path], _dest).replace('\\', '/'),
+                'size': _sizes[_path],
+                'sha1': _hashes.get(_path),
+                'hardlink': _path in _links and _path not in _remaps,
+                'remap': _remaps.get(_path, {}),
+            }
+            for _path in _sources
+        ],
+        'missing': _missing,
+        'total_size': sum(_sizes.values()),
+    }
+
+    with open(os.path.join(_dest, MANIFEST_NAME), 'w', encoding='utf8') as f:
+        json.dump(_manifest, f, indent=4, ensure_ascii=False)
+
+    print(f'MDK | Package | {len(_sources)} files -> {_dest}')
+
+    if _missing:
+        print(f'MDK | Package | missing {len(_missing)} files')
+
+    return _manifest
+
+
+def copy_file(src: str, dst: str):
+    """ ファイルをコピー
+
+    * copy_file_range -> sendfile -> 通常コピーの順で試す
+    * 一時ファイルに書き込んでからリネームする
+    """
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    _tmp = f'{dst}.{os.getpid()}.{threading.get_ident()}{TMP_EXT}'
+
+    try:
+        with open(src, 'rb') as _fsrc, open(_tmp, 'wb') as _fdst:
+            _size = os.fstat(_fsrc.fileno()).st_size
+
+            if not _copy_kernel(_fsrc.fileno(), _fdst.fileno(), _size):
+                _fsrc.seek(0)
+                _fdst.seek(0)
+                _fdst.truncate()
+                shutil.copyfileobj(_fsrc, _fdst, CHUNK_SIZE)
+
+        shutil.copystat(src, _tmp)
+        os.replace(_tmp, dst)
+
+    finally:
+        if os.path.exists(_tmp):
+            os.remove(_tmp)
+
+
+def get_file_hash(filepath: str) -> str:
+    """ ファイルのsha1を取得 """
+    _hash = hashlib.sha1()
+
+    with open(filepath, 'rb') as f:
+        for _chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            _hash.update(_chunk)
+
+    return _hash.hexdigest()
+
+
+def get_package_path(filepath: str, dest: str, root: str = None) -> str:
+    """ 収集先のパスを取得
+
+    * root 以下のファイルは <dest>/<root からの相対パス>
+    * C:/a/b.abc -> <dest>/files/C/a/b.abc
+    * //server/share/b.abc -> <dest>/files/server/share/b.abc
+    """
+    if root is not None:
+        try:
+            _relpath = os.path.relpath(os.path.abspath(filepath), os.path.abspath(root))
+        except ValueError:
+            # Windows でドライブが違う
+            _relpath = None
+
+        if _relpath and _relpath != os.pardir and not _relpath.startswith(os.pardir + os.sep):
+            return os.path.join(dest, _relpath)
+
+    _filepath = os.path.abspath(filepath).replace('\\', '/')
+    _filepath = re.sub(r'^([A-Za-z]):', r'\1', _filepath).lstrip('/')
+
+    return os.path.join(dest, FILES_DIRNAME, _filepath)
+
+
+def link_file(src: str, dst: str):
+    """ ハードリンクを作成。できない場合はコピー """
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+
+    if os.path.exists(dst):
+        os.remove(dst)
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy_file(src, dst)
+
+
+def remap_references(filepath: str, mapping: dict[str, str]) -> str:
+    """ シーンファイルの参照パスを書き換える
+
+    * .ma は文字列リテラル、.nk は file ノブ、.usda はアセットパス (@...@) を置き換える
+    * バイナリのUSDは pxr がある場合のみ UsdUtils.ModifyAssetPaths で書き換える
+    * 一時ファイルに書いてからリネームするので、ハードリンクは元のファイルと切り離される
+
+    Args:
+        filepath (str): 書き換えるファイル
+        mapping (dict[str, str]): {書かれているパス: 新しいパス}
+
+    Returns:
+        str: filepath
+    """
+    with open(filepath, 'rb') as f:
+        _data = f.read()
+
+    if mdk_scene.is_ma(filepath):
+        for _old, _new in mapping.items():
+            _data = _data.replace(b'"' + _escape_ma(_old) + b'"', b'"' + _escape_ma(_new) + b'"')
+
+    elif mdk_scene.is_nk(filepath):
+        def _replace(match):
+            _value = mdk_scene._unquote_nk(match.group(2).decode('utf-8', 'replace'))
+
+            if _value not in mapping:
+                return match.group(0)
+
+            return match.group(1) + ('{' + mapping[_value] + '}').encode('utf-8') + match.group(3)
+
+        _data = _NK_FILE_KNOB.sub(_replace, _data)
+
+    elif mdk_scene.is_usd(filepath) and _data.startswith(b'#usda'):
+        for _old, _new in mapping.items():
+            _data = _data.replace(f'@{_old}@'.encode('utf-8'), f'@{_new}@'.encode('utf-8'))
+
+    elif mdk_scene.is_usd(filepath):
+        if UsdUtils is None:
+            print(f'MDK | Package | pxr is not found, skip remap: {filepath}')
+            return filepath
+
+        _layer = Sdf.Layer.FindOrOpen(filepath)
+        UsdUtils.ModifyAssetPaths(_layer, lambda x: mapping.get(x, x))
+        _layer.Export(f'{filepath}{TMP_EXT}')
+        os.replace(f'{filepath}{TMP_EXT}', filepath)
+
+        return filepath
+
+    else:
+        raise TypeError(f'MDK | Not supported file type: {filepath}')
+
+    _tmp = f'{filepath}.{os.getpid()}.{threading.get_ident()}{TMP_EXT}'
+
+    with open(_tmp, 'wb') as f:
+        f.write(_data)
+
+    shutil.copystat(filepath, _tmp)
+    os.replace(_tmp, filepath)
+
+    return filepath
+
+
+def _copy_kernel(src_fd: int, dst_fd: int, size: int) -> bool:
+    """ カーネル内でコピー (copy_file_range / sendfile)
+
+    Returns:
+        bool: False の場合は通常コピーにフォールバックする
+    """
+    _funcs = []
+
+    if hasattr(os, 'copy_file_range'):
+        _funcs.append(lambda offset, count: os.copy_file_range(src_fd, dst_fd, count, offset, offset))
+
+    if hasattr(os, 'sendfile'):
+        _funcs.append(lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count))
+
+    for _func in _funcs:
+        _offset = 0
+
+        try:
+            while _offset < size:
+                _sent = _func(_offset, min(CHUNK_SIZE, size - _offset))
+                if _sent == 0:
+                    break
+
+                _offset += _sent
+
+        except OSError as ex:
+            if ex.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK, errno.EBADF):
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+                continue
+
+            raise
+
+        if _offset == size:
+            return True
+
+    return False
+
+
+def _escape_ma(value: str) -> bytes:
+    """ .ma の文字列リテラルにエンコード (mdk_scene._unescape_ma() の逆) """
+    return value.replace('\\', '\\\\').replace('"', '\\"').encode('utf-8')
+
+
+def _get_remap(source: str, dst: str, packaged: dict[str, str]) -> dict[str, str]:
+    """ source に書かれている参照パスと、収集先 dst からの相対パスの対応を作る
+
+    * シーケンス表記のパスは、展開したファイルが収集されていれば書き換える
+    * 収集されていない参照 (見つからないファイル) はそのまま残す
+
+    Returns:
+        dict[str, str]: {書かれているパス: 新しいパス}
+    """
+    _result = {}
+
+    try:
+        _references = [_path for _, _path in mdk_scene.iter_references(source)]
+    except (OSError, TypeError):
+        return _result
+
+    for _value in _references:
+        _path = mdk_deps.resolve_path(_value, source)
+
+        if _normalize(_path) in packaged:
+            _target = packaged[_normalize(_path)]
+
+        else:
+            _expanded = mdk_scene.expand_sequence(_path)
+
+            if not _expanded or _normalize(_expanded[0]) not in packaged:
+                continue
+
+            # パターンの文字列はファイル名以外を収集先に合わせる
+            _target = os.path.join(
+                os.path.dirname(packaged[_normalize(_expanded[0])]), os.path.basename(_path))
+
+        _relpath = os.path.relpath(_target, os.path.dirname(dst)).replace('\\', '/')
+
+        if mdk_scene.is_nk(source):
+            _relpath = f'{NK_SCRIPT_DIR}/{_relpath}'
+
+        if _relpath != _value:
+            _result[_value] = _relpath
+
+    return _result
+
+
+def _normalize(filepath: str) -> str:
+    return os.path.normcase(os.path.normpath(os.path.abspath(filepath)))
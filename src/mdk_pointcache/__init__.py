@@ -0,0 +1,323 @@
+""" mdk_pointcache
+
+* DCC間で変形するジオメトリを受け渡すためのポイントキャッシュ (.mdkpc)
+* ヘッダーJSONとフレーム順の float32 配列を1ファイルに書く
+* 読み込みは np.memmap で、フレームごとにコピーなしのスライスを返す
+
+Format:
+    * MAGIC (8 byte) + ヘッダー長 (uint32 little endian) + ヘッダーJSON
+    * データは DATA_ALIGN バイト境界から [フレーム, ポイント, 3] の float32
+    * 複数オブジェクトはポイントを連結し、ヘッダーの objects に範囲を書く
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: PointCache
+        * added: PointCacheWriter
+        * added: open_cache(), release()
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_pointcache'
+
+import json
+import os
+import struct
+
+import numpy as np
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_pointcache package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+DATA_ALIGN = 64
+DTYPE = np.dtype('<f4')
+EXT = '.mdkpc'
+MAGIC = b'MDKPC001'
+TMP_EXT = '.mdktmp'
+
+_OPEN_DICT = {}   # {filepath: ((mtime, size), PointCache)}
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def _get_key(filepath: str) -> str:
+    return os.path.normcase(os.path.abspath(filepath))
+
+
+def open_cache(filepath: str) -> 'PointCache':
+    """ 開いたポイントキャッシュを使い回す
+
+    * ファイルの更新日時かサイズが変わっていれば開き直す
+    * 使い終わったら release() で閉じる
+    """
+    _key = _get_key(filepath)
+    _stat = os.stat(filepath)
+    _stamp = (_stat.st_mtime_ns, _stat.st_size)
+    _item = _OPEN_DICT.get(_key)
+
+    if _item is None or _item[0] != _stamp:
+        if _item is not None:
+            _item[1].close()
+
+        _item = (_stamp, PointCache(filepath))
+        _OPEN_DICT[_key] = _item
+
+    return _item[1]
+
+
+def read_header(filepath: str) -> dict:
+    """ ヘッダーを読み込む """
+    with open(filepath, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'Not mdk point cache: {filepath}')
+
+        _size, = struct.unpack('<I', f.read(4))
+        return json.loads(f.read(_size).decode('utf-8'))
+
+
+def release(filepath: str = None):
+    """ open_cache() で開いたキャッシュを閉じる
+
+    Args:
+        filepath (str, optional): ポイントキャッシュ。省略時は全て閉じる
+    """
+    if filepath is None:
+        _items = list(_OPEN_DICT.values())
+        _OPEN_DICT.clear()
+    else:
+        _item = _OPEN_DICT.pop(_get_key(filepath), None)
+        _items = [] if _item is None else [_item]
+
+    for _, _cache in _items:
+        _cache.close()
+
+
+def write(filepath: str, frames, start_frame: int, objects: list[tuple[str, int]] = None):
+    """ 配列をまとめて書き出す
+
+    Args:
+        filepath (str): 出力ファイル
+        frames (np.ndarray|list): [フレーム, ポイント, 3] の配列、またはフレームごとの配列のリスト
+        start_frame (int): 開始フレーム
+        objects (list[tuple[str, int]], optional): [(名前, ポイント数)]。省略時は1オブジェクト
+    """
+    _num_frames = len(frames)
+    _num_points = len(frames[0])
+
+    if objects is None:
+        objects = [('points', _num_points)]
+
+    with PointCacheWriter(filepath, objects, start_frame, start_frame + _num_frames - 1) as _writer:
+        if isinstance(frames, np.ndarray):
+            _writer.write_frames(frames)
+        else:
+            for _points in frames:
+                _writer.write_frame(_points)
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class PointCache:
+    """ ポイントキャッシュの読み込み
+
+    * ファイル全体を np.memmap で開くので、読んだフレームだけがメモリに乗る
+    * get_frame() / get_points() が返す配列は読み取り専用のビュー
+
+    Examples:
+        >>> with PointCache(filepath) as _cache:
+        ...     _points = _cache.get_points(1001, 'body')
+    """
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.header = read_header(filepath)
+
+        self.start_frame = self.header['start_frame']
+        self.end_frame = self.header['end_frame']
+        self.num_points = self.header['num_points']
+        self.objects = {
+            _object['name']: (_object['offset'], _object['offset'] + _object['count'])
+            for _object in self.header['objects']
+        }
+
+        self._data = np.memmap(
+            filepath,
+            dtype=DTYPE,
+            mode='r',
+            offset=self.header['data_offset'],
+            shape=(self.end_frame - self.start_frame + 1, self.num_points, 3),
+        )
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __len__(self):
+        return len(self._data)
+
+
+    def close(self):
+        """ memmapを手放す
+
+        * mmap は閉じない。返したビューが残っていれば、最後のビューが消えたときに解放される
+        """
+        self._data = None
+
+
+    def get_frame(self, frame: int) -> np.ndarray:
+        """ フレームの全ポイントを取得 ([ポイント, 3])
+
+        * 範囲外のフレームは最初/最後のフレームに丸める
+        """
+        _index = min(max(int(round(frame)) - self.start_frame, 0), len(self._data) - 1)
+        return self._data[_index]
+
+
+    def get_points(self, frame: int, name: str = None) -> np.ndarray:
+        """ オブジェクトのポイントを取得 ([ポイント, 3])
+
+        Args:
+            frame (int): フレーム
+            name (str, optional): オブジェクト名。省略時は最初のオブジェクト
+        """
+        if name is None:
+            name = self.header['objects'][0]['name']
+
+        _start, _end = self.objects[name]
+
+        return self.get_frame(frame)[_start:_end]
+
+
+class PointCacheWriter:
+    """ ポイントキャッシュの書き出し
+
+    * フレームごとに write_frame() で追記する。メモリにはためない
+    * 一時ファイルに書いてから close() でリネームする
+
+    Args:
+        filepath (str): 出力ファイル
+        objects (list[tuple[str, int]]): [(名前, ポイント数)]
+        start_frame (int): 開始フレーム
+        end_frame (int): 終了フレーム
+    """
+    def __init__(self, filepath: str, objects: list[tuple[str, int]], start_frame: int, end_frame: int):
+        self.filepath = filepath
+        self.start_frame = int(start_frame)
+        self.end_frame = int(end_frame)
+
+        _objects = []
+        _offset = 0
+
+        for _name, _count in objects:
+            _objects.append({'name': _name, 'offset': _offset, 'count': int(_count)})
+            _offset += int(_count)
+
+        self.num_points = _offset
+        self._frames = 0
+
+        _header = {
+            'name': NAME,
+            'version': VERSION,
+            'dtype': DTYPE.str,
+            'start_frame': self.start_frame,
+            'end_frame': self.end_frame,
+            'num_points': self.num_points,
+            'objects': _objects,
+            'data_offset': 0,
+        }
+
+        # data_offset の桁数でヘッダー長が変わるので2回計算する
+        for _ in range(2):
+            _size = len(json.dumps(_header).encode('utf-8'))
+            _header['data_offset'] = -(-(len(MAGIC) + 4 + _size) // DATA_ALIGN) * DATA_ALIGN
+
+        _bytes = json.dumps(_header).encode('utf-8')
+
+        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        self._tmp = f'{filepath}.{os.getpid()}{TMP_EXT}'
+        self._file = open(self._tmp, 'wb')
+        self._file.write(MAGIC + struct.pack('<I', len(_bytes)) + _bytes)
+        self._file.write(b'\0' * (_header['data_offset'] - self._file.tell()))
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, *args):
+        self.close(discard=exc_type is not None)
+
+
+    def close(self, discard: bool = False):
+        """ 書き出しを終了
+
+        Args:
+            discard (bool): True の場合は書き出したファイルを捨てる
+        """
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+
+        _num_frames = self.end_frame - self.start_frame + 1
+
+        if discard or self._frames != _num_frames:
+            os.remove(self._tmp)
+
+            if not discard:
+                raise ValueError(f'Frame count mismatch: {self._frames} / {_num_frames}')
+
+            return
+
+        # Windows では開いたままのファイルを置き換えられない
+        release(self.filepath)
+        os.replace(self._tmp, self.filepath)
+
+
+    def write_frame(self, points):
+        """ 1フレーム分のポイントを追記
+
+        Args:
+            points (np.ndarray|list): [ポイント, 3]。複数オブジェクトは連結したもの、
+                またはオブジェクトごとの配列のリスト
+        """
+        if isinstance(points, (list, tuple)) and points and np.ndim(points[0]) == 2:
+            points = np.concatenate(points)
+
+        _points = np.ascontiguousarray(points, dtype=DTYPE).reshape(-1, 3)
+
+        if len(_points) != self.num_points:
+            raise ValueError(f'Point count mismatch: {len(_points)} / {self.num_points}')
+
+        self._file.write(_points.tobytes())
+        self._frames += 1
+
+
+    def write_frames(self, frames: np.ndarray):
+        """ 複数フレームをまとめて追記 ([フレーム, ポイント, 3]) """
+        _frames = np.ascontiguousarray(frames, dtype=DTYPE)
+
+        if _frames.shape[1:] != (self.num_points, 3):
+            raise ValueError(f'Shape mismatch: {_frames.shape}')
+
+        self._file.write(_frames.tobytes())
+        self._frames += len(_frames)
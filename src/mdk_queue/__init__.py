@@ -0,0 +1,276 @@
+""" mdk_queue
+
+* DCCのアイドル時間に少しずつファイルを読み込むPythonパッケージ
+* 読み込み自体はメインスレッドで行い、ファイル判定・stat・ローカルキャッシュへの
+  プリフェッチはバックグラウンドスレッドで先行して行う
+* 各DCCモジュールの ImportQueue がアイドルコールバックを実装する
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: ImportQueue
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_queue'
+
+import contextlib
+import os
+import queue
+import threading
+import time
+
+from .. import mdk_cache
+from .. import mdk_scene
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_queue package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+DEFAULT_BUDGET = 0.05   # 1回のアイドルで使う秒数
+DEFAULT_INTERVAL = 0.01 # Qtタイマーの間隔(秒)
+
+STATUS_LIST = ['waiting', 'running', 'cancelled', 'finished']
+
+
+# ======================================= #
+# Class
+# ======================================= #
+class ImportQueue:
+    """ キャンセル可能な非同期インポートキュー
+
+    * start() でアイドルコールバックを登録し、tick() ごとに budget 秒まで読み込む
+    * 1回の tick() では最低1ファイルは読み込む
+    * 読み込みに失敗したファイルは errors に記録して次へ進む
+    * このクラスはQtタイマーで動く (スタンドアロン / Nuke)
+      各DCCモジュールのサブクラスは _start() / _stop() / import_file() を実装する
+
+    Args:
+        filepath_list (list[str]): 読み込むファイルリスト
+        import_func (callable, optional): 1ファイルを読み込む関数。省略時は import_file()
+        budget (float): 1回の tick() で使う秒数
+        prefetch (bool): ローカルキャッシュが有効ならバックグラウンドでキャッシュする
+        on_progress (callable, optional): on_progress(done, total, filepath)
+        on_finished (callable, optional): on_finished(queue)
+
+    Examples:
+        >>> _queue = mdkapps.ImportQueue(filepath_list, on_progress=print)
+        >>> _queue.start()
+        >>> _queue.cancel()
+    """
+    def __init__(
+            self,
+            filepath_list: list[str],
+            import_func=None,
+            budget: float = DEFAULT_BUDGET,
+            prefetch: bool = True,
+            on_progress=None,
+            on_finished=None,
+        ):
+        if import_func is None and type(self).import_file is ImportQueue.import_file:
+            raise TypeError(f'{type(self).__name__} requires import_func')
+
+        self.filepath_list = list(filepath_list)
+        self.import_func = import_func
+        self.budget = budget
+        self.prefetch = prefetch
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+
+        self.categories = {}    # {filepath: category}
+        self.errors = []    # [(filepath, exception)]
+        self.results = []
+        self.status = 'waiting'
+
+        self._cancel_event = threading.Event()
+        self._done = 0
+        self._ready = queue.Queue()
+        self._thread = None
+        self._timer = None
+
+
+    def cancel(self):
+        """ 読み込みを中止
+
+        * 読み込み中のファイルは最後まで読み込む
+        """
+        if self.status in ('cancelled', 'finished'):
+            return
+
+        self._cancel_event.set()
+        self._finish('cancelled')
+
+
+    def get_progress(self) -> tuple[int, int]:
+        """ 進捗を取得
+
+        Returns:
+            tuple[int, int]: (読み込み済み数, 全体数)
+        """
+        return self._done, len(self.filepath_list)
+
+
+    def import_file(self, filepath: str):
+        """ 1ファイルを読み込む。DCCモジュールのサブクラスで実装する
+
+        * 実装していないクラスは import_func が必須 (__init__ で確認する)
+        """
+        raise NotImplementedError(f'{type(self).__name__}.import_file() is not implemented')
+
+
+    def is_running(self) -> bool:
+        return self.status == 'running'
+
+
+    def run(self) -> list:
+        """ アイドルを待たずにすべて読み込む (バッチ処理用)
+
+        Returns:
+            list: 読み込み結果リスト
+        """
+        self._start_thread()
+
+        while self.status == 'running':
+            self.tick(wait=True)
+
+        return self.results
+
+
+    def start(self):
+        """ アイドルコールバックを登録して読み込みを開始 """
+        if self.status != 'waiting':
+            raise RuntimeError(f'Queue is already {self.status}')
+
+        self._start_thread()
+        self._start()
+
+
+    def tick(self, wait: bool = False) -> bool:
+        """ budget 秒まで読み込む
+
+        Args:
+            wait (bool): 準備済みのファイルがない場合にバックグラウンドスレッドを待つか
+
+        Returns:
+            bool: まだ続きがあるか
+        """
+        if self.status != 'running':
+            return False
+
+        _start = time.perf_counter()
+
+        with self._tick_context():
+            while not self._cancel_event.is_set():
+                try:
+                    _item = self._ready.get(block=wait)
+                except queue.Empty:
+                    break
+
+                if _item is None:
+                    self._finish('finished')
+                    return False
+
+                _filepath, _load_path, _error = _item
+
+                if _error is None:
+                    try:
+                        self.results.append((self.import_func or self.import_file)(_load_path))
+                    except Exception as ex:
+                        _error = ex
+
+                if _error is not None:
+                    print(f'MDK | ImportQueue | {_filepath}: {_error}')
+                    self.errors.append((_filepath, _error))
+
+                self._done += 1
+
+                if self.on_progress:
+                    self.on_progress(self._done, len(self.filepath_list), _filepath)
+
+                if time.perf_counter() - _start >= self.budget:
+                    break
+
+        return self.status == 'running'
+
+
+    def _finish(self, status: str):
+        self.status = status
+        self._stop()
+
+        if self.on_finished:
+            self.on_finished(self)
+
+
+    def _prepare(self):
+        """ バックグラウンドスレッド: ファイルの判定とプリフェッチ
+
+        * キャッシュした場合はキャッシュパスを読み込ませる
+        * 見つからないファイルはエラーとしてメインスレッドに渡す
+        * 最後に None を入れて終了を知らせる
+        """
+        _cache = mdk_cache.get_local_cache() if self.prefetch else None
+
+        for _filepath in self.filepath_list:
+            if self._cancel_event.is_set():
+                break
+
+            if not mdk_scene.expand_sequence(_filepath):
+                self._ready.put((_filepath, None, FileNotFoundError(f'File is not found. {_filepath}')))
+                continue
+
+            self.categories[_filepath] = mdk_scene.get_category(_filepath)
+            _load_path = _filepath
+
+            if _cache is not None:
+                try:
+                    _load_path = _cache.fetch(_filepath)
+                except OSError as ex:
+                    print(f'MDK | Local cache is skipped: {ex}')
+
+            self._ready.put((_filepath, _load_path, None))
+
+        self._ready.put(None)
+
+
+    def _start(self):
+        """ Qtタイマーで tick() を呼ぶ """
+        try:
+            from PySide6 import QtCore
+        except ImportError:
+            try:
+                from PySide2 import QtCore
+            except ImportError:
+                from qtpy import QtCore
+
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(int(DEFAULT_INTERVAL * 1000))
+        self._timer.timeout.connect(self.tick)
+        self._timer.start()
+
+
+    def _start_thread(self):
+        self.status = 'running'
+        self._thread = threading.Thread(target=self._prepare, name=NAME, daemon=True)
+        self._thread.start()
+
+
+    def _stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+
+    def _tick_context(self):
+        """ 1回の tick() をまとめるコンテキスト。DCCモジュールのサブクラスで batch() を返す """
+        return contextlib.nullcontext()
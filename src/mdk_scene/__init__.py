@@ -0,0 +1,672 @@
+""" mdk_scene
+
+* DCCを起動せずにシーンファイルを読むPythonパッケージ
+* Maya ASCII (.ma) / Nuke (.nk) をmmapで走査する
+* 画像ファイルのヘッダーからサイズを読む
+
+Info:
+    * Created : v0.0.1 2026-10-19 Tatsuya Yamagishi
+    * Coding : Python 3.12.4 & PySide6
+    * Author : MedakaVFX <medaka.vfx@gmail.com>
+
+Release Note:
+    * v0.0.1 2026-10-19 Tatsuya Yamagishi
+        * added: read_header()
+        * added: read_fps()
+        * added: read_frame_range()
+        * added: read_render_size()
+        * added: iter_references()
+        * added: iter_usd_references()
+        * added: expand_sequence()
+        * added: find_sequences()
+        * added: read_image_size()
+        * added: find_payload_paths()
+"""
+
+VERSION = 'v0.0.1'
+NAME = 'mdk_scene'
+
+import collections
+import fnmatch
+import functools
+import glob
+import mmap
+import os
+import re
+import struct
+
+try:
+    from pxr import Usd, UsdUtils
+except ImportError:
+    Usd = None
+    UsdUtils = None
+
+
+if os.environ.get('MDK_DEBUG'):
+    print('MDK | ---------------------------')
+    print('MDK | [ import mdk_scene package]')
+    print(f'MDK | {NAME} {VERSION}')
+    print('MDK | ---------------------------')
+
+
+# ======================================= #
+# Settings
+# ======================================= #
+FILE_FILTER_ABC = re.compile(r'.+\.(abc)$', re.IGNORECASE)
+FILE_FILTER_FBX = re.compile(r'.+\.(fbx)$', re.IGNORECASE)
+FILE_FILTER_HIP = re.compile(r'.+\.(hip|hiplc|hipnc)$', re.IGNORECASE)
+FILE_FILTER_IMAGE = re.compile(r'.+\.(png|jpeg|jpg|tif|tiff|exr|tx|hdr|dpx)$', re.IGNORECASE)
+FILE_FILTER_MA = re.compile(r'.+\.(ma)$', re.IGNORECASE)
+FILE_FILTER_MAYA = re.compile(r'.+\.(ma|mb)$', re.IGNORECASE)
+FILE_FILTER_MEDIA = re.compile(r'.+\.(mp4|mov|mkv)$', re.IGNORECASE)
+FILE_FILTER_NK = re.compile(r'.+\.(nk)$', re.IGNORECASE)
+FILE_FILTER_OBJ = re.compile(r'.+\.(obj)$', re.IGNORECASE)
+FILE_FILTER_USD = re.compile(r'.+\.(usd|usdc|usda|usdz)$', re.IGNORECASE)
+FILE_FILTER_VDB = re.compile(r'.+\.(vdb)$', re.IGNORECASE)
+
+# カテゴリ判定順 (FILE_FILTER_* と同じ名前)
+FILE_FILTER_DICT = {
+    'abc': FILE_FILTER_ABC,
+    'fbx': FILE_FILTER_FBX,
+    'obj': FILE_FILTER_OBJ,
+    'usd': FILE_FILTER_USD,
+    'vdb': FILE_FILTER_VDB,
+    'image': FILE_FILTER_IMAGE,
+    'maya': FILE_FILTER_MAYA,
+    'nk': FILE_FILTER_NK,
+    'hip': FILE_FILTER_HIP,
+    'media': FILE_FILTER_MEDIA,
+}
+
+# .ma 内でファイルパスを持つノードタイプとアトリビュート(短縮名, 長い名前)
+MA_FILE_NODE_DICT = {
+    'file': ('ftn', 'fileTextureName'),
+    'AlembicNode': ('fn', 'abc_File', 'fns', 'abc_layerFiles'),
+    'mayaUsdProxyShape': ('fp', 'filePath'),
+}
+
+# mdk_nuke.FILE_NODES_LIST と同じ
+NK_FILE_NODES_LIST = ['Read', 'Write', 'ReadGeo2', ]
+
+# mdk_maya.get_fps() と同じ対応表
+MAYA_FPS_DICT = {
+    'game': 15,
+    'film': 24,
+    'pal': 25,
+    'ntsc': 30,
+    'show': 48,
+    'palf': 50,
+    'ntscf': 60,
+}
+
+# ファイルに書かれていない場合のMayaのデフォルト値
+MAYA_DEFAULT_RENDER_SIZE = (960, 540)
+
+# Root ノードに書かれていない場合のNukeのデフォルト値
+NUKE_DEFAULT_FPS = 24.0
+NUKE_DEFAULT_FRAME_RANGE = (1, 100)
+NUKE_DEFAULT_RENDER_SIZE = (2048, 1556)
+
+# Maya ASCII
+_MA_CURRENT_UNIT = re.compile(rb'^currentUnit\b[^;]*?-t(?:ime)?\s+"?([\w.]+)"?', re.MULTILINE)
+_MA_PLAYBACK = re.compile(rb'playbackOptions\b([^";]*)')
+_MA_PLAYBACK_MIN = re.compile(rb'-min(?:Time)?\s+(-?[\d.]+)')
+_MA_PLAYBACK_MAX = re.compile(rb'-max(?:Time)?\s+(-?[\d.]+)')
+_MA_RESOLUTION = re.compile(rb'^select -ne :defaultResolution;\r?\n((?:\t[^\r\n]*\r?\n)*)', re.MULTILINE)
+_MA_RESOLUTION_WIDTH = re.compile(rb'setAttr[^"\r\n]*"\.w(?:idth)?" (\d+);')
+_MA_RESOLUTION_HEIGHT = re.compile(rb'setAttr[^"\r\n]*"\.h(?:eight)?" (\d+);')
+
+_MA_REFERENCE_PATTERN = re.compile(
+    rb'^file\s+-r(?:di)?\s(?:[^";]|"(?:[^"\\]|\\.)*")*?"((?:[^"\\]|\\.)*)"\s*;'
+    rb'|^createNode\s+(\w+)'
+    rb'|^\tsetAttr\s[^"\n]*"\.(\w+)"\s+-type\s+"string(?:Array)?"((?:\s+\d+)?(?:\s*"(?:[^"\\]|\\.)*")+)',
+    re.MULTILINE)
+_MA_STRING = re.compile(rb'"((?:[^"\\]|\\.)*)"')
+
+# USD
+_USDA_HEADER = b'#usda'
+_USDA_COMPOSITION = re.compile(
+    rb'\b(?:subLayers|references|payload)\s*=\s*(\[[^\]]*\]|@[^@\n]*@)')
+_USDA_ASSET_PATH = re.compile(rb'@([^@\n]+)@')
+
+# シーケンス表記 (####, %04d, $F4, <UDIM>, <UVTILE>, _MAPID_)
+_SEQUENCE_TOKEN = re.compile(r'#+|%0?\d*d|\$F\d?|<UDIM>|<UVTILE>|<udim>|<f>|_MAPID_')
+
+# 連番ファイル名 (name.1001.exr / name_1001.exr)
+# 画像だけをまとめる。abc, mov, usd などはバージョン番号と区別できないので1ファイルとして扱う
+_SEQUENCE_FILENAME = re.compile(
+    r'^(.*[._])(\d+)(\.(?:png|jpeg|jpg|tif|tiff|exr|tx|hdr|dpx|cin|tga|sgi|rgb|bmp))$',
+    re.IGNORECASE)
+
+# JPEGのSOFマーカー (C4, C8, CC以外)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+# Nuke
+_NK_REFERENCE_PATTERN = re.compile(
+    rb'^[ \t]*(\w+) \{[ \t]*$|^[ \t]*file[ \t]+(.+?)[ \t]*$',
+    re.MULTILINE)
+_NK_ROOT = re.compile(rb'^Root \{\r?\n(.*?)^\}', re.MULTILINE | re.DOTALL)
+_NK_KNOB = re.compile(rb'^\s*(fps|first_frame|last_frame|format)\s+(.+?)\s*$', re.MULTILINE)
+
+
+# ======================================= #
+# Functions
+# ======================================= #
+def get_file_key(filepath: str) -> tuple[str, int, int]:
+    """ キャッシュ用のキーを取得
+
+    Args:
+        filepath (str): ファイルパス
+
+    Returns:
+        tuple[str, int, int]: (絶対パス, mtime_ns, size)
+    """
+    _stat = os.stat(filepath)
+    return (os.path.abspath(filepath), _stat.st_mtime_ns, _stat.st_size)
+
+
+def expand_sequence(filepath: str) -> list[str]:
+    """ シーケンス表記のパスを実在するファイルリストに展開
+
+    * ####, %04d, $F4, <UDIM> などを含まない場合は、そのパスだけを返す
+
+    Args:
+        filepath (str): ファイルパス
+
+    Returns:
+        list[str]: 実在するファイルパスのリスト
+    """
+    if not _SEQUENCE_TOKEN.search(filepath):
+        return [filepath] if os.path.isfile(filepath) else []
+
+    _pattern = _SEQUENCE_TOKEN.sub('*', glob.escape(filepath))
+    return sorted(glob.glob(_pattern))
+
+
+def find_sequences(filepath_list: list[str]) -> list[tuple[str, int, int]]:
+    """ ファイルリストを連番ごとにまとめる
+
+    * 連番でないファイル(1ファイルだけのものを含む)は first, last が None
+    * 連番とみなすのは、フレーム番号の直前が . か _ の画像ファイルが2つ以上あるものだけ
+    * 桁数はゼロ埋めされた最初のファイルに合わせて # で表す
+
+    Args:
+        filepath_list (list[str]): ファイルパスリスト
+
+    Returns:
+        list[tuple[str, int, int]]: (name.####.exr 形式のパス, first, last) のリスト
+    """
+    _sequences = collections.defaultdict(list)
+    _result = []
+
+    for _filepath in filepath_list:
+        _filepath = str(_filepath).replace('\\', '/')
+        _match = _SEQUENCE_FILENAME.match(_filepath)
+
+        if _match:
+            _head, _frame, _tail = _match.groups()
+            _sequences[(_head, _tail)].append(_frame)
+        else:
+            _result.append((_filepath, None, None))
+
+    for (_head, _tail), _frames in _sequences.items():
+        if len(_frames) == 1:
+            _result.append((f'{_head}{_frames[0]}{_tail}', None, None))
+            continue
+
+        _numbers = sorted(int(_frame) for _frame in _frames)
+        _padding = min(len(_frame) for _frame in _frames)
+
+        _result.append((f'{_head}{"#" * _padding}{_tail}', _numbers[0], _numbers[-1]))
+
+    return sorted(_result)
+
+
+def get_category(filepath: str) -> str:
+    """ ファイルパスのカテゴリを取得
+
+    Returns:
+        str: FILE_FILTER_DICT のキー。該当しなければ 'other'
+    """
+    for _category, _filter in FILE_FILTER_DICT.items():
+        if _filter.match(str(filepath)):
+            return _category
+
+    return 'other'
+
+
+def is_ma(filepath: str):
+    """ Maya ASCIIファイル判定 """
+    return FILE_FILTER_MA.match(str(filepath))
+
+
+def is_usd(filepath: str):
+    """ USDファイル判定 """
+    return FILE_FILTER_USD.match(str(filepath))
+
+
+def is_nk(filepath: str):
+    """ Nukeファイル判定 """
+    return FILE_FILTER_NK.match(str(filepath))
+
+
+def open_mmap(filepath: str) -> mmap.mmap:
+    """ 読み込み専用でmmapを開く
+
+    * 空ファイルはmmapできないのでNoneを返す
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_references(filepath: str):
+    """ シーンファイルが参照している外部ファイルを順に返す
+
+    * mmap上で正規表現を走査するのでファイルサイズに関わらずメモリ使用量は一定
+    * 同じパスは一度だけ返す
+
+    Args:
+        filepath (str): .ma / .nk / .usd ファイルパス
+
+    Yields:
+        tuple[str, str]: (カテゴリ, ファイルパス)
+    """
+    if is_ma(filepath):
+        _iterator = iter_ma_references(filepath)
+
+    elif is_nk(filepath):
+        _iterator = iter_nk_references(filepath)
+
+    elif is_usd(filepath):
+        _iterator = iter_usd_references(filepath)
+
+    else:
+        raise TypeError(f'MDK | Not supported file type: {filepath}')
+
+    _found = set()
+
+    for _path in _iterator:
+        if _path and _path not in _found:
+            _found.add(_path)
+            yield (get_category(_path), _path)
+
+
+def iter_ma_references(filepath: str):
+    """ Maya ASCIIの外部ファイルパスを返す
+
+    * file -r / file -rdi のリファレンス
+    * file ノードの fileTextureName
+    * AlembicNode のファイルパス
+    * mayaUsdProxyShape のファイルパス
+
+    Yields:
+        str: ファイルパス
+    """
+    _mm = open_mmap(filepath)
+    if _mm is None:
+        return
+
+    with _mm:
+        _attrs = ()
+
+        for _match in _MA_REFERENCE_PATTERN.finditer(_mm):
+            _reference, _node_type, _attr, _values = _match.groups()
+
+            if _reference is not None:
+                yield _unescape_ma(_reference)
+
+            elif _node_type is not None:
+                _attrs = MA_FILE_NODE_DICT.get(_node_type.decode(), ())
+
+            elif _attrs and _attr.decode() in _attrs:
+                for _value in _MA_STRING.findall(_values):
+                    yield _unescape_ma(_value)
+
+
+def iter_usd_references(filepath: str):
+    """ USDレイヤーのsubLayers / references / payload を返す
+
+    * テキスト形式 (#usda) はmmap上で走査する
+    * バイナリ形式はpxrがある場合のみ UsdUtils.ExtractExternalReferences を使う
+
+    Yields:
+        str: アセットパス
+    """
+    _mm = open_mmap(filepath)
+    if _mm is None:
+        return
+
+    with _mm:
+        if _mm[:len(_USDA_HEADER)] == _USDA_HEADER:
+            for _match in _USDA_COMPOSITION.finditer(_mm):
+                for _value in _USDA_ASSET_PATH.findall(_match.group(1)):
+                    yield _value.decode('utf-8', 'replace')
+
+            return
+
+    if UsdUtils is not None:
+        _sublayers, _references, _payloads = UsdUtils.ExtractExternalReferences(filepath)
+        yield from _sublayers
+        yield from _references
+        yield from _payloads
+
+
+def find_payload_paths(stage, pattern: str = '*') -> list[str]:
+    """ payload を持つプリムのパスを取得
+
+    * アンロード中のプリムも対象にする
+    * pattern は fnmatch 形式 (例: '/city/block_01/*')
+
+    Args:
+        stage (Usd.Stage|str): ステージ、またはUSDファイル (payloadを読まずに開く)
+        pattern (str): プリムパスのパターン
+
+    Returns:
+        list[str]: プリムパスのリスト
+    """
+    if Usd is None:
+        raise ImportError('pxr is not found')
+
+    if isinstance(stage, str):
+        stage = Usd.Stage.Open(stage, Usd.Stage.LoadNone)
+
+    return [
+        str(_prim.GetPath())
+        for _prim in stage.Traverse(Usd.PrimAllPrimsPredicate)
+        if _prim.HasAuthoredPayloads() and fnmatch.fnmatchcase(str(_prim.GetPath()), pattern)
+    ]
+
+
+def iter_nk_references(filepath: str):
+    """ Nukeスクリプトの外部ファイルパスを返す
+
+    * NK_FILE_NODES_LIST のノードの file ノブ
+
+    Yields:
+        str: ファイルパス
+    """
+    _mm = open_mmap(filepath)
+    if _mm is None:
+        return
+
+    with _mm:
+        _is_file_node = False
+
+        for _match in _NK_REFERENCE_PATTERN.finditer(_mm):
+            _node_class, _value = _match.groups()
+
+            if _node_class is not None:
+                _is_file_node = _node_class.decode() in NK_FILE_NODES_LIST
+
+            elif _is_file_node:
+                yield _unquote_nk(_value.decode('utf-8', 'replace'))
+
+
+def read_image_size(filepath: str) -> tuple[int, int]:
+    """ 画像ファイルのヘッダーからサイズを取得
+
+    * EXR (displayWindow) / PNG / JPEG / DPX に対応
+
+    Args:
+        filepath (str): 画像ファイルパス
+
+    Returns:
+        tuple[int, int]: (width, height)。読めない場合は None
+    """
+    with open(filepath, 'rb') as f:
+        _header = f.read(4)
+
+        if _header == b'\x76\x2f\x31\x01':
+            return _read_exr_size(f)
+
+        elif _header == b'\x89PNG':
+            f.seek(16)
+            return struct.unpack('>II', f.read(8))
+
+        elif _header[:2] == b'\xff\xd8':
+            return _read_jpeg_size(f)
+
+        elif _header in (b'SDPX', b'XPDS'):
+            _endian = '>' if _header == b'SDPX' else '<'
+            f.seek(772)
+            return struct.unpack(f'{_endian}II', f.read(8))
+
+    return None
+
+
+def read_header(filepath: str) -> dict:
+    """ シーンファイルからFPS、フレームレンジ、レンダーサイズを読み込む
+
+    * 結果は (path, mtime, size) でキャッシュされる
+
+    Args:
+        filepath (str): .ma / .nk ファイルパス
+
+    Returns:
+        dict: {'fps', 'frame_range', 'render_size'}
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f'File is not found. {filepath}')
+
+    return dict(_read_header_cached(*get_file_key(filepath)))
+
+
+def read_fps(filepath: str) -> int|float:
+    """ FPSを取得
+
+    Returns:
+        int|float: .maはmdk_maya.get_fps()、.nkはmdk_nuke.get_fps()と同じ型
+    """
+    return read_header(filepath)['fps']
+
+
+def read_frame_range(filepath: str) -> tuple[int, int]:
+    """ フレームレンジを取得
+
+    Returns:
+        tuple[int, int]: フレームレンジ (start, end)
+    """
+    return read_header(filepath)['frame_range']
+
+
+def read_render_size(filepath: str) -> tuple[int, int]:
+    """ レンダーサイズを取得
+
+    Returns:
+        tuple[int, int]: レンダーサイズ(width, height)
+    """
+    return read_header(filepath)['render_size']
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_header_cached(filepath: str, mtime_ns: int, size: int) -> tuple:
+    """ read_header() のキャッシュ本体
+
+    * lru_cacheに入れるのでdictではなくtupleで返す
+    """
+    if is_ma(filepath):
+        _result = _read_ma_header(filepath)
+
+    elif is_nk(filepath):
+        _result = _read_nk_header(filepath)
+
+    else:
+        raise TypeError(f'MDK | Not supported file type: {filepath}')
+
+    return tuple(_result.items())
+
+
+def _read_ma_header(filepath: str) -> dict:
+    """ Maya ASCIIのヘッダー情報を読み込む
+
+    * currentUnit はファイル先頭付近にあるので前方から検索
+    * playbackOptions (sceneConfigurationScriptNode) と
+      defaultResolution はファイル末尾付近にあるので後方から検索
+    """
+    _result = {
+        'fps': None,
+        'frame_range': None,
+        'render_size': MAYA_DEFAULT_RENDER_SIZE,
+    }
+
+    _mm = open_mmap(filepath)
+    if _mm is None:
+        return _result
+
+    with _mm:
+        # FPS
+        _match = _MA_CURRENT_UNIT.search(_mm)
+        if _match:
+            _result['fps'] = MAYA_FPS_DICT.get(_match.group(1).decode())
+
+        # Frame Range
+        _pos = _mm.rfind(b'playbackOptions')
+        if _pos != -1:
+            _match = _MA_PLAYBACK.match(_mm, _pos)
+            _min = _MA_PLAYBACK_MIN.search(_match.group(1))
+            _max = _MA_PLAYBACK_MAX.search(_match.group(1))
+
+            if _min and _max:
+                _result['frame_range'] = (int(float(_min.group(1))), int(float(_max.group(1))))
+
+        # Render Size
+        _pos = _mm.rfind(b'select -ne :defaultResolution;')
+        if _pos != -1:
+            _match = _MA_RESOLUTION.match(_mm, _pos)
+            if _match:
+                _block = _match.group(1)
+                _width = _MA_RESOLUTION_WIDTH.search(_block)
+                _height = _MA_RESOLUTION_HEIGHT.search(_block)
+
+                _result['render_size'] = (
+                    int(_width.group(1)) if _width else MAYA_DEFAULT_RENDER_SIZE[0],
+                    int(_height.group(1)) if _height else MAYA_DEFAULT_RENDER_SIZE[1],
+                )
+
+    return _result
+
+
+def _read_nk_header(filepath: str) -> dict:
+    """ NukeスクリプトのRootノードを読み込む
+
+    * Rootノードはスクリプト先頭にあるので、最初のRootブロックだけ読む
+    """
+    _result = {
+        'fps': NUKE_DEFAULT_FPS,
+        'frame_range': NUKE_DEFAULT_FRAME_RANGE,
+        'render_size': NUKE_DEFAULT_RENDER_SIZE,
+    }
+
+    _mm = open_mmap(filepath)
+    if _mm is None:
+        return _result
+
+    with _mm:
+        _match = _NK_ROOT.search(_mm)
+        if not _match:
+            return _result
+
+        _knobs = {
+            _knob.group(1).decode(): _knob.group(2).decode()
+            for _knob in _NK_KNOB.finditer(_match.group(1))
+        }
+
+    _first, _last = _result['frame_range']
+
+    if 'fps' in _knobs:
+        _result['fps'] = float(_knobs['fps'])
+
+    if 'first_frame' in _knobs:
+        _first = int(float(_knobs['first_frame']))
+
+    if 'last_frame' in _knobs:
+        _last = int(float(_knobs['last_frame']))
+
+    _result['frame_range'] = (_first, _last)
+
+    if 'format' in _knobs:
+        _result['render_size'] = parse_nk_format(_knobs['format'])
+
+    return _result
+
+
+def _read_exr_size(f) -> tuple[int, int]:
+    """ EXRヘッダーの displayWindow を読む """
+    f.seek(8)
+
+    while True:
+        _name = _read_cstring(f)
+        if not _name:
+            return None
+
+        _type = _read_cstring(f)
+        _size, = struct.unpack('<i', f.read(4))
+
+        if _name == b'displayWindow' and _type == b'box2i':
+            _xmin, _ymin, _xmax, _ymax = struct.unpack('<iiii', f.read(16))
+            return (_xmax - _xmin + 1, _ymax - _ymin + 1)
+
+        f.seek(_size, os.SEEK_CUR)
+
+
+def _read_jpeg_size(f) -> tuple[int, int]:
+    """ JPEGのSOFマーカーからサイズを読む """
+    f.seek(2)
+
+    while True:
+        _marker = f.read(2)
+        if len(_marker) < 2 or _marker[0] != 0xFF:
+            return None
+
+        _length, = struct.unpack('>H', f.read(2))
+
+        if _marker[1] in _JPEG_SOF_MARKERS:
+            _height, _width = struct.unpack('>xHH', f.read(5))
+            return (_width, _height)
+
+        f.seek(_length - 2, os.SEEK_CUR)
+
+
+def _read_cstring(f, limit: int = 256) -> bytes:
+    """ NULL終端の文字列を読む """
+    _result = bytearray()
+
+    while len(_result) < limit:
+        _char = f.read(1)
+        if not _char or _char == b'\x00':
+            break
+
+        _result += _char
+
+    return bytes(_result)
+
+
+def _unescape_ma(value: bytes) -> str:
+    """ .ma の文字列リテラルをデコード """
+    return value.decode('utf-8', 'replace').replace('\\"', '"').replace('\\\\', '\\')
+
+
+def _unquote_nk(value: str) -> str:
+    """ .nk のノブ値から引用符と中括弧を外す """
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+
+    if len(value) >= 2 and value[0] == '{' and value[-1] == '}':
+        return value[1:-1].strip()
+
+    return value
+
+
+def parse_nk_format(value: str) -> tuple[int, int]:
+    """ Nukeのformat文字列からサイズを取得
+
+    * "1920 1080 0 0 1920 1080 1 HD_1080" / "1920 1080 1 HD_1080" 形式
+
+    Returns:
+        tuple[int, int]: (width, height)
+    """
+    _values = value.strip().strip('"{}').split()
+    return (int(_values[0]), int(_values[1]))
@@ -8,6 +8,10 @@ Info:
     * Author : MedakaVFX <medaka.vfx@gmail.com>
  
 Release Note:
+    * v0.1.2 [v0.3.0] 2026-10-19 Tatsuya Yamagishi
+        * added: ImportQueue
+        * added: get_points(), set_points(), get_normals(), get_uvs() (スタンドイン)
+
     * v0.1.1 [v0.2.0] 2025-12-15 Tatsuya Yamagishi
         * added: get_frame_range()
 
@@ -21,7 +25,7 @@ Release Note:
         * new
 """
 
-VERSION = 'v0.1.0'
+VERSION = 'v0.1.2'
 NAME = 'mdk_standalone'
 
 import os
@@ -37,6 +41,13 @@ try:
 except:
     from qtpy import QtCore, QtGui, QtWidgets
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .. import mdk_queue
+
 if os.environ.get('MDK_DEBUG'):
     print('MDK | ---------------------------')
     print('MDK | [ import mdk_standalone package]')
@@ -114,6 +125,26 @@ def get_render_size() -> tuple[int, int]:
     """
     return (1920, 1080)
 
+def get_normals(node: dict, frame: int=None) -> 'np.ndarray':
+    """ 法線を取得 (スタンドイン)。get_points() を参照 """
+    return _get_mesh_array(node, 'N', frame)
+
+def get_points(node: dict, frame: int=None) -> 'np.ndarray':
+    """ ポイント位置を取得 (スタンドイン)
+
+    * DCCなしでベンチマークやテストをするための実装
+    * node は {'P': [ポイント, 3], 'N': [ポイント, 3], 'uv': [UV, 2]} の辞書
+      'P' が [フレーム, ポイント, 3] の場合は 'start_frame' からのフレームで取得する
+
+    Returns:
+        np.ndarray: [ポイント, 3] の float32
+    """
+    return _get_mesh_array(node, 'P', frame)
+
+def get_uvs(node: dict, frame: int=None) -> 'np.ndarray':
+    """ UVを取得 (スタンドイン)。get_points() を参照 """
+    return _get_mesh_array(node, 'uv', frame)
+
 def get_script_exts() -> list[str]:
     """ スクリプト拡張子リストを取得
     
@@ -142,6 +173,10 @@ def set_render_size(width: int, height: int):
     """ レンダーサイズをセット """
     print(f'MDK | render_size = {width}x{height}')
 
+def set_points(node: dict, points: 'np.ndarray'):
+    """ ポイント位置をセット (スタンドイン) """
+    node['P'] = np.array(points, dtype=np.float32).reshape(-1, 3)
+
 def set_renderer(value: str):
     """ レンダラーをセット """
     print(f'MDK | renderer = {value}')
@@ -210,9 +245,29 @@ def save_file(filepath: str, value: str) -> None:
 
 
 
+def _get_mesh_array(node: dict, key: str, frame: int=None) -> 'np.ndarray':
+    _array = np.asarray(node[key], dtype=np.float32)
+
+    if _array.ndim == 3:
+        _index = 0 if frame is None else int(frame) - node.get('start_frame', 0)
+        _array = _array[_index]
+
+    return _array
+
+
 # ======================================= #
 # Class
 # ======================================= #
+class ImportQueue(mdk_queue.ImportQueue):
+    """ Qtタイマーで動くインポートキュー
+
+    * import_func を省略した場合は読み込むパス (ローカルキャッシュ後のパス) を結果にする
+      バックグラウンドでのプリフェッチだけに使える
+    """
+    def import_file(self, filepath: str) -> str:
+        return filepath
+
+
 # class AppMain:
 #     def __init__(self):
 #         self.FILE_FILTER_SCRIPT = FILE_FILTER_SCRIPT